@@ -0,0 +1,112 @@
+import argparse, random, time
+import pygame
+from pygame.math import Vector2 as vec
+
+from domain.engine.headless import HeadlessRunner
+from domain.models.spatial_hash import SpatialHashGroup
+from domain.services import game_controller, menu_controller as mc
+
+parser = argparse.ArgumentParser(description = "Times the enemy hitbox collisions with hundreds of enemies and bullets, with and without the spatial hash.")
+parser.add_argument("--enemies", type = int, default = 400, help = "How many enemies are spawned across the map.")
+parser.add_argument("--bullets", type = int, default = 300, help = "How many bullets are kept flying.")
+parser.add_argument("--frames", type = int, default = 300, help = "How many frames to time.")
+parser.add_argument("--seed", type = int, default = 1, help = "The seed of the random generator.")
+args = parser.parse_args()
+
+BULLET_SPEED = 30
+"""The speed of the fired bullets, the default of the weapons."""
+
+_spatial_spritecollide = game_controller.spritecollide
+_spatial_rebuild = SpatialHashGroup.rebuild
+
+def brute_force_spritecollide(sprite: pygame.sprite.Sprite, group: pygame.sprite.Group, collided = None):
+    return pygame.sprite.spritecollide(sprite, group, False, collided)
+
+class CollisionTimer:
+    """Wraps the collision functions, adding up the time spent in them and the hits they found."""
+    def __init__(self, spritecollide, rebuild):
+        self.time_s = 0
+        self.hits = 0
+        self.calls = 0
+        self.frames = 0
+        self.update_ms = 0
+        self.hitboxes = 0
+        self._spritecollide = spritecollide
+        self._rebuild = rebuild
+
+    def spritecollide(self, sprite, group, collided = None):
+        _start = time.perf_counter()
+        _result = self._spritecollide(sprite, group, collided)
+        self.time_s += time.perf_counter() - _start
+        self.hits += len(_result)
+        self.calls += 1
+        return _result
+
+    def rebuild(self, group: SpatialHashGroup):
+        _start = time.perf_counter()
+        self._rebuild(group)
+        self.time_s += time.perf_counter() - _start
+
+def spawn_enemies(runner: HeadlessRunner, rand: random.Random):
+    _wave = runner.game.current_wave
+    _template = _wave.enemies[0] if len(_wave.enemies) > 0 else {"type": _wave.enemy_types[0]}
+    for _ in range(args.enemies):
+        _pos = vec(rand.uniform(0, game_controller.map_size.x - 100), 0)
+        _enemy = _wave.create_enemy(_template["type"], _pos, _template)
+        # harmless, so the player survives the whole run
+        _enemy.damage = 0
+        _wave.spawn_enemy(_enemy)
+
+def fire_bullets(runner: HeadlessRunner, rand: random.Random):
+    """Tops the bullets up to `args.bullets`, fired from random points of the map. They do no damage, so the enemies stay alive."""
+    # imported once pygame is initialized, since the weapon modules load their assets on import
+    from domain.content.weapons.projectile import projectile_pool
+    _game = runner.game
+    _player = _game.player
+    for _ in range(args.bullets - len(_game.bullets_group)):
+        # at the height of the player's weapon, where the enemies are
+        _pos = vec(rand.uniform(0, game_controller.map_size.x), _player.rect.top + rand.uniform(0, _player.rect.height))
+        _game.bullets_group.add(projectile_pool.acquire(_pos, rand.choice([0, 180]) + rand.uniform(-5, 5), BULLET_SPEED, 0, _player.net_id, game_controller.get_bullet_id()))
+
+def run(spatial: bool, close: bool):
+    """Runs the same scripted fight with one of the collision methods.
+
+    Args:
+        spatial (bool): If the spatial hash is used, or every query tests all the hitboxes.
+        close (bool): If pygame is quit after the run. The fonts created on import don't survive it, so only the last run closes.
+
+    Returns:
+        CollisionTimer: The collision timings of the timed frames.
+    """
+    _timer = CollisionTimer(_spatial_spritecollide if spatial else brute_force_spritecollide, _spatial_rebuild if spatial else lambda group: None)
+    game_controller.spritecollide = _timer.spritecollide
+    # a plain function, so it's bound to each group like the method it replaces
+    SpatialHashGroup.rebuild = lambda group: _timer.rebuild(group)
+
+    _rand = random.Random(args.seed)
+    _runner = HeadlessRunner(seed = args.seed, on_step = lambda r: fire_bullets(r, _rand))
+    _runner.setup()
+    spawn_enemies(_runner, _rand)
+    # lets the wave start and the bullets spread before timing
+    _runner.run(60)
+    _timer.time_s, _timer.hits, _timer.calls = 0, 0, 0
+    _update_s, _frame = _runner.update_time_s, _runner.frame
+    _runner.run(args.frames)
+    _timer.frames = _runner.frame - _frame
+    _timer.update_ms = (_runner.update_time_s - _update_s) * 1000 / max(_timer.frames, 1)
+    _timer.hitboxes = len(_runner.game.current_wave.enemies_hitbox_group)
+    if close:
+        _runner.close()
+    else:
+        mc.pages_history.remove(_runner.game)
+
+    game_controller.spritecollide = _spatial_spritecollide
+    SpatialHashGroup.rebuild = _spatial_rebuild
+    return _timer
+
+_results = [("brute force", run(False, close = False)), ("spatial hash", run(True, close = True))]
+print(f"{args.enemies} enemies ({_results[0][1].hitboxes} hitboxes), {args.bullets} bullets")
+for name, timer in _results:
+    print(f"{name:<13} {timer.time_s * 1000 / max(timer.frames, 1):>7.3f} ms/frame in collisions {timer.update_ms:>8.3f} ms/frame update {timer.frames:>5} frames {timer.calls:>8} queries {timer.hits:>7} hits")
+if _results[0][1].hits != _results[1][1].hits or _results[0][1].frames != _results[1][1].frames:
+    print("the hits differ, the spatial hash is missing or adding collisions")
@@ -0,0 +1,105 @@
+import argparse, ast, random, time
+
+from domain.models.network_data import Data, NetSession, PLAYER_SCHEMA, ENEMY_SCHEMA, BULLET_SCHEMA, WAVE_RESULT_SCHEMA
+
+parser = argparse.ArgumentParser(description = "Compares the size and speed of the binary packets with the old str/literal_eval format.")
+parser.add_argument("--enemies", type = int, default = 40, help = "How many enemies each packet carries.")
+parser.add_argument("--bullets", type = int, default = 20, help = "How many bullets each packet carries.")
+parser.add_argument("--changed", type = float, default = 0.5, help = "The fraction of the enemies that move between two packets.")
+parser.add_argument("--packets", type = int, default = 2000, help = "How many packets to encode and decode.")
+parser.add_argument("--seed", type = int, default = 0, help = "The seed of the random generator.")
+args = parser.parse_args()
+
+_random = random.Random(args.seed)
+
+def random_value(field: tuple):
+    if len(field) > 2:
+        return _random.choice(list(field[2])).name
+    _format = field[1]
+    _count = int(_format[:-1]) if len(_format) > 1 and _format[-1] not in 'sp' else 1
+    match _format[-1]:
+        case 'p' | 's':
+            return f'zombie_{_random.randint(1, 999)}'
+        case '?':
+            _values = [_random.random() < 0.5 for _ in range(_count)]
+        case 'f' | 'd':
+            _values = [_random.uniform(-500, 500) for _ in range(_count)]
+        case 'b':
+            _values = [_random.randint(-1, 1) for _ in range(_count)]
+        case _:
+            _values = [_random.randint(0, 200) for _ in range(_count)]
+    return tuple(_values) if _count > 1 else _values[0]
+
+def random_record(schema: list[tuple], id: int = None):
+    values = {field[0]: random_value(field) for field in schema}
+    if id != None:
+        values["id"] = id
+    return values
+
+def make_packets():
+    _player = random_record(PLAYER_SCHEMA)
+    _enemies = [random_record(ENEMY_SCHEMA, i) for i in range(1, args.enemies + 1)]
+    _bullets = [random_record(BULLET_SCHEMA, i) for i in range(1, args.bullets + 1)]
+    _wave_results = [random_record(WAVE_RESULT_SCHEMA)]
+
+    packets = []
+    for _ in range(args.packets):
+        data = Data(wave_results = _wave_results, **_player)
+        # a part of the enemies moves, and the bullets are replaced, like in a fight
+        _enemies = [dict(e, pos = random_value(("pos", "2f")), rect = random_value(("rect", "4i"))) if _random.random() < args.changed else e for e in _enemies]
+        _bullets = _bullets[1:] + [random_record(BULLET_SCHEMA, _bullets[-1]["id"] + 1)]
+        data.enemies, data.bullets = _enemies, _bullets
+        packets.append(data)
+    return packets
+
+def legacy_encode(data: Data):
+    """The format replaced by the binary codec: the values of every attribute, as a Python literal."""
+    return str([[list(e.values()) for e in data.enemies], [list(b.values()) for b in data.bullets], [list(w.values()) for w in data.wave_results]] +\
+        [getattr(data, field[0]) for field in PLAYER_SCHEMA]).encode('utf-8')
+
+def legacy_decode(buff: bytes):
+    _array = ast.literal_eval(buff.decode('utf-8'))
+    data = Data()
+    for i, field in enumerate(PLAYER_SCHEMA):
+        setattr(data, field[0], _array[3 + i])
+    data.enemies = [dict(zip([f[0] for f in ENEMY_SCHEMA], e)) for e in _array[0]]
+    data.bullets = [dict(zip([f[0] for f in BULLET_SCHEMA], b)) for b in _array[1]]
+    data.wave_results = [dict(zip([f[0] for f in WAVE_RESULT_SCHEMA], w)) for w in _array[2]]
+    return data
+
+def run_legacy(packets: list[Data]):
+    _start = time.perf_counter()
+    _buffers = [legacy_encode(data) for data in packets]
+    _encoded = time.perf_counter()
+    for buff in _buffers:
+        legacy_decode(buff)
+    return _buffers, _encoded - _start, time.perf_counter() - _encoded
+
+def run_binary(packets: list[Data], keyframes: bool = False):
+    _host, _guest = NetSession(), NetSession()
+    if keyframes:
+        _host.enemies.keyframe_interval = _host.bullets.keyframe_interval = 1
+    _buffers = []
+    _encode_s, _decode_s = 0, 0
+    for data in packets:
+        _start = time.perf_counter()
+        _buff = data._get_buffer(_host)
+        _encoded = time.perf_counter()
+        Data()._load_buffer(_buff, _guest)
+        _decode_s += time.perf_counter() - _encoded
+        _encode_s += _encoded - _start
+        _buffers.append(_buff)
+        # the guest acknowledges every packet right away, so the deltas are taken against the previous one
+        _host.enemies.ack(_guest.remote_sequence)
+        _host.bullets.ack(_guest.remote_sequence)
+    return _buffers, _encode_s, _decode_s
+
+def report(name: str, buffers: list[bytes], encode_s: float, decode_s: float):
+    _bytes = sum(len(b) for b in buffers) / len(buffers)
+    print(f"{name:<18} {_bytes:>9.0f} B/packet {encode_s * 1e6 / len(buffers):>9.1f} µs encode {decode_s * 1e6 / len(buffers):>9.1f} µs decode")
+
+_packets = make_packets()
+print(f"{args.packets} packets, {args.enemies} enemies, {args.bullets} bullets, {args.changed:.0%} of the enemies moving")
+report("str/literal_eval", *run_legacy(_packets))
+report("binary keyframes", *run_binary(_packets, keyframes = True))
+report("binary deltas", *run_binary(_packets))
@@ -0,0 +1,65 @@
+import argparse, subprocess, sys, time
+
+parser = argparse.ArgumentParser(description = "Times the loading of the assets without the pixel cache, with an empty cache and with a filled one.")
+parser.add_argument("--mode", choices = ["off", "cold", "warm"], help = "Runs a single mode in this process. Defaults to running all of them, each in a new process.")
+parser.add_argument("--seed", type = int, default = 1, help = "The seed of the random generator.")
+args = parser.parse_args()
+
+MODES = ["off", "cold", "warm"]
+
+def run_mode(mode: str):
+    """Times the loading steps in this process, so nothing is cached in memory by a previous mode.
+
+    Args:
+        mode (str): "off" disables the pixel cache, "cold" empties it before each step and "warm" uses the files left by the previous runs.
+    """
+    from domain.engine.headless import HeadlessRunner, init_display
+    from domain.services import pixel_cache
+    from domain.utils import enums
+
+    pixel_cache.enabled = mode != "off"
+    def prepare():
+        if mode == "cold":
+            pixel_cache.clear()
+
+    # the game modules can only be imported once pygame is initialized
+    init_display()
+    from domain.services.assets_manager import AssetsManager
+    from domain.models.player import Player
+
+    def load_enemies():
+        _assets_manager = AssetsManager(list(enums.Enemies))
+        _assets_manager.load_resources()
+        _assets_manager.convert_step()
+
+    prepare()
+    _start = time.perf_counter()
+    load_enemies()
+    _load_resources_ms = (time.perf_counter() - _start) * 1000
+
+    prepare()
+    _start = time.perf_counter()
+    Player((0,0), enums.Characters.CARLOS)
+    _player_ms = (time.perf_counter() - _start) * 1000
+
+    prepare()
+    _start = time.perf_counter()
+    _runner = HeadlessRunner(seed = args.seed)
+    _runner.setup()
+    _setup_ms = (time.perf_counter() - _start) * 1000
+    _hits, _misses = pixel_cache.hits, pixel_cache.misses
+
+    if mode == "cold":
+        # the last step only cached the first wave, so everything is loaded again for the warm run to find
+        load_enemies()
+        Player((0,0), enums.Characters.CARLOS)
+    _runner.close()
+
+    print(f"{mode:<5} {_load_resources_ms:>9.0f} ms load_resources {_player_ms:>7.0f} ms Player {_setup_ms:>7.0f} ms game setup {_hits:>6} hits {_misses:>6} misses")
+
+if args.mode != None:
+    run_mode(args.mode)
+else:
+    # the warm run reads the files written by the cold one
+    for mode in MODES:
+        subprocess.run([sys.executable, sys.argv[0], "--mode", mode, "--seed", str(args.seed)], check = True)
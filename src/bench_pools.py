@@ -0,0 +1,78 @@
+import argparse, gc, subprocess, sys, time
+from pygame.math import Vector2 as vec
+
+from domain.engine.headless import HeadlessRunner
+from domain.utils import constants, enums
+
+parser = argparse.ArgumentParser(description = "Times the updates and the garbage collector pauses under sustained fire, with and without the object pools.")
+parser.add_argument("--weapon", choices = ["UZI", "M16"], default = "UZI", help = "The automatic weapon held by the player.")
+parser.add_argument("--frames", type = int, default = 3000, help = "How many frames to time.")
+parser.add_argument("--seed", type = int, default = 1, help = "The seed of the random generator.")
+parser.add_argument("--mode", choices = ["pooled", "unpooled"], help = "Runs a single mode in this process. Defaults to running both, each in a new process.")
+args = parser.parse_args()
+
+MODES = ["unpooled", "pooled"]
+
+class PauseTimer:
+    """Measures the garbage collector runs through `gc.callbacks`."""
+    def __init__(self):
+        self.pauses_ms: list[float] = []
+        """The duration of each collection."""
+        self._start = 0
+
+    def callback(self, phase: str, info: dict):
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.pauses_ms.append((time.perf_counter() - self._start) * 1000)
+
+def keep_firing(runner: HeadlessRunner):
+    """Keeps the player alive with the trigger held and the magazine full, so the fire never stops."""
+    _player = runner.game.player
+    _player.health = _player.health_bar.max_value
+    if "mouse_0" not in runner.game.pressed_keys:
+        runner.game.pressed_keys.append("mouse_0")
+    if _player.current_weapon.magazine_bullets <= 0:
+        _player.current_weapon.magazine_bullets = _player.current_weapon.magazine_size
+
+def run_mode(mode: str):
+    """Fires in this process, so the pool counters only include this mode.
+
+    Args:
+        mode (str): "unpooled" keeps no free objects, so every bullet and popup is built again and left to the garbage collector.
+    """
+    _runner = HeadlessRunner(seed = args.seed, on_step = keep_firing)
+    _runner.setup()
+    # imported once pygame is initialized, since the weapon modules load their assets on import
+    from domain.content.weapons.projectile import projectile_pool
+    from domain.models.ui.popup_text import popup_pool
+    if mode == "unpooled":
+        projectile_pool.max_size = 0
+        popup_pool.max_size = 0
+
+    _runner.game.player.current_weapon = constants.get_weapon(enums.Weapons[args.weapon], vec(0,0))
+    # lets the first bullets fill the pools before timing
+    _runner.run(120)
+    for pool in [projectile_pool, popup_pool]:
+        # only the counters, the free objects are kept
+        pool.created_count, pool.reused_count, pool.high_water_mark = 0, 0, pool.active_count
+
+    _timer = PauseTimer()
+    _update_s, _frame = _runner.update_time_s, _runner.frame
+    gc.callbacks.append(_timer.callback)
+    _runner.run(args.frames)
+    gc.callbacks.remove(_timer.callback)
+    _frames = max(_runner.frame - _frame, 1)
+    _update_ms = (_runner.update_time_s - _update_s) * 1000 / _frames
+    _runner.close()
+
+    _pauses = _timer.pauses_ms
+    print(f"{mode:<8} {args.weapon:<3} {_update_ms:>7.3f} ms/frame update {len(_pauses):>4} gc runs {sum(_pauses):>8.1f} ms total {max(_pauses, default = 0):>6.2f} ms max")
+    print(f"    projectiles {projectile_pool.stats()}")
+    print(f"    popups      {popup_pool.stats()}")
+
+if args.mode != None:
+    run_mode(args.mode)
+else:
+    for mode in MODES:
+        subprocess.run([sys.executable, sys.argv[0], "--mode", mode, "--weapon", args.weapon, "--frames", str(args.frames), "--seed", str(args.seed)], check = True)
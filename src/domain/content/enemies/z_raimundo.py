@@ -1,9 +1,9 @@
-import pygame, datetime, random
+import pygame, random
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, constants, enums, math_utillity as math
-from domain.services import game_controller, menu_controller as mc, resources, assets_manager
-from domain.models.ui.popup_text import Popup
+from domain.services import game_controller, menu_controller as mc, resources, assets_manager, game_clock
+from domain.models.ui.popup_text import popup_pool
 from domain.models.enemy import Enemy
 from domain.models.rectangle_sprite import Rectangle
 
@@ -46,7 +46,7 @@ class ZRaimundo(Enemy):
         self.start_helmet_health = self.helmet_health
         self.helmet_stage = 0
         self.helmet_break_pos: vec = None
-        self.helmet_break_time: datetime.datetime = None
+        self.helmet_break_time: float = None
         self.helmet_timeout_ms = kwargs.pop("helmet_timeout_ms", 2000)
         self.helmet_alpha = 255
         
@@ -126,13 +126,13 @@ class ZRaimundo(Enemy):
 
     def draw(self, surface: pygame.Surface, offset: vec): 
         super().draw(surface, offset)
-        _now = datetime.datetime.now()
+        _now = game_clock.now_ms()
         
         
         
         #helmet
-        if self.helmet_break_pos != None and self.helmet_break_time != None and _now < self.helmet_break_time + datetime.timedelta(milliseconds=self.helmet_timeout_ms):
-            _helmet = game_controller.scale_image(self.get_helmet_frames()[int(self.helmet_frame)], self.image_scale)
+        if self.helmet_break_pos != None and self.helmet_break_time != None and _now < self.helmet_break_time + self.helmet_timeout_ms:
+            _helmet = self.get_frame(self.get_helmet_frames(), self.helmet_frame)
             _result = pygame.Surface(_helmet.get_size(), pygame.SRCALPHA)
             _result.blit(_helmet, (0,0))
             _result.set_alpha(self.helmet_alpha)
@@ -140,7 +140,7 @@ class ZRaimundo(Enemy):
 
 
     def fade_out_helmet(self):
-        anim_end = (self.helmet_break_time + datetime.timedelta(milliseconds=self.helmet_timeout_ms))
+        anim_end = (self.helmet_break_time + self.helmet_timeout_ms)
         
         self.helmet_alpha = mc.fade_out_color(colors.WHITE, 255, self.helmet_break_time, anim_end)[3]
 
@@ -187,7 +187,7 @@ class ZRaimundo(Enemy):
         _rect = pygame.Rect((0,0), self.attack_box)
         _rect.centerx = self.rect.centerx + (10*self.dir.x)
         _rect.centery = self.rect.centery - 20
-        self.hit_rectangle = Rectangle(_rect.size, _rect.topleft)
+        self.set_hit_rectangle(_rect.size, _rect.topleft)
        
         collided = self.attack_collision(self.hit_rectangle)
         if len(collided) > 0:
@@ -204,9 +204,7 @@ class ZRaimundo(Enemy):
         self.run_frame += speed
         if self.run_frame > len(self.get_run_frames())-1:
             self.run_frame = 0
-        self.image = game_controller.scale_image(self.get_run_frames()[int(self.run_frame)], self.image_scale)
-        if self.speed.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.get_run_frames(), self.run_frame, self.speed.x > 0)
     
     def attcking_anim(self, speed: float):
         self.attack_frame += speed
@@ -216,19 +214,15 @@ class ZRaimundo(Enemy):
             self.attack_frame = 0
             self.attacking = False
             self.hiting = False
-        self.image = game_controller.scale_image(self.get_atk_frames()[int(self.attack_frame)], self.image_scale)
-        if self.acceleration.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.get_atk_frames(), self.attack_frame, self.acceleration.x > 0)
     
     def dying_anim(self, speed: float):
         self.death_frame += speed
         if self.death_frame > len(self.get_death_frames())-1:
-            self.death_time = datetime.datetime.now()
+            self.death_time = game_clock.now_ms()
             self.death_frame = 0
         else:
-            self.image = game_controller.scale_image(self.get_death_frames()[int(self.death_frame)], self.image_scale)
-        if self.dir.x > 0 and self.death_time == None:
-            self.image = pygame.transform.flip(self.image, True, False)
+            self.image = self.get_frame(self.get_death_frames(), self.death_frame, self.dir.x > 0)
             
     def helmet_anim(self, speed: float):
        
@@ -251,11 +245,11 @@ class ZRaimundo(Enemy):
                 _popup_args = constants.POPUPS["damage"].copy()
                 rand_sound = random.randint(0, len(self.get_sounds("helmet_bullet_sounds"))-1)
                 self.get_sounds("helmet_bullet_sounds")[rand_sound].play()
-                mc.popup(Popup(f'-0', self.pos + vec(self.rect.width / 2 - 20,-30) - self.player_offset, **_popup_args))
+                mc.popup(popup_pool.acquire(f'-0', self.pos + vec(self.rect.width / 2 - 20,-30) - self.player_offset, **_popup_args))
                 if self.helmet_health == 0:
                     self.breaking_helmet = True
                     self.helmet_break_pos = vec(self.rect.topleft)
-                    self.helmet_break_time = datetime.datetime.now()
+                    self.helmet_break_time = game_clock.now_ms()
                 return False
         else:
             value *= self.body_damage_multiplier
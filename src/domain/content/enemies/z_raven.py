@@ -1,8 +1,8 @@
-import pygame, datetime, random
+import pygame, random
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, constants, enums, math_utillity as math
-from domain.services import game_controller, menu_controller as mc, resources, assets_manager
+from domain.services import game_controller, menu_controller as mc, resources, assets_manager, game_clock
 from domain.models.enemy import Enemy
 from domain.models.rectangle_sprite import Rectangle
 
@@ -39,7 +39,7 @@ class ZRaven(Enemy):
         
         self.attack_timer_ms = kwargs.pop("attack_timer_ms", 3000)
         self.attack_chance = kwargs.pop("attack_chance", 0.3)
-        self.last_attack_attempt = datetime.datetime.now()
+        self.last_attack_attempt = game_clock.now_ms()
         
         self.kill_score = kwargs.pop("kill_score", 20)
         self.headshot_score_multiplier = kwargs.pop("headshot_score_multiplier", 1.8)
@@ -99,7 +99,7 @@ class ZRaven(Enemy):
         player_center: vec = vec(player.rect.center)
         
         def flip():
-            self.image = pygame.transform.flip(self.image, True, False)
+            self.image = self.assets_manager.get_mirror(self.image)
             self.last_frame_dir = self.dir.copy()
             self.speed.x = 0
             
@@ -203,8 +203,8 @@ class ZRaven(Enemy):
         pygame.draw.line(screen, colors.GREEN, vec(self.rect.centerx, self.rect.bottom + 20) - offset,vec(self.rect.centerx, self.rect.top - 20) - offset)
 
     def try_attack(self):
-        _now = datetime.datetime.now()
-        if _now > self.last_attack_attempt + datetime.timedelta(milliseconds=self.attack_timer_ms):
+        _now = game_clock.now_ms()
+        if _now > self.last_attack_attempt + self.attack_timer_ms:
             _attack = random.random() < self.attack_chance
             self.last_attack_attempt = _now
             return _attack
@@ -251,7 +251,7 @@ class ZRaven(Enemy):
                 
         
         def flip():
-            self.image = pygame.transform.flip(self.image, True, False)
+            self.image = self.assets_manager.get_mirror(self.image)
             self.last_frame_dir = self.dir.copy()
             self.speed.x = 0
         
@@ -274,7 +274,7 @@ class ZRaven(Enemy):
         _hit_rect.bottom = self.rect.bottom
         _hit_rect.centerx = self.rect.centerx + self.attack_box.x * self.dir.x
         
-        self.hit_rectangle = Rectangle(self.attack_box, _hit_rect.topleft)
+        self.set_hit_rectangle(self.attack_box, _hit_rect.topleft)
         
         collided = self.attack_collision(self.hit_rectangle)
         if len(collided) > 0:
@@ -290,9 +290,7 @@ class ZRaven(Enemy):
         self.run_frame += speed
         if self.run_frame > len(self.get_frames(enums.AnimActions.RUN))-1:
             self.run_frame = 0
-        self.image = game_controller.scale_image(self.get_frames(enums.AnimActions.RUN)[int(self.run_frame)], self.image_scale)
-        if self.speed.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.get_frames(enums.AnimActions.RUN), self.run_frame, self.speed.x > 0)
     
     def attcking_anim(self, speed: float):
         self.attack_frame += speed
@@ -303,19 +301,15 @@ class ZRaven(Enemy):
             self.attacking = False
             self.hiting = False
             self.rising = True
-        self.image = game_controller.scale_image(self.get_frames(enums.AnimActions.ATTACK)[int(self.attack_frame)], self.image_scale)
-        if self.acceleration.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.get_frames(enums.AnimActions.ATTACK), self.attack_frame, self.acceleration.x > 0)
     
     def dying_anim(self, speed: float):
         self.death_frame += speed
         if self.death_frame > len(self.get_frames(enums.AnimActions.DEATH))-1:
-            self.death_time = datetime.datetime.now()
+            self.death_time = game_clock.now_ms()
             self.death_frame = 0
         else:
-            self.image = game_controller.scale_image(self.get_frames(enums.AnimActions.DEATH)[int(self.death_frame)], self.image_scale)
-        if self.dir.x > 0 and self.death_time == None:
-            self.image = pygame.transform.flip(self.image, True, False)
+            self.image = self.get_frame(self.get_frames(enums.AnimActions.DEATH), self.death_frame, self.dir.x > 0)
     
     def damage_sound(self):
         sound = self.get_sounds(enums.AnimActions.TAKE_DAMAGE)[random.randint(0, len(self.get_sounds(enums.AnimActions.TAKE_DAMAGE))-1)]
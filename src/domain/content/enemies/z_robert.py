@@ -1,8 +1,8 @@
-import pygame, datetime, random
+import pygame, random
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, constants, enums, math_utillity as math
-from domain.services import game_controller, menu_controller as mc, resources, assets_manager
+from domain.services import game_controller, menu_controller as mc, resources, assets_manager, game_clock
 from domain.models.enemy import Enemy
 from domain.models.rectangle_sprite import Rectangle
 
@@ -97,7 +97,7 @@ class ZRobert(Enemy):
             case _:
                 _hit_rect.centerx = self.rect.centerx
         
-        self.hit_rectangle = Rectangle(self.attack_box, _hit_rect.topleft)
+        self.set_hit_rectangle(self.attack_box, _hit_rect.topleft)
        
         collided = self.attack_collision(self.hit_rectangle)
         if len(collided) > 0:
@@ -109,9 +109,7 @@ class ZRobert(Enemy):
         self.run_frame += speed
         if self.run_frame > len(self.get_frames(enums.AnimActions.RUN)):
             self.run_frame = 0
-        self.image = game_controller.scale_image(self.get_frames(enums.AnimActions.RUN)[int(self.run_frame)], self.image_scale)
-        if self.speed.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.get_frames(enums.AnimActions.RUN), self.run_frame, self.speed.x > 0)
     
     def attcking_anim(self, speed: float):
         self.attack_frame += speed
@@ -127,19 +125,15 @@ class ZRobert(Enemy):
             self.attacking = False
             self.hiting = False
             self.playing_attack_sound = False
-        self.image = game_controller.scale_image(self.get_frames(enums.AnimActions.ATTACK)[int(self.attack_frame)], self.image_scale)
-        if self.acceleration.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.get_frames(enums.AnimActions.ATTACK), self.attack_frame, self.acceleration.x > 0)
     
     def dying_anim(self, speed: float):
         self.death_frame += speed
         if self.death_frame > len(self.get_frames(enums.AnimActions.DEATH)):
-            self.death_time = datetime.datetime.now()
+            self.death_time = game_clock.now_ms()
             self.death_frame = 0
         else:
-            self.image = game_controller.scale_image(self.get_frames(enums.AnimActions.DEATH)[int(self.death_frame)], self.image_scale)
-        if self.dir.x > 0 and self.death_time == None:
-            self.image = pygame.transform.flip(self.image, True, False)
+            self.image = self.get_frame(self.get_frames(enums.AnimActions.DEATH), self.death_frame, self.dir.x > 0)
     
     def damage_sound(self):
         sound = self.get_sounds(enums.AnimActions.TAKE_DAMAGE)[random.randint(0, len(self.get_sounds(enums.AnimActions.TAKE_DAMAGE))-1)]
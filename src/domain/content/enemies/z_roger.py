@@ -1,8 +1,8 @@
-import pygame, datetime, random
+import pygame, random
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, constants, enums
-from domain.services import game_controller, menu_controller as mc, resources, assets_manager
+from domain.services import game_controller, menu_controller as mc, resources, assets_manager, game_clock
 from domain.models.enemy import Enemy
 from domain.models.rectangle_sprite import Rectangle
 
@@ -60,7 +60,7 @@ class ZRoger(Enemy):
         _rect = pygame.Rect((0,0), self.attack_box)
         _rect.centerx = self.rect.centerx + 12 + (5*self.dir.x)
         _rect.top = self.rect.centery - 20
-        self.hit_rectangle = Rectangle(_rect.size, _rect.topleft)
+        self.set_hit_rectangle(_rect.size, _rect.topleft)
 
         collided = self.attack_collision(self.hit_rectangle)
         if len(collided) > 0:
@@ -76,9 +76,7 @@ class ZRoger(Enemy):
         self.run_frame += speed
         if self.run_frame > len(self.get_frames(enums.AnimActions.RUN))-1:
             self.run_frame = 0
-        self.image = game_controller.scale_image(self.get_frames(enums.AnimActions.RUN)[int(self.run_frame)], self.image_scale)
-        if self.speed.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.get_frames(enums.AnimActions.RUN), self.run_frame, self.speed.x > 0)
     
     def attcking_anim(self, speed: float):
         self.attack_frame += speed
@@ -88,19 +86,15 @@ class ZRoger(Enemy):
             self.attack_frame = 0
             self.attacking = False
             self.hiting = False
-        self.image = game_controller.scale_image(self.get_frames(enums.AnimActions.ATTACK)[int(self.attack_frame)], self.image_scale)
-        if self.acceleration.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.get_frames(enums.AnimActions.ATTACK), self.attack_frame, self.acceleration.x > 0)
     
     def dying_anim(self, speed: float):
         self.death_frame += speed
         if self.death_frame > len(self.get_frames(enums.AnimActions.DEATH))-1:
-            self.death_time = datetime.datetime.now()
+            self.death_time = game_clock.now_ms()
             self.death_frame = 0
         else:
-            self.image = game_controller.scale_image(self.get_frames(enums.AnimActions.DEATH)[int(self.death_frame)], self.image_scale)
-        if self.dir.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+            self.image = self.get_frame(self.get_frames(enums.AnimActions.DEATH), self.death_frame, self.dir.x > 0)
     
         
     def damage_sound(self):
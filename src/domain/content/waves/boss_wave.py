@@ -1,7 +1,7 @@
-import pygame, random, datetime
+import pygame, random
 from pygame.math import Vector2 as vec
 
-from domain.services import menu_controller, resources
+from domain.services import menu_controller, resources, game_clock
 from domain.models.wave import Wave
 from domain.utils import enums
 from domain.models.enemy import Enemy
@@ -23,7 +23,7 @@ class BossWave(Wave):
     def update(self, **kwargs):
         super().update(**kwargs)
 
-        if not self.started or self.finished or datetime.datetime.now() < self.start_time + datetime.timedelta(milliseconds=self.start_delay_ms) or not self.loaded:
+        if not self.started or self.finished or game_clock.now_ms() < self.start_time + self.start_delay_ms or not self.loaded:
             return
         
         if self.boss == None:
@@ -32,9 +32,9 @@ class BossWave(Wave):
             if not self.boss.is_alive and self.enemies_count == 0:
                 self.delay_end_wave(1500)
             
-            elif (self.last_spawn_time == None or datetime.datetime.now() >= self.last_spawn_time + datetime.timedelta(milliseconds=self.spawn_timer_ms)) and self.boss.is_alive:
+            elif (self.last_spawn_time == None or game_clock.now_ms() >= self.last_spawn_time + self.spawn_timer_ms) and self.boss.is_alive:
                 self.spawn()
-                self.last_spawn_time = datetime.datetime.now()
+                self.last_spawn_time = game_clock.now_ms()
 
     def start(self):
         super().start()
@@ -1,10 +1,10 @@
-import pygame, math, datetime, random
+import pygame, math, random
 from pygame.math import Vector2 as vec
 
 from domain.models.weapon import Weapon
 from domain.utils import enums
-from domain.content.weapons.projectile import Projectile
-from domain.services import game_controller, menu_controller as mc, resources
+from domain.content.weapons.projectile import projectile_pool
+from domain.services import game_controller, menu_controller as mc, resources, bullet_assets, game_clock, asset_archive
 
 class BurstFire(Weapon):
     def __init__(self, pos, **kwargs):
@@ -13,7 +13,7 @@ class BurstFire(Weapon):
         self.burst_fire_rate = kwargs.pop("burst_fire_rate", 10)
         self.burst_count = kwargs.pop("burst_count", 3)
         self.current_burst_round = 0
-        self.last_burst_time = datetime.datetime.now()
+        self.last_burst_time = game_clock.now_ms()
         self.firing_burst = False
         
         load_content = kwargs.pop("load_content", True)
@@ -21,18 +21,20 @@ class BurstFire(Weapon):
         if not load_content:
             return
         
+        bullet_assets.preload_bullet(self.bullet_type)
         self.fire_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.SHOOT), self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
         self.reload_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.RELOAD), self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
+        self.add_mirrors(self.fire_frames, self.reload_frames)
         """The animation frames of this weapon when reloading."""
         
         self.reload_start_frame = kwargs.pop("reload_start_frame", 0)
         self.playing_reload_start = False
         self.playing_reload_end = False
         
-        self.shoot_sounds =[pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT) + f'0{i}.mp3') for i in range(1,3)]
-        self.empty_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.EMPTY_TRIGGER))
-        self.reload_start_sound_burst = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD))
-        self.reload_end_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD_END))
+        self.shoot_sounds =[asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT) + f'0{i}.mp3') for i in range(1,3)]
+        self.empty_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.EMPTY_TRIGGER))
+        self.reload_start_sound_burst = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD))
+        self.reload_end_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD_END))
         self.last_channel = 0
         
     def fire_sound(self):
@@ -61,9 +63,9 @@ class BurstFire(Weapon):
         self.current_burst_round = 0
         
     def shoot_one(self, bullet_pos: vec, player_net_id: int, **kwargs):
-        _now = datetime.datetime.now()
+        _now = game_clock.now_ms()
         
-        if self.last_shot_time != None and _now - datetime.timedelta(milliseconds= self.fire_rate_ratio/self.burst_fire_rate) < self.last_shot_time:
+        if self.last_shot_time != None and _now - (self.fire_rate_ratio/self.burst_fire_rate) < self.last_shot_time:
             return None
         
         if self.magazine_bullets <= 0:
@@ -76,7 +78,7 @@ class BurstFire(Weapon):
         
         self.last_shot_time = _now
         self.fire_sound()
-        return Projectile(bullet_pos, self.weapon_aim_angle, self.bullet_speed, self.damage, player_net_id, game_controller.get_bullet_id(), max_range = self.bullet_max_range, min_range = self.bullet_min_range, bullet_type = self.bullet_type, kill_callback = self.bullet_kill_callback)
+        return projectile_pool.acquire(bullet_pos, self.weapon_aim_angle, self.bullet_speed, self.damage, player_net_id, game_controller.get_bullet_id(), max_range = self.bullet_max_range, min_range = self.bullet_min_range, bullet_type = self.bullet_type, kill_callback = self.bullet_kill_callback)
     
     def shoot(self, bullet_pos: vec, player_net_id: int, **kwargs):
         if not self.can_shoot():
@@ -86,7 +88,7 @@ class BurstFire(Weapon):
         
         if self.current_burst_round >= self.burst_count:
             self.current_burst_round = 0
-            self.last_burst_time = datetime.datetime.now()
+            self.last_burst_time = game_clock.now_ms()
             self.firing_burst = False
             
         return projectile
@@ -103,20 +105,20 @@ class BurstFire(Weapon):
                 self.empty_sound.play()
             return False
         
-        _now = datetime.datetime.now()
+        _now = game_clock.now_ms()
         
         #if the player is switching weapons
         if self.changing_weapon:
             return False
         
         # if is still reloading
-        if self.reload_start_time != None and _now - datetime.timedelta(milliseconds= self.reload_delay_ms) <= self.reload_start_time:
+        if self.reload_start_time != None and _now - self.reload_delay_ms <= self.reload_start_time:
             return False
         
         if self.last_shot_time == None:
             return True
         
-        if _now - datetime.timedelta(milliseconds= self.fire_rate_ratio/self.fire_rate) > self.last_burst_time:
+        if _now - (self.fire_rate_ratio/self.fire_rate) > self.last_burst_time:
             return True
         
         return False
@@ -131,7 +133,7 @@ class BurstFire(Weapon):
         self.current_frame = self.fire_frames[int(self.firing_frame)]
         
         if self.dir < 0:
-            self.current_frame = pygame.transform.flip(self.current_frame, False, True)
+            self.current_frame = self.get_mirror(self.current_frame)
     
     def reload_anim(self, speed):
         self.reloading_frame += speed
@@ -157,4 +159,4 @@ class BurstFire(Weapon):
             self.current_frame = self.idle_frame
         
         if self.dir < 0:
-            self.current_frame = pygame.transform.flip(self.current_frame, False, True)
+            self.current_frame = self.get_mirror(self.current_frame)
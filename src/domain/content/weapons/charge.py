@@ -1,16 +1,26 @@
-import pygame, math, random, datetime
+import pygame, math, random
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, enums, constants, math_utillity as maths
-from domain.services import game_controller, menu_controller as mc, resources
+from domain.services import game_controller, menu_controller as mc, bullet_assets, game_clock
 from domain.models.enemy import Enemy
 from domain.models.igravitable import IGravitable
 from domain.models.rectangle_sprite import Rectangle
+from domain.models.hitbox import Hitbox
+from domain.utils.recyclables import ObjectPool
 
 class Charge(pygame.sprite.Sprite):
     def __init__(self, pos: vec, angle: float, bullet_speed: float, damage: float, owner:int, id: int, **kwargs):
         super().__init__()
         
+        self.pool: ObjectPool = None
+        """The pool this charge was acquired from, released to when killed."""
+        self.in_pool = False
+        """If this charge was released and is waiting to be reused."""
+        self.reset(pos, angle, bullet_speed, damage, owner, id, **kwargs)
+        
+    def reset(self, pos: vec, angle: float, bullet_speed: float, damage: float, owner:int, id: int, **kwargs):
+        """Sets the charge up to be thrown, both when created and when reused from `charge_pool`."""
         self.id = id
         self.owner = owner
         self.name = kwargs.pop("name", "grenade_01")
@@ -23,9 +33,9 @@ class Charge(pygame.sprite.Sprite):
         self.bounciness_multiplier = kwargs.pop("bounciness_multiplier", 0.5)
         self.friction_multiplier = kwargs.pop("friction_multiplier", 0.2)
         self.rotation_speed = kwargs.pop("rotation_speed", 5)
-        self.image = game_controller.load_sprites(resources.get_weapon_path(self.charge_type, enums.AnimActions.SHOOT), self.image_scale, enums.ConvertType.CONVERT_ALPHA)[0]
-        self.anim_frames = kwargs.pop("anim_frames", [self.image])
-        self.current_frame: pygame.Surface = self.image.copy()
+        self.anim_frames = kwargs.pop("anim_frames", None) or bullet_assets.get_charge_frames(self.charge_type, self.image_scale)
+        self.image = self.anim_frames[0]
+        self.current_frame: pygame.Surface = self.image
         self.rect = self.image.get_rect()
         self.last_rect = self.rect.copy()
         self.pos:vec = pos
@@ -40,7 +50,7 @@ class Charge(pygame.sprite.Sprite):
         self.owner_offset = vec(0,0)
         self.is_alive = True
         self.start_pos = pos
-        self.start_time = kwargs.pop("start_time", datetime.datetime.now())
+        self.start_time = kwargs.pop("start_time", game_clock.now_ms())
         self.destroy_time = kwargs.pop("destroy_time", None)
         self.hit_targets: list[int] = []
         self.rotation_angle = 0
@@ -60,7 +70,7 @@ class Charge(pygame.sprite.Sprite):
         self.explosion_max_radius = kwargs.pop("explosion_max_radius", 0)
         self.explosion_min_radius = kwargs.pop("explosion_min_radius", 0)
         
-        self.last_hit_sound = datetime.datetime.now() - datetime.timedelta(milliseconds=2000)
+        self.last_hit_sound = game_clock.now_ms() - 2000
         self.hit_interval_ms = 100
         
         self.idle_frame = 0
@@ -70,10 +80,8 @@ class Charge(pygame.sprite.Sprite):
         self.explosion_frame = 0
         self.exploding = False
         if self.explosion_max_radius > 0:
-            self.explosion_frames = game_controller.load_sprites(f'{resources.IMAGES_PATH}weapons\\effects\\explosion_01', convert_type=enums.ConvertType.CONVERT_ALPHA)
-            self.explosion_sounds = [pygame.mixer.Sound(resources.get_weapon_sfx(enums.Weapons.RPG,enums.AnimActions.HIT) + f'0{i}.mp3') for i in range(1,4)]
-            for s in self.explosion_sounds:
-                s.set_volume(0.1)
+            self.explosion_frames = bullet_assets.get_explosion_frames()
+            self.explosion_sounds = bullet_assets.get_explosion_sounds(0.1)
                 
                 
         self.floor_fire_frames_start, self.floor_fire_frames_end, self.floor_fire_frames_loop, self.floor_fire_surface = None, None, None, None
@@ -82,13 +90,18 @@ class Charge(pygame.sprite.Sprite):
         self.burning_start = False
         self.burning_end = False
         self.burn_tick_ms = kwargs.pop("burn_tick_ms", 500)
-        self.last_burn_tick = datetime.datetime.now()
-        self.burn_hitbox: Rectangle = None
+        self.last_burn_tick = game_clock.now_ms()
+        self.burn_hitbox: Hitbox = None
         if self.charge_type == enums.Throwables.MOLOTOV:
-            self.floor_fire_frames_start = game_controller.load_sprites(f'{resources.IMAGES_PATH}weapons\\effects\\floor_flames\\start',2, enums.ConvertType.CONVERT_ALPHA)
-            self.floor_fire_frames_end = game_controller.load_sprites(f'{resources.IMAGES_PATH}weapons\\effects\\floor_flames\\end',2, enums.ConvertType.CONVERT_ALPHA)
-            self.floor_fire_frames_loop = game_controller.load_sprites(f'{resources.IMAGES_PATH}weapons\\effects\\floor_flames\\loop',2, enums.ConvertType.CONVERT_ALPHA)
-            self.floor_fire_surface = self.floor_fire_frames_start[0].copy()
+            self.floor_fire_frames_start, self.floor_fire_frames_end, self.floor_fire_frames_loop = bullet_assets.get_floor_flames_frames()
+            self.floor_fire_surface = self.floor_fire_frames_start[0]
+        
+        self.fuse_timer = None
+        """The scheduled fuse timeout, cancelled if the charge is destroyed before it."""
+        self.burn_timer = None
+        """The next scheduled fire damage tick, cancelled if the charge is killed before it."""
+        if self.fuse_timeout_ms > 0:
+            self.fuse_timer = game_controller.scheduler.schedule_at(self.start_time + self.fuse_timeout_ms, self.fuse_timeout)
                 
         
             
@@ -101,8 +114,6 @@ class Charge(pygame.sprite.Sprite):
         if not self.is_alive:
             return
         
-        _now = datetime.datetime.now()
-        
         self.acceleration.x = 0
         
         if not self.exploding:
@@ -127,17 +138,7 @@ class Charge(pygame.sprite.Sprite):
         if self.burning_end:
             self.burn_end_anim(_burn_speed * mc.dt)
             
-        if self.burning_start or self.burning_loop:
-            if _now > self.last_burn_tick + datetime.timedelta(milliseconds=self.burn_tick_ms):
-                if self.destroy_time == None or _now < self.destroy_time + datetime.timedelta(milliseconds=self.effect_timeout_ms):
-                    self.last_burn_tick = _now
-                    self.fire_damage()
-                else:
-                    self.burning_loop = False
-                    self.burning_end = True
-            return
-        
-        if self.burning_end:
+        if self.burning_start or self.burning_loop or self.burning_end:
             return
 
         if self.animating_idle:
@@ -147,9 +148,6 @@ class Charge(pygame.sprite.Sprite):
             _distance = vec(self.rect.topleft).distance_to(vec(self.start_pos))
             if _distance >= self.max_range:
                 self.destroy()
-                
-        if self.fuse_timeout_ms > 0 and datetime.datetime.now() > self.start_time + datetime.timedelta(milliseconds=self.fuse_timeout_ms):
-            self.destroy()
             
         # movement
         _new_pos = game_controller.point_to_angle_distance(vec(self.rect.topleft), self.bullet_speed, -math.radians(self.angle))
@@ -194,6 +192,12 @@ class Charge(pygame.sprite.Sprite):
         self.thrown = True
         
         
+    def get_draw_rect(self):
+        """Gets the area covered by the image of the charge or its floor flames, used for culling."""
+        if self.burn_hitbox != None and (self.burning_start or self.burning_loop or self.burning_end):
+            return self.burn_hitbox.rect
+        return self.rect
+    
     def draw(self, screen: pygame.Surface, offset: vec):
         if not self.is_alive:
             return    
@@ -203,9 +207,9 @@ class Charge(pygame.sprite.Sprite):
             return
             
             
-        self.image = self.current_frame.copy()
+        self.image = self.current_frame
         
-        _image = self.image.copy()
+        _image = self.image
             
         if self.rotation_speed != 0 and not self.exploding:
             _image = game_controller.rotate_image(self.image, self.rotation_angle)
@@ -269,24 +273,54 @@ class Charge(pygame.sprite.Sprite):
     def fire_damage(self):
         groups = self.target_collision_groups + game_controller.enemy_target_groups
         for group in groups:
-            collided_fire = pygame.sprite.spritecollide(self.burn_hitbox, group, False)
+            collided_fire = game_controller.spritecollide(self.burn_hitbox, group)
             for c in collided_fire:
                 if (not isinstance(c, Enemy) and not isinstance(c, Rectangle)) and (c.name != "zombie_body" and c.name != "player_body"):
                     continue
                 
                 c.take_damage(self.damage, self.owner)
     
+    def fuse_timeout(self):
+        if self.is_alive and self.destroy_time == None:
+            self.destroy()
+    
+    def start_burn_ticks(self):
+        """Schedules the fire damage ticks, the first one `burn_tick_ms` after the charge was created."""
+        self.burn_timer = game_controller.scheduler.schedule_at(self.last_burn_tick + self.burn_tick_ms, self.burn_tick)
+    
+    def burn_tick(self):
+        if not self.is_alive or not (self.burning_start or self.burning_loop):
+            return
+        
+        _now = game_clock.now_ms()
+        if self.destroy_time == None or _now < self.destroy_time + self.effect_timeout_ms:
+            self.last_burn_tick = _now
+            self.fire_damage()
+            self.burn_timer = game_controller.scheduler.schedule(self.burn_tick_ms, self.burn_tick)
+        else:
+            self.burning_loop = False
+            self.burning_end = True
+    
     def destroy(self):
-        self.destroy_time = datetime.datetime.now()
+        self.destroy_time = game_clock.now_ms()
+        if self.fuse_timer != None:
+            self.fuse_timer.cancel()
         self.kill_callback(self)
     
     def kill(self):
         self.is_alive = False
+        # pending timers would otherwise fire on the charge after it's reused
+        if self.fuse_timer != None:
+            self.fuse_timer.cancel()
+        if self.burn_timer != None:
+            self.burn_timer.cancel()
         super().kill()
+        if self.pool != None:
+            self.pool.release(self)
     
     def bullet_collision(self, groups: list[pygame.sprite.Group]):
         for group in groups:
-            collisions = pygame.sprite.spritecollide(self, group, False)
+            collisions = game_controller.spritecollide(self, group)
             for c in collisions:
                 if c.id in self.hit_targets:
                     continue
@@ -322,4 +356,8 @@ class Charge(pygame.sprite.Sprite):
         self.bullet_type = enums.BulletType[data.pop('bullet_type', enums.BulletType.PISTOL)]
         
         for item, value in data.items():
-            setattr(self, item, value)
\ No newline at end of file
+            setattr(self, item, value)
+
+
+charge_pool = ObjectPool(Charge, 32)
+"""The pool of the charges thrown by the throwables."""
@@ -1,10 +1,10 @@
-import pygame, math, datetime, random
+import pygame, math, random
 from pygame.math import Vector2 as vec
 
 from domain.models.weapon import Weapon
 from domain.utils import enums
-from domain.content.weapons.projectile import Projectile
-from domain.services import game_controller, menu_controller as mc, resources
+from domain.content.weapons.projectile import projectile_pool
+from domain.services import game_controller, menu_controller as mc, resources, bullet_assets, game_clock, asset_archive
 
 class Launcher(Weapon):
     def __init__(self, pos, **kwargs):
@@ -12,6 +12,7 @@ class Launcher(Weapon):
         
         self.explosion_min_radius = kwargs.pop("explosion_min_radius", 50)
         self.explosion_max_radius = kwargs.pop("explosion_max_radius", 100)
+        self.bullet_scale = kwargs.pop("bullet_scale", 1.4)
         
         self.start_barrel_offset = self.barrel_offset.copy()
         
@@ -20,6 +21,9 @@ class Launcher(Weapon):
         if not load_content:
             return
         
+        bullet_assets.preload_bullet(self.bullet_type, self.bullet_scale)
+        bullet_assets.get_explosion_frames()
+        bullet_assets.get_explosion_sounds(0.3)
         self.fire_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.SHOOT), self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
         self.reload_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.RELOAD), self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
         """The animation frames of this weapon when reloading."""
@@ -29,11 +33,12 @@ class Launcher(Weapon):
         self.playing_reload_end = False
         
         self.idle_unloaded_frame = self.fire_frames[-1]
+        self.add_mirrors(self.fire_frames, self.reload_frames)
         
-        self.shoot_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT))
-        self.empty_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.EMPTY_TRIGGER))
-        self.reload_start_sound_launcher = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD))
-        self.reload_end_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD_END))
+        self.shoot_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT))
+        self.empty_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.EMPTY_TRIGGER))
+        self.reload_start_sound_launcher = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD))
+        self.reload_end_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD_END))
    
         self.current_bullet = None
     
@@ -50,7 +55,7 @@ class Launcher(Weapon):
             self.current_frame = self.fire_frames[int(self.firing_frame)]
         
         if self.dir < 0:
-            self.current_frame = pygame.transform.flip(self.current_frame, False, True)
+            self.current_frame = self.get_mirror(self.current_frame)
             
     def bullet_hit(self, b):
         self.shoot_sound.fadeout(500)
@@ -62,9 +67,9 @@ class Launcher(Weapon):
         
         super().shoot(bullet_pos, player_net_id, **kwargs)
         
-        self.last_shot_time = datetime.datetime.now()
+        self.last_shot_time = game_clock.now_ms()
         self.shoot_sound.play()
-        self.current_bullet = Projectile(bullet_pos, self.weapon_aim_angle, self.bullet_speed, self.damage, player_net_id, game_controller.get_bullet_id(), max_range = self.bullet_max_range, min_range = self.bullet_min_range, bullet_type = self.bullet_type, image_scale = 1.4, hit_callback = self.bullet_hit, explosion_max_radius = self.explosion_max_radius, explosion_min_radius = self.explosion_min_radius, kill_callback = self.bullet_kill_callback)
+        self.current_bullet = projectile_pool.acquire(bullet_pos, self.weapon_aim_angle, self.bullet_speed, self.damage, player_net_id, game_controller.get_bullet_id(), max_range = self.bullet_max_range, min_range = self.bullet_min_range, bullet_type = self.bullet_type, image_scale = self.bullet_scale, hit_callback = self.bullet_hit, explosion_max_radius = self.explosion_max_radius, explosion_min_radius = self.explosion_min_radius, kill_callback = self.bullet_kill_callback)
         return self.current_bullet
     
     def reload_anim(self, speed):
@@ -91,7 +96,7 @@ class Launcher(Weapon):
             self.current_frame = self.idle_frame
         
         if self.dir < 0:
-            self.current_frame = pygame.transform.flip(self.current_frame, False, True)
+            self.current_frame = self.get_mirror(self.current_frame)
 
     def update(self, **kwargs):
         self.barrel_offset.x = self.start_barrel_offset.x * self.dir
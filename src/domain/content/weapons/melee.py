@@ -1,11 +1,12 @@
-import pygame, math, datetime, random
+import pygame, math, random
 from pygame.math import Vector2 as vec
 
 from domain.models.weapon import Weapon
 from domain.utils import enums, colors
 from domain.models.enemy import Enemy
 from domain.models.rectangle_sprite import Rectangle
-from domain.services import game_controller, menu_controller as mc, resources
+from domain.models.hitbox import Hitbox
+from domain.services import game_controller, menu_controller as mc, resources, game_clock, asset_archive
 
 class Melee(Weapon):
     def __init__(self, pos, **kwargs):
@@ -16,7 +17,7 @@ class Melee(Weapon):
         self.hiting = False
         self.hit_frame = kwargs.pop("hit_frame", 0)
         self.playing_hit_sound = False
-        self.hit_rectangle: Rectangle = None
+        self.hit_rectangle = Hitbox()
         self.attack_box = kwargs.pop("attack_box", vec(10,10))
         self.magazine_bullets = 1
         self.has_stamina = True
@@ -34,14 +35,15 @@ class Melee(Weapon):
         self.attack_frames_3 = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.SHOOT)+ "\\03", self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
         
         self.attack_frames = [self.attack_frames_1, self.attack_frames_2, self.attack_frames_3]
+        self.add_mirrors(*self.attack_frames)
         self.current_attack = 0
         
         self.idle_frame = self.attack_frames_1[0]
         self.image = self.idle_frame
         self.current_frame = self.idle_frame
         
-        self.swipe_sounds = [pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT) + f'0{i}.mp3') for i in range(1,4)]
-        self.hit_sounds = [pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.HIT) + f'0{i}.mp3') for i in range(1,4)]
+        self.swipe_sounds = [asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT) + f'0{i}.mp3') for i in range(1,4)]
+        self.hit_sounds = [asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.HIT) + f'0{i}.mp3') for i in range(1,4)]
 
     def attack_sound(self, hit = False):
         sound = None
@@ -69,19 +71,19 @@ class Melee(Weapon):
             self.current_frame = self.attack_frames[self.current_attack][int(self.firing_frame)]
         
         if self.dir < 0:
-            self.current_frame = pygame.transform.flip(self.current_frame, False, True)
+            self.current_frame = self.get_mirror(self.current_frame)
     
     def can_shoot(self):
         if not self.has_stamina:
             return False
         
-        _now = datetime.datetime.now()
+        _now = game_clock.now_ms()
         
         if self.last_shot_time == None:
                 self.last_shot_time = _now
                 return True
             
-        if _now - datetime.timedelta(milliseconds= self.fire_rate_ratio/self.fire_rate) > self.last_shot_time:
+        if _now - (self.fire_rate_ratio/self.fire_rate) > self.last_shot_time:
             return True
         
         return False
@@ -95,7 +97,7 @@ class Melee(Weapon):
         self.firing = True
         self.current_attack = random.randint(0, len(self.attack_frames)-1)
         
-        self.last_shot_time = datetime.datetime.now()
+        self.last_shot_time = game_clock.now_ms()
         
         return None
     
@@ -111,7 +113,7 @@ class Melee(Weapon):
         player_anchor = game_controller.point_to_angle_distance(vec(self.rect.center), -self.weapon_distance, -math.radians(self.weapon_aim_angle))
         hit_pos = game_controller.point_to_angle_distance(player_anchor, self.weapon_distance + self.attack_box.x/2, -math.radians(self.weapon_aim_angle))
         
-        self.hit_rectangle = Rectangle(self.attack_box, hit_pos - self.attack_box/2 + offset)
+        self.hit_rectangle.set(self.attack_box, hit_pos - self.attack_box/2 + offset)
         # self.hit_rectangle.draw(screen, offset)
             
     def attack(self):
@@ -128,7 +130,7 @@ class Melee(Weapon):
             
     def melee_collision(self):
         for group in game_controller.bullet_target_groups:
-            collisions = pygame.sprite.spritecollide(self.hit_rectangle, group, False)
+            collisions = game_controller.spritecollide(self.hit_rectangle, group)
             for c in collisions:
                 _play_sound = True
                 if isinstance(c, Enemy) or (isinstance(c, Rectangle) and "zombie" in c.name):
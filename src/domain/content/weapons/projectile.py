@@ -2,23 +2,36 @@ import pygame, math, random
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, enums, constants, math_utillity as maths
-from domain.services import game_controller, menu_controller as mc, resources
+from domain.services import game_controller, menu_controller as mc, bullet_assets
 from domain.models.enemy import Enemy
 from domain.models.rectangle_sprite import Rectangle
+from domain.models.hitbox import Hitbox
+from domain.utils.recyclables import ObjectPool
 
 class Projectile(pygame.sprite.Sprite):
     def __init__(self, pos: vec, angle: float, speed: float, damage: float, owner:int, id: int, **kwargs):
         super().__init__()
         
+        self.tail_hitbox = Hitbox()
+        """The area covered by the bullet since the last frame, updated in place every frame."""
+        self.pool: ObjectPool = None
+        """The pool this projectile was acquired from, released to when killed."""
+        self.in_pool = False
+        """If this projectile was released and is waiting to be reused."""
+        self.reset(pos, angle, speed, damage, owner, id, **kwargs)
+        
+    def reset(self, pos: vec, angle: float, speed: float, damage: float, owner:int, id: int, **kwargs):
+        """Sets the projectile up to be fired, both when created and when reused from `projectile_pool`."""
         self.id = id
         self.owner = owner
         self.bullet_type = kwargs.pop("bullet_type", enums.BulletType.PISTOL)
         self.image_scale = kwargs.pop("image_scale", 1)
-        self.image = game_controller.scale_image(pygame.image.load(resources.get_bullet_path(self.bullet_type)), self.image_scale, enums.ConvertType.CONVERT_ALPHA)
-        self.current_frame: pygame.Surface = self.image.copy()
+        self.angle = angle
+        self.image = bullet_assets.get_rotated_bullet(self.bullet_type, self.image_scale, self.angle)
+        """The bullet image, rotated once at spawn since the angle doesn't change."""
+        self.current_frame: pygame.Surface = self.image
         self.rect = self.image.get_rect()
         self.rect.topleft = pos
-        self.angle = angle
         self.speed = speed
         self.collision_groups = game_controller.bullet_target_groups
         self.damage = damage
@@ -27,7 +40,7 @@ class Projectile(pygame.sprite.Sprite):
         self.is_alive = True
         self.use_gravity = kwargs.pop("use_gravity", False)
         self.start_pos = pos
-        self.tail_hitbox: Rectangle = self.get_tail()
+        self.update_tail()
         self.pierce_damage_multiplier = kwargs.pop("pierce_damage_multiplier", 1)
         self.pierce_count = 0
         self.max_pierce_targets = kwargs.pop("max_pierce_targets", 1)
@@ -45,17 +58,15 @@ class Projectile(pygame.sprite.Sprite):
         self.explosion_frame = 0
         self.exploding = False
         if self.explosion_max_radius > 0:
-            self.explosion_frames = game_controller.load_sprites(f'{resources.IMAGES_PATH}weapons\\effects\\explosion_01', convert_type=enums.ConvertType.CONVERT_ALPHA)
-            self.explosion_sounds = [pygame.mixer.Sound(resources.get_weapon_sfx(enums.Weapons.RPG,enums.AnimActions.HIT) + f'0{i}.mp3') for i in range(1,4)]
-            for s in self.explosion_sounds:
-                s.set_volume(0.3)
+            self.explosion_frames = bullet_assets.get_explosion_frames()
+            self.explosion_sounds = bullet_assets.get_explosion_sounds(0.3)
             
     def explosion_sound(self):
         sound = self.explosion_sounds[random.randint(0, len(self.explosion_sounds)-1)]
 
         sound.play()
         
-    def get_tail(self):
+    def update_tail(self):
         _tail_rect = self.rect.copy()
         _tail_rect.width = self.rect.width * self.speed/2
         if self.image_scale != 1:
@@ -75,15 +86,18 @@ class Projectile(pygame.sprite.Sprite):
             _tail_rect.width -= abs(_tail_rect.right - (self.start_pos.x + self.rect.width))
             _tail_rect.topleft = self.rect.topleft
         _tail_rect.width = abs(_tail_rect.width)
-        _rec = Rectangle(_tail_rect.size, _tail_rect.topleft)
-        return _rec
+        self.tail_hitbox.set(_tail_rect.size, _tail_rect.topleft)
+    
+    def get_draw_rect(self):
+        """Gets the area covered by the image of the projectile, used for culling."""
+        return self.rect
     
     def draw(self, screen: pygame.Surface, offset: vec):
         if not self.is_alive:
             return    
         
         if self.exploding:
-            self.image = self.current_frame.copy()
+            self.image = self.current_frame
         
         screen.blit(self.image, vec(self.rect.topleft) - offset)
         
@@ -112,7 +126,6 @@ class Projectile(pygame.sprite.Sprite):
                 self.damage = self.total_damage - (_percentage * self.total_damage)
         
         _new_pos = game_controller.point_to_angle_distance(vec(self.rect.topleft), self.speed * mc.dt, -math.radians(self.angle))
-        self.image, self.rect = game_controller.rotate_to_angle(self.current_frame, _new_pos, self.angle)
         
         # if will be out of the map bounds
         if _new_pos.x > game_controller.map_size.x or _new_pos.x < 0 or\
@@ -125,13 +138,9 @@ class Projectile(pygame.sprite.Sprite):
         
         if collided:
             if self.explosion_min_radius > 0:
+                _explosion_max_hitbox = Hitbox().set_circle(self.explosion_max_radius, self.rect.center)
                 for group in self.collision_groups + game_controller.enemy_target_groups:
-                    _explosion_min_hitbox = Rectangle((self.explosion_min_radius*2, self.explosion_min_radius*2), vec(self.rect.topleft), radius = self.explosion_min_radius)
-                    _explosion_min_hitbox.rect.center = self.rect.center
-                    _explosion_max_hitbox = Rectangle((self.explosion_max_radius*2, self.explosion_max_radius*2), vec(self.rect.topleft), radius = self.explosion_max_radius)
-                    _explosion_max_hitbox.rect.center = self.rect.center
-                    
-                    collided_explosion = pygame.sprite.spritecollide(_explosion_max_hitbox, group, False, pygame.sprite.collide_circle)
+                    collided_explosion = game_controller.spritecollide(_explosion_max_hitbox, group, pygame.sprite.collide_circle)
                     for c in collided_explosion:
                         if isinstance(c, Enemy) or isinstance(c, Rectangle) and c.name == "zombie_body" or c.name == "player_body":
                             
@@ -158,7 +167,7 @@ class Projectile(pygame.sprite.Sprite):
                 if self.pierce_count >= self.max_pierce_targets:
                     self.destroy()
         self.rect.topleft = _new_pos
-        self.tail_hitbox = self.get_tail()
+        self.update_tail()
         
     
     def explosion_anim(self, speed: float):
@@ -186,11 +195,13 @@ class Projectile(pygame.sprite.Sprite):
         self.is_alive = False
         self.kill_callback(len(self.hit_targets) > 0)
         super().kill()
+        if self.pool != None:
+            self.pool.release(self)
     
     def bullet_collision(self):
         _collided = False
         for group in self.collision_groups:
-            collisions = pygame.sprite.spritecollide(self.tail_hitbox, group, False)
+            collisions = game_controller.spritecollide(self.tail_hitbox, group)
             for c in collisions:
                 if c.id in self.hit_targets:
                     continue
@@ -219,4 +230,8 @@ class Projectile(pygame.sprite.Sprite):
         self.bullet_type = enums.BulletType[data.pop('bullet_type', enums.BulletType.PISTOL)]
         
         for item, value in data.items():
-            setattr(self, item, value)
\ No newline at end of file
+            setattr(self, item, value)
+
+
+projectile_pool = ObjectPool(Projectile, 512)
+"""The pool of the projectiles fired by the weapons."""
\ No newline at end of file
@@ -1,10 +1,10 @@
-import pygame, math, datetime,random
+import pygame, math,random
 from pygame.math import Vector2 as vec
 
 from domain.models.weapon import Weapon
 from domain.utils import enums
-from domain.content.weapons.projectile import Projectile
-from domain.services import game_controller, menu_controller as mc, resources
+from domain.content.weapons.projectile import projectile_pool
+from domain.services import game_controller, menu_controller as mc, resources, bullet_assets, game_clock, asset_archive
 
 class SemiAuto(Weapon):
     def __init__(self, pos, **kwargs):
@@ -15,15 +15,17 @@ class SemiAuto(Weapon):
         if not load_content:
             return
         
+        bullet_assets.preload_bullet(self.bullet_type)
         self.fire_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.SHOOT), self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
         self.reload_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.RELOAD), self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
+        self.add_mirrors(self.fire_frames, self.reload_frames)
         """The animation frames of this weapon when reloading."""
         
         self.playing_reload_end = False
-        self.shoot_sounds = [pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT) + f'0{i}.mp3') for i in range(1,3)]
-        self.empty_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.EMPTY_TRIGGER))
-        self.reload_start_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD))
-        self.reload_end_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD_END))
+        self.shoot_sounds = [asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT) + f'0{i}.mp3') for i in range(1,3)]
+        self.empty_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.EMPTY_TRIGGER))
+        self.reload_start_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD))
+        self.reload_end_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD_END))
     
     def update(self, **kwargs):
         super().update(**kwargs)
@@ -44,7 +46,7 @@ class SemiAuto(Weapon):
         self.current_frame = self.fire_frames[int(self.firing_frame)]
         
         if self.dir < 0:
-            self.current_frame = pygame.transform.flip(self.current_frame, False, True)
+            self.current_frame = self.get_mirror(self.current_frame)
         return _still_firing
     
     def shoot(self, bullet_pos: vec, player_net_id: int, **kwargs):
@@ -53,9 +55,9 @@ class SemiAuto(Weapon):
         
         super().shoot(bullet_pos, player_net_id, **kwargs)
         
-        self.last_shot_time = datetime.datetime.now()
+        self.last_shot_time = game_clock.now_ms()
         self.shoot_sounds[random.randint(0, len(self.shoot_sounds)-1)].play()
-        return Projectile(bullet_pos, self.weapon_aim_angle, self.bullet_speed, self.damage, player_net_id, game_controller.get_bullet_id(), max_range = self.bullet_max_range, min_range = self.bullet_min_range, bullet_type = self.bullet_type, kill_callback = self.bullet_kill_callback)
+        return projectile_pool.acquire(bullet_pos, self.weapon_aim_angle, self.bullet_speed, self.damage, player_net_id, game_controller.get_bullet_id(), max_range = self.bullet_max_range, min_range = self.bullet_min_range, bullet_type = self.bullet_type, kill_callback = self.bullet_kill_callback)
     
     def reload_anim(self, speed):
         self.reloading_frame += speed
@@ -76,6 +78,6 @@ class SemiAuto(Weapon):
             self.current_frame = self.idle_frame
         
         if self.dir < 0:
-            self.current_frame = pygame.transform.flip(self.current_frame, False, True)
+            self.current_frame = self.get_mirror(self.current_frame)
             
     
\ No newline at end of file
@@ -1,10 +1,10 @@
-import pygame, math, datetime, random
+import pygame, math, random
 from pygame.math import Vector2 as vec
 
 from domain.models.weapon import Weapon
 from domain.utils import enums
-from domain.content.weapons.projectile import Projectile
-from domain.services import game_controller, menu_controller as mc, resources
+from domain.content.weapons.projectile import projectile_pool
+from domain.services import game_controller, menu_controller as mc, resources, bullet_assets, game_clock, asset_archive
 
 class Sniper(Weapon):
     def __init__(self, pos, **kwargs):
@@ -18,19 +18,21 @@ class Sniper(Weapon):
         if not load_content:
             return
         
+        bullet_assets.preload_bullet(self.bullet_type)
         self.fire_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.SHOOT), self.weapon_scale, convert_type=enums.ConvertType.CONVERT_ALPHA)
         self.reload_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.RELOAD), self.weapon_scale, convert_type=enums.ConvertType.CONVERT_ALPHA)
         self.pump_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.PUMP), self.weapon_scale, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.add_mirrors(self.fire_frames, self.reload_frames, self.pump_frames)
         
         self.playing_reload_end = False
         
         self.start_barrel_offset = self.barrel_offset.copy()
         
-        self.shoot_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT))
-        self.empty_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.EMPTY_TRIGGER))
-        self.pump_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.PUMP))
-        self.reload_start_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD))
-        self.reload_end_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD_END))
+        self.shoot_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT))
+        self.empty_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.EMPTY_TRIGGER))
+        self.pump_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.PUMP))
+        self.reload_start_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD))
+        self.reload_end_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD_END))
    
         self.pumping = False
         self.pumping_frame = 0
@@ -55,15 +57,15 @@ class Sniper(Weapon):
         
         super().shoot(bullet_pos, player_net_id, **kwargs)
         
-        self.last_shot_time = datetime.datetime.now()
+        self.last_shot_time = game_clock.now_ms()
         self.shoot_sound.play()
         
-        return Projectile(bullet_pos, self.weapon_aim_angle, self.bullet_speed, self.damage, player_net_id, game_controller.get_bullet_id(), max_range = self.bullet_max_range, min_range = self.bullet_min_range, bullet_type = self.bullet_type, pierce_damage_multiplier = self.pierce_damage_multiplier, max_pierce_targets = self.max_pierce_targets, kill_callback = self.bullet_kill_callback)
+        return projectile_pool.acquire(bullet_pos, self.weapon_aim_angle, self.bullet_speed, self.damage, player_net_id, game_controller.get_bullet_id(), max_range = self.bullet_max_range, min_range = self.bullet_min_range, bullet_type = self.bullet_type, pierce_damage_multiplier = self.pierce_damage_multiplier, max_pierce_targets = self.max_pierce_targets, kill_callback = self.bullet_kill_callback)
     
 
     
     # def reload(self):
-    #     now = datetime.datetime.now()
+    #     now = game_clock.now_ms()
     #     # if ran out of ammo
     #     if self.player_backpack.get_ammo(self.bullet_type) <= 0:
     #         return False
@@ -71,7 +73,7 @@ class Sniper(Weapon):
     #     if self.magazine_bullets >= self.magazine_size:
     #         return False
     #     # if is still reloading
-    #     if (self.reload_start_time != None and now - datetime.timedelta(milliseconds= self.reload_delay_ms) <= self.reload_start_time) or self.pumping:
+    #     if (self.reload_start_time != None and now - self.reload_delay_ms <= self.reload_start_time) or self.pumping:
     #         return False
     #     # if is still firing
     #     if self.firing:
@@ -82,7 +84,7 @@ class Sniper(Weapon):
     #     self.reload_start_time = now
         
     # def reload_one(self):
-    #     now = datetime.datetime.now()
+    #     now = game_clock.now_ms()
         
     #     # if ran out of ammo
     #     if self.player_backpack.get_ammo(self.bullet_type) <= 0:
@@ -91,7 +93,7 @@ class Sniper(Weapon):
     #     if self.magazine_bullets >= self.magazine_size:
     #         return False
     #     # if is still reloading
-    #     if (self.reload_start_time != None and now - datetime.timedelta(milliseconds= self.reload_delay_ms) <= self.reload_start_time) or self.pumping:
+    #     if (self.reload_start_time != None and now - self.reload_delay_ms <= self.reload_start_time) or self.pumping:
     #         return False
     #     # if is still firing
     #     if self.firing:
@@ -116,7 +118,7 @@ class Sniper(Weapon):
         self.current_frame = self.fire_frames[int(self.firing_frame)]
         
         if self.dir < 0:
-            self.current_frame = pygame.transform.flip(self.current_frame, False, True)
+            self.current_frame = self.get_mirror(self.current_frame)
         return _still_firing
     
     def pump_anim(self, speed):
@@ -132,13 +134,13 @@ class Sniper(Weapon):
             self.current_frame = self.pump_frames[int(self.pumping_frame)]
         
         if self.dir < 0:
-            self.current_frame = pygame.transform.flip(self.current_frame, False, True)
+            self.current_frame = self.get_mirror(self.current_frame)
     
     
     def reload_anim(self, speed):
         self.reloading_frame += speed
         if self.reloading_frame == 0:
-            self.reload_start_time = datetime.datetime.now()
+            self.reload_start_time = game_clock.now_ms()
         
         if int(self.reloading_frame) == self.reload_end_frame and not self.playing_reload_end:
             self.reload_end_sound.play()
@@ -159,7 +161,7 @@ class Sniper(Weapon):
         
         
         if self.dir < 0:
-            self.current_frame = pygame.transform.flip(self.current_frame, False, True)
+            self.current_frame = self.get_mirror(self.current_frame)
 
             
         
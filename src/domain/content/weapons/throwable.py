@@ -1,12 +1,13 @@
-import pygame, math, datetime,random
+import pygame, math,random
 from pygame.math import Vector2 as vec
 
 from domain.models.weapon import Weapon
 from domain.utils import enums
-from domain.content.weapons.charge import Charge
+from domain.content.weapons.charge import Charge, charge_pool
 from domain.models.rectangle_sprite import Rectangle
+from domain.models.hitbox import Hitbox
 from domain.models.enemy import Enemy
-from domain.services import game_controller, menu_controller as mc, resources
+from domain.services import game_controller, menu_controller as mc, resources, bullet_assets, game_clock, asset_archive
 
 class Throwable(Weapon):
     def __init__(self, pos, **kwargs):
@@ -40,16 +41,23 @@ class Throwable(Weapon):
         if not load_content:
             return
         
-        self.fire_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.SHOOT), self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
+        self.fire_frames = bullet_assets.get_charge_frames(self.weapon_type, self.weapon_scale)
+        self.add_mirrors(self.fire_frames)
+        match self.weapon_type:
+            case enums.Throwables.FRAG_GRENADE:
+                bullet_assets.get_explosion_frames()
+                bullet_assets.get_explosion_sounds(0.1)
+            case enums.Throwables.MOLOTOV:
+                bullet_assets.get_floor_flames_frames()
         self.hit_frames = game_controller.load_sprites(resources.get_weapon_path(self.weapon_type, enums.AnimActions.HIT), self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
-        self.hand_frames = [game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}weapons\\throwables\\throwing_hand\\hand\\0{i}.png'), 0.8, enums.ConvertType.CONVERT_ALPHA) for i in range(1,10)]
-        self.fingers_frames = [game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}weapons\\throwables\\throwing_hand\\fingers\\0{i}.png'), 0.8, enums.ConvertType.CONVERT_ALPHA) for i in range(1,10)]
+        self.hand_frames = [game_controller.load_image(f'{resources.IMAGES_PATH}weapons\\throwables\\throwing_hand\\hand\\0{i}.png', 0.8, enums.ConvertType.CONVERT_ALPHA) for i in range(1,10)]
+        self.fingers_frames = [game_controller.load_image(f'{resources.IMAGES_PATH}weapons\\throwables\\throwing_hand\\fingers\\0{i}.png', 0.8, enums.ConvertType.CONVERT_ALPHA) for i in range(1,10)]
         
         self.hand_surface: pygame.Surface = pygame.Surface( self.hand_frames[0].get_size(), pygame.SRCALPHA)
         
-        self.shoot_sounds = [pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT) + f'0{i}.mp3') for i in range(1,3)]
-        self.reload_start_sound = pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD))
-        self.hit_sounds = [pygame.mixer.Sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.HIT) + f'0{i}.mp3') for i in range(1,3)]
+        self.shoot_sounds = [asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.SHOOT) + f'0{i}.mp3') for i in range(1,3)]
+        self.reload_start_sound = asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.RELOAD))
+        self.hit_sounds = [asset_archive.load_sound(resources.get_weapon_sfx(self.weapon_type,enums.AnimActions.HIT) + f'0{i}.mp3') for i in range(1,3)]
 
     def update(self, **kwargs):
         super().update(**kwargs)
@@ -64,12 +72,13 @@ class Throwable(Weapon):
             
     def draw(self, screen: pygame.Surface, offset: vec):
         
-        hand_surface = self.hand_surface.copy()
+        hand_surface = self.hand_surface
         if self.dir < 0:
             hand_surface = pygame.transform.flip(hand_surface, False, True)
         hand_pos = game_controller.point_to_angle_distance(vec(self.rect.topleft), -self.weapon_distance*1.4, -math.radians(self.weapon_aim_angle))
         hand_pos.y -= 30
-        hand_sur, hand_rect = game_controller.rotate_to_angle(hand_surface, hand_pos, self.weapon_aim_angle)
+        # the hand is redrawn in place by the animations (and flipped to a new surface), so it's never cached
+        hand_sur, hand_rect = game_controller.rotate_to_angle(hand_surface, hand_pos, self.weapon_aim_angle, cache = False)
         
         screen.blit(hand_sur, hand_rect)
         
@@ -100,17 +109,17 @@ class Throwable(Weapon):
         if self.count <= 0:
             return False
         
-        _now = datetime.datetime.now()
+        _now = game_clock.now_ms()
         
         #if the player is switching weapons
         if self.changing_weapon:
             return False
         
         # if is still reloading
-        if self.reload_start_time != None and _now - datetime.timedelta(milliseconds= self.reload_delay_ms) <= self.reload_start_time:
+        if self.reload_start_time != None and _now - self.reload_delay_ms <= self.reload_start_time:
             return False
         
-        if self.last_shot_time != None and _now - datetime.timedelta(milliseconds= self.fire_rate_ratio/self.fire_rate) > self.last_shot_time:
+        if self.last_shot_time != None and _now - (self.fire_rate_ratio/self.fire_rate) > self.last_shot_time:
             return True
         
         return False
@@ -129,7 +138,7 @@ class Throwable(Weapon):
         if self.throwing or self.cook_start_time != None or self.count == 0:
             return
         
-        self.cook_start_time = datetime.datetime.now()
+        self.cook_start_time = game_clock.now_ms()
         
         self.reload_start_sound.play()
         
@@ -144,7 +153,7 @@ class Throwable(Weapon):
         self.firing = True
         self.bullet_kill_callback = kwargs.pop("kill_callback", lambda b: None)
         
-        self.last_shot_time = datetime.datetime.now()
+        self.last_shot_time = game_clock.now_ms()
         self.shoot_sounds[random.randint(0, len(self.shoot_sounds)-1)].play()
         
         charge_dict = {
@@ -171,14 +180,14 @@ class Throwable(Weapon):
         }
         self.cook_start_time = None
         
-        return Charge(bullet_pos, self.weapon_aim_angle, self.bullet_speed, self.damage, player_net_id, game_controller.get_bullet_id(), **charge_dict)
+        return charge_pool.acquire(bullet_pos, self.weapon_aim_angle, self.bullet_speed, self.damage, player_net_id, game_controller.get_bullet_id(), **charge_dict)
             
             
     def on_charge_hit(self, charge: Charge):
-        _now = datetime.datetime.now()
+        _now = game_clock.now_ms()
         match self.weapon_type:
             case enums.Throwables.FRAG_GRENADE:
-                if charge.last_hit_sound != None and _now > charge.last_hit_sound + datetime.timedelta(milliseconds=charge.hit_interval_ms):
+                if charge.last_hit_sound != None and _now > charge.last_hit_sound + charge.hit_interval_ms:
                     self.hit_sounds[random.randint(0, len(self.hit_sounds)-1)].play()
                     charge.last_hit_sound = _now
                 else:
@@ -199,13 +208,9 @@ class Throwable(Weapon):
             charge.kill()
             return
         
+        _explosion_max_hitbox = Hitbox().set_circle(charge.explosion_max_radius, charge.rect.center)
         for group in charge.target_collision_groups + game_controller.enemy_target_groups:
-            _explosion_min_hitbox = Rectangle((charge.explosion_min_radius*2, charge.explosion_min_radius*2), vec(charge.rect.topleft), radius = charge.explosion_min_radius)
-            _explosion_min_hitbox.rect.center = charge.rect.center
-            _explosion_max_hitbox = Rectangle((charge.explosion_max_radius*2, charge.explosion_max_radius*2), vec(charge.rect.topleft), radius = charge.explosion_max_radius)
-            _explosion_max_hitbox.rect.center = charge.rect.center
-            
-            collided_explosion = pygame.sprite.spritecollide(_explosion_max_hitbox, group, False, pygame.sprite.collide_circle)
+            collided_explosion = game_controller.spritecollide(_explosion_max_hitbox, group, pygame.sprite.collide_circle)
             for c in collided_explosion:
                 if (not isinstance(c, Enemy) and not isinstance(c, Rectangle)) and (c.name != "zombie_body" and c.name != "player_body"):
                     continue
@@ -231,12 +236,13 @@ class Throwable(Weapon):
         self.hit_sounds[random.randint(0, len(self.hit_sounds)-1)].play()
         charge.charge_destroy_pos = vec(charge.rect.bottomleft)
         charge.burning_start = True
+        charge.start_burn_ticks()
         charge.animating_idle = False
         
         _fire_rect = charge.floor_fire_surface.get_rect()
         _fire_rect.centerx = charge.charge_destroy_pos.x
         _fire_rect.bottom = charge.charge_destroy_pos.y
-        charge.burn_hitbox = Rectangle(_fire_rect.size, _fire_rect.topleft)
+        charge.burn_hitbox = Hitbox(_fire_rect.size, _fire_rect.topleft)
         # charge.kill()
     
     
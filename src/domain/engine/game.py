@@ -1,21 +1,21 @@
 import pygame, time
-import datetime
 from pygame.math import Vector2 as vec
 
-from domain.services import game_controller, menu_controller as mc, resources
+from domain.services import game_controller, menu_controller as mc, resources, game_clock, profiler, assets_manager, asset_archive
 from domain.utils import colors, enums, constants
 from domain.utils.math_utillity import sum_tuple_infix as t
 from domain.models.player import Player
-from domain.models.network_data import Data as NetData
+from domain.models.network_data import Data as NetData, SnapshotBuffer
 from domain.models.map import Map
 from domain.models.igravitable import IGravitable
 from domain.models.rectangle_sprite import Rectangle
 from domain.models.ui.pages.page import Page
 from domain.models.ui.pages.modals.wave_summary import WaveSummary
-from domain.models.wave import Wave
+from domain.models.wave import Wave, get_enemy_types
 from domain.models.ui.pages.modals.pause import Pause
 from domain.models.ui.popup_text import Popup
 from domain.models.wave_result import WaveResult
+from domain.models.scheduler import Scheduler
 from domain.content.enemies.z_roger import ZRoger
 from domain.content.waves.simple_wave import SimpleWave
 from domain.content.waves.boss_wave import BossWave
@@ -72,9 +72,20 @@ class Game(Page):
         self.command_id = 0
         """A command sent from the host to execute some operation on both host and client, such as restart game."""
         
+        self.net_outbox = SnapshotBuffer()
+        """The newest state of this game, waiting to be sent by the network thread."""
+        
+        self.net_inbox = SnapshotBuffer()
+        """The newest state received from player 2, waiting to be applied by the main loop."""
+        
+        self.scheduler = Scheduler()
+        """The timers of this game, fired by the game clock."""
+        
         self.test_objects = []
 
         self.current_wave: Wave = None
+        self.assets_manager = assets_manager.AssetsManager()
+        """The enemy assets, kept loaded across waves."""
         
         self.pause_screen: Pause = None
         
@@ -82,20 +93,20 @@ class Game(Page):
         
         self.focused = True
         
-        self.game_over_time: datetime.datetime = None
+        self.game_over_time: float = None
         self.game_over_popup: Popup = None
         
         #ui
         
-        self._money_icon = pygame.image.load(f'{resources.IMAGES_PATH}ui\\dollar.png').convert_alpha()
-        self._pistol_ammo_icon = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\pistol_ammo_icon.png'), 3, convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self._shotgun_ammo_icon = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\shotgun_ammo_icon.png'), 2.7, convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self._rifle_ammo_icon = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\rifle_ammo_icon.png'), 2.8, convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self._sniper_ammo_icon = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\sniper_ammo_icon.png'), 2.5, convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self._rocket_ammo_icon = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\rocket_ammo_icon.png'), 2.4, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self._money_icon = asset_archive.load_image(f'{resources.IMAGES_PATH}ui\\dollar.png').convert_alpha()
+        self._pistol_ammo_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\pistol_ammo_icon.png', 3, enums.ConvertType.CONVERT_ALPHA)
+        self._shotgun_ammo_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\shotgun_ammo_icon.png', 2.7, enums.ConvertType.CONVERT_ALPHA)
+        self._rifle_ammo_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\rifle_ammo_icon.png', 2.8, enums.ConvertType.CONVERT_ALPHA)
+        self._sniper_ammo_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\sniper_ammo_icon.png', 2.5, enums.ConvertType.CONVERT_ALPHA)
+        self._rocket_ammo_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\rocket_ammo_icon.png', 2.4, enums.ConvertType.CONVERT_ALPHA)
 
-        self._frag_grenade_icon = game_controller.scale_image(pygame.image.load(resources.get_weapon_path(enums.Throwables.FRAG_GRENADE, enums.AnimActions.ICON)), 1.5, convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self._molotov_icon = game_controller.scale_image(pygame.image.load(resources.get_weapon_path(enums.Throwables.MOLOTOV, enums.AnimActions.ICON)), 0.6, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self._frag_grenade_icon = game_controller.load_image(resources.get_weapon_path(enums.Throwables.FRAG_GRENADE, enums.AnimActions.ICON), 1.5, enums.ConvertType.CONVERT_ALPHA)
+        self._molotov_icon = game_controller.load_image(resources.get_weapon_path(enums.Throwables.MOLOTOV, enums.AnimActions.ICON), 0.6, enums.ConvertType.CONVERT_ALPHA)
         
         
         
@@ -134,6 +145,7 @@ class Game(Page):
         game_controller.bullet_target_groups = [self.collision_group, self.current_wave.enemies_hitbox_group]
         game_controller.enemy_target_groups = [self.players_group]
         game_controller.collision_group = self.collision_group
+        game_controller.scheduler = self.scheduler
         
         
         if self.client_type != enums.ClientType.SINGLE:
@@ -141,16 +153,21 @@ class Game(Page):
             
         
     
-    def next_wave(self):
-        next_wave = 0 
+    def get_next_wave_number(self):
         if self.current_wave == None:
-            next_wave = 1
+            return 1
         elif len(constants.WAVES) < self.current_wave.wave_number+1:
-            next_wave = 1
+            return 1
         else:
-            next_wave = self.current_wave.wave_number+1
+            return self.current_wave.wave_number+1
+    
+    def next_wave(self):
+        next_wave = self.get_next_wave_number()
         
+        if self.current_wave != None:
+            self.assets_manager.release(self.current_wave.enemy_types)
         self.current_wave = self.create_wave(constants.WAVES[next_wave])
+        self.assets_manager.evict(keep = self.current_wave.enemy_types)
         self.start_wave()
     
     def create_wave(self, values_dict: dict):
@@ -193,7 +210,8 @@ class Game(Page):
             
         
         
-        self.wave_summary = WaveSummary((result[1], result[2] if self.client_type != enums.ClientType.SINGLE else None), start_time = datetime.datetime.now())
+        self.wave_summary = WaveSummary((result[1], result[2] if self.client_type != enums.ClientType.SINGLE else None), start_time = game_clock.now_ms())
+        self.assets_manager.prefetch(get_enemy_types(constants.WAVES[self.get_next_wave_number()].get("enemies", [])))
 
     def get_ammo_icon(self, bullet_type: enums.BulletType):
         match bullet_type:
@@ -221,7 +239,7 @@ class Game(Page):
         _horizontal_margin = 10
         bkp = self.player.backpack
         
-        _player_head = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\characters\\{self.player.character.value}\\head_icon.png'), 3, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        _player_head = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\characters\\{self.player.character.value}\\head_icon.png', 3, enums.ConvertType.CONVERT_ALPHA)
         _head_rect = _player_head.get_rect()
         _head_rect.top = _top_margin
         _head_rect.left = _horizontal_margin
@@ -249,7 +267,7 @@ class Game(Page):
         _txt_wave_number_rect.right = self.screen.get_width() - _horizontal_margin
         
         
-        _skull = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\skull.png'), 0.8, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        _skull = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\skull.png', 0.8, enums.ConvertType.CONVERT_ALPHA)
         _skull_rect = _skull.get_rect()
         _skull_rect.top = _txt_wave_number_rect.bottom + _top_margin/2
         _skull_rect.right = self.screen.get_width() - _horizontal_margin
@@ -270,11 +288,12 @@ class Game(Page):
         
         #primary
         if bkp.equipped_primary != None and self.player.current_weapon.weapon_type == bkp.equipped_primary:
-            _weapon_icon = pygame.image.load(resources.get_weapon_path(bkp.equipped_primary, enums.AnimActions.ICON))
+            _weapon_icon_path = resources.get_weapon_path(bkp.equipped_primary, enums.AnimActions.ICON)
             _equiped_prim = True
             
         elif bkp.equipped_secondary != None and self.player.current_weapon.weapon_type == bkp.equipped_secondary:
-            _weapon_icon = pygame.image.load(resources.get_weapon_path(bkp.equipped_secondary, enums.AnimActions.ICON))
+            _weapon_icon_path = resources.get_weapon_path(bkp.equipped_secondary, enums.AnimActions.ICON)
+        _weapon_icon = game_controller.load_image(_weapon_icon_path)
 
         _max_dim = max(*_weapon_icon.get_size())
         _ratio = abs(_weapon_icon.get_width() / _weapon_icon.get_height())
@@ -282,7 +301,7 @@ class Game(Page):
             _max_dim *= 0.8
             
         _percentage = ((_weapon_size * 100 / _max_dim)/100)
-        _weapon_icon = game_controller.scale_image(_weapon_icon, _percentage, enums.ConvertType.CONVERT_ALPHA)
+        _weapon_icon = game_controller.load_image(_weapon_icon_path, _percentage, enums.ConvertType.CONVERT_ALPHA)
         _weapon_icon_rect = _weapon_icon.get_rect()
         _weapon_icon_rect.left = _horizontal_margin
         if _weapon_icon_rect.width < _weapon_size:
@@ -295,9 +314,10 @@ class Game(Page):
         _sec_weapon_icon = None
         if bkp.equipped_secondary != None and bkp.equipped_primary != None:
             if _equiped_prim:
-                _sec_weapon_icon = pygame.image.load(resources.get_weapon_path(bkp.equipped_secondary, enums.AnimActions.ICON))
+                _sec_weapon_icon_path = resources.get_weapon_path(bkp.equipped_secondary, enums.AnimActions.ICON)
             else:
-                _sec_weapon_icon = pygame.image.load(resources.get_weapon_path(bkp.equipped_primary, enums.AnimActions.ICON))
+                _sec_weapon_icon_path = resources.get_weapon_path(bkp.equipped_primary, enums.AnimActions.ICON)
+            _sec_weapon_icon = game_controller.load_image(_sec_weapon_icon_path)
         if _sec_weapon_icon != None:
             _max_dim = max(*_sec_weapon_icon.get_size())
             _ratio = abs(_sec_weapon_icon.get_width() / _sec_weapon_icon.get_height())
@@ -305,7 +325,7 @@ class Game(Page):
                 _max_dim *= 0.6
                 
             _percentage = ((_sec_weapon_size * 100 / _max_dim)/100)
-            _sec_weapon_icon = game_controller.scale_image(_sec_weapon_icon, _percentage, enums.ConvertType.CONVERT_ALPHA)
+            _sec_weapon_icon = game_controller.load_image(_sec_weapon_icon_path, _percentage, enums.ConvertType.CONVERT_ALPHA)
             _sec_weapon_icon_rect = _sec_weapon_icon.get_rect()
             _sec_weapon_icon_rect.left = _weapon_icon_rect.right + _weapon_offset
         ##
@@ -324,7 +344,7 @@ class Game(Page):
         #swap
         if _sec_weapon_icon != None:
             _sec_weapon_icon_rect.bottom = _weapon_icon_rect.top - _top_margin
-            _swap_icon = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\swap.png'), 0.8, convert_type=enums.ConvertType.CONVERT_ALPHA)
+            _swap_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\swap.png', 0.8, enums.ConvertType.CONVERT_ALPHA)
             _swap_icon_rect = _swap_icon.get_rect()
             _swap_icon_rect.centery = _sec_weapon_icon_rect.centery
             _swap_icon_rect.centerx = max(_weapon_icon_rect.centerx, _weapon_offset)
@@ -399,6 +419,7 @@ class Game(Page):
             
     def get_net_data(self):
         data = NetData(
+                time_ms = game_controller.net_time_ms(),
                 net_id = self.player.net_id,
                 player_rect = (self.player.rect.left, self.player.rect.top, self.player.rect.width, self.player.rect.height),
                 player_last_rect = (self.player.last_rect.left, self.player.last_rect.top, self.player.last_rect.width, self.player.last_rect.height),
@@ -450,10 +471,12 @@ class Game(Page):
         if self.wave_summary != None:
             self.wave_summary.p2_ready = data.player_wave_ready
         
-        self.player2.rect = pygame.Rect(data.player_rect)
+        _now = game_controller.net_time_ms()
+        
+        self.player2.rect.size = data.player_rect[2:]
         self.player2.last_rect = pygame.Rect(data.player_last_rect)
-        self.player2.pos = vec(self.player2.rect.topleft)
         self.player2.speed = vec(data.player_speed)
+        self.player2.net_buffer.push(data.time_ms, vec(data.player_rect[:2]), self.player2.speed, _now)
         
         _health_diff = self.player2.health - data.player_health
         if _health_diff > 0:
@@ -473,14 +496,12 @@ class Game(Page):
         if data.player_firing:
             self.player2.firing = True
         
-        self.player2.update_rect()
-        
         current_enemy_ids = [x.id for x in self.current_wave.enemies_group.sprites()]
         if self.client_type == enums.ClientType.GUEST:
             for e_data in data.enemies:
                 enemy = [x for x in self.current_wave.enemies_group.sprites() if x.id == e_data['id']]
                 if len(enemy) > 0:
-                    enemy[0].load_netdata(e_data)
+                    enemy[0].load_netdata(e_data, remote_time_ms = data.time_ms, local_time_ms = _now)
                 else:
                     if len(current_enemy_ids) < len(data.enemies) and e_data['id'] not in current_enemy_ids:
                         self.create_netdata_enemy(e_data)
@@ -508,6 +529,22 @@ class Game(Page):
                      
         self.player.player2_rect = self.player2.rect
     
+    def sync_network(self):
+        """Applies the newest state received from player 2 and hands the current state to the network thread.
+        """
+        received_data = self.net_inbox.take()
+        if received_data != None:
+            self.handle_received_data(received_data)
+        
+        # player 2 moves between the received states every frame
+        _player2_pos = self.player2.net_buffer.sample(game_controller.net_time_ms())
+        if _player2_pos != None:
+            self.player2.pos = _player2_pos
+            self.player2.update_rect()
+            self.player.player2_rect = self.player2.rect
+        
+        self.net_outbox.put(self.get_net_data())
+    
     def create_netdata_enemy(self, data: dict):
         e = None
         match data["enemy_name"]:
@@ -544,7 +581,7 @@ class Game(Page):
     
     def process_gravitables(self):
         """Applies gravity to all gravitable objects (subclasses of IGravitable)"""        
-        for obj in IGravitable.instances:
+        for obj in IGravitable.instances():
             if obj.gravity_enabled:
                 self.apply_gravity(obj)
                 obj.rect.top = obj.pos.y
@@ -614,7 +651,7 @@ class Game(Page):
         game_controller.restart_game(self)
 
     def game_over(self):
-        self.game_over_time = datetime.datetime.now()
+        self.game_over_time = game_clock.now_ms()
         self.focused = False
         pygame.mouse.set_cursor()
         self.game_over_popup = Popup("Game Over", (0,0), show_on_init = False, **constants.POPUPS["game_over"])
@@ -662,8 +699,8 @@ class Game(Page):
     def handle_grenades(self):
         #if current weapon has burst firemode and can shoot one more round
         _explode_cooked = False
-        _now = datetime.datetime.now()
-        if self.player.current_throwable.fuse_timeout_ms > 0 and self.player.current_throwable.cook_start_time != None and self.player.current_throwable.fuse_timeout_ms > 0 and _now > self.player.current_throwable.cook_start_time + datetime.timedelta(milliseconds=self.player.current_throwable.fuse_timeout_ms):
+        _now = game_clock.now_ms()
+        if self.player.current_throwable.fuse_timeout_ms > 0 and self.player.current_throwable.cook_start_time != None and self.player.current_throwable.fuse_timeout_ms > 0 and _now > self.player.current_throwable.cook_start_time + self.player.current_throwable.fuse_timeout_ms:
             _explode_cooked = True
         
         if ((pygame.K_g not in self.pressed_keys and self.player.current_throwable.cook_start_time == None)or\
@@ -703,8 +740,11 @@ class Game(Page):
     def update(self, **kwargs):
         events = kwargs.pop("events", None)
         
+        # the assets decoded by the loading threads can only be converted on the main thread
+        self.assets_manager.convert_step(assets_manager.CONVERT_BUDGET_MS)
+        
         if self.current_wave != None:
-            if self.current_wave.started and not self.current_wave.loaded:
+            if self.current_wave.started and not self.current_wave.check_loaded():
                 return
         
         if not pygame.mixer.music.get_busy() and self.focused:
@@ -712,6 +752,10 @@ class Game(Page):
         
         game_controller.handle_events(self, events)
         
+        if self.client_type != enums.ClientType.SINGLE:
+            self.sync_network()
+            profiler.lap("network")
+        
         if self.pause_screen != None and self.pause_screen.active:
             if self.player.reload_popup != None:
                 self.player.reload_popup.destroy()
@@ -742,6 +786,7 @@ class Game(Page):
         self.handle_shooting()
         
         self.handle_grenades()
+        profiler.lap("input")
         
         if self.wave_summary != None:
             self.focused = False
@@ -756,8 +801,12 @@ class Game(Page):
         # p2
         if self.client_type != enums.ClientType.SINGLE:
             self.player2.update(game = self)
+        profiler.lap("player")
+        # timers
+        self.scheduler.update()
         # wave logic
         self.current_wave.update()
+        profiler.lap("wave")
         # enemies
         if self.player.is_alive or (self.client_type != enums.ClientType.SINGLE and self.player2.is_alive):
             self.current_wave.update_enemies()
@@ -766,15 +815,19 @@ class Game(Page):
                 self.game_over()
             if self.game_over_popup._current_text_color[3] == 255:
                 self.pause_screen.show()
+        profiler.lap("enemies")
         
         self.collision_group.update(group_name = "collision")
         self.jumpable_group.update(group_name = "jumpable")
     
         self.process_gravitables()    
+        profiler.lap("gravity")
             
         self.bullets_group.update(offset = self.player.offset_camera, game = self)
+        profiler.lap("bullets")
         
         self.center_camera()
+        profiler.lap("camera")
         
         if "wheel_1" in self.pressed_keys:
             self.pressed_keys.remove("wheel_1")
@@ -835,10 +888,14 @@ class Game(Page):
         
         if not self.current_wave.loaded:
             self.screen.fill(colors.BLACK)
+            _progress = self.assets_manager.get_progress(self.current_wave.enemy_types)
+            _txt_loading = mc.get_text_surface(f"Loading... {int(_progress * 100)}%", colors.LIGHT_GRAY, resources.px_font(30))
+            self.screen.blit(_txt_loading, _txt_loading.get_rect(center = vec(self.screen.get_size())/2))
             return
         
         # Map
         self.screen.blit(self.map.image, vec(self.map.rect.topleft) - self.player.offset_camera)
+        profiler.lap("map blit")
         
         if self.pause_screen != None and self.pause_screen.active:
             self.pause_screen.draw(self.screen)
@@ -859,18 +916,27 @@ class Game(Page):
                 self.player2.draw(self.screen, self.player.offset_camera)
         
         draw_players()
+        profiler.lap("player draw")
         
         # Wave
         self.current_wave.draw(self.screen, self.player.offset_camera)
+        profiler.lap("enemies draw")
         # bullets
+        _view = game_controller.get_view_rect(self.player.offset_camera)
         for b in self.bullets_group:
-            b.draw(self.screen, self.player.offset_camera)
+            if _view.colliderect(b.get_draw_rect()):
+                b.draw(self.screen, self.player.offset_camera)
+                profiler.count("bullets drawn")
+            else:
+                profiler.count("bullets culled")
+        profiler.lap("bullets draw")
             
         #ui
         if self.game_over_time == None:
             self.draw_ui()
+            profiler.lap("hud")
         else:
-            panel_color = mc.fade_in_color(colors.BLACK, 255, self.game_over_time, self.game_over_time + datetime.timedelta(milliseconds=3000))
+            panel_color = mc.fade_in_color(colors.BLACK, 255, self.game_over_time, self.game_over_time + 3000)
             panel_surface = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
             panel_surface.fill(panel_color)
             self.screen.blit(panel_surface, (0,0))
@@ -898,8 +964,9 @@ class Game(Page):
         for o in self.test_objects:
             o.draw(self.screen, self.player.offset_camera)
         
+        _view = game_controller.get_view_rect(self.player.offset_camera)
         for e in self.current_wave.enemies_group.sprites():
-            if e.hit_rectangle != None:
+            if e.hit_rectangle != None and _view.colliderect(e.hit_rectangle.rect):
                 e.hit_rectangle.draw(self.screen, self.player.offset_camera)
         
         
\ No newline at end of file
@@ -0,0 +1,125 @@
+import os, random, time
+import pygame
+
+from domain.services import game_clock, menu_controller as mc, profiler
+from domain.utils import enums
+
+FRAME_MS = 1000 / 60
+"""The duration of a frame when `menu_controller.dt` is 1."""
+
+def init_display(size = (900, 600)):
+    """Initializes pygame with the dummy video and audio drivers, so the game can run without a window or a sound card.
+
+    Args:
+        size (tuple[int, int], optional): The size of the off-screen display. Defaults to (900, 600), the same as the main menu.
+
+    Returns:
+        pygame.Surface: The off-screen display surface.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.pre_init(44100, -16, 16, 500)
+    pygame.init()
+    return pygame.display.set_mode(size)
+
+class HeadlessRunner:
+    """Steps a single player game at a fixed timestep, without drawing, as fast as the CPU allows.
+
+    The random generator is seeded and the game clock is driven by the simulated time, so runs with the same seed are reproducible.
+    """
+    def __init__(self, **kwargs):
+        self.seed = kwargs.pop("seed", 0)
+        """The seed of the random generator."""
+        self.dt = kwargs.pop("dt", 1)
+        """The fixed value of `menu_controller.dt` for each step. 1 is a 60 fps frame."""
+        self.screen_size = kwargs.pop("screen_size", (900, 600))
+        """The size of the off-screen display."""
+        self.on_step = kwargs.pop("on_step", None)
+        """A function called with the runner before each step, to script inputs such as `game.pressed_keys`."""
+
+        self.time_ms = 0
+        """The simulated time since the runner started."""
+        self.frame = 0
+        """The number of steps run so far."""
+        self.update_time_s = 0
+        """The real time spent inside `Game.update`."""
+        self.game = None
+
+    def setup(self):
+        """Creates the game and waits for the first wave to load."""
+        # the game modules build fonts and surfaces on import, so they can only be loaded after pygame is initialized
+        from domain.engine.game import Game
+
+        random.seed(self.seed)
+        game_clock.set_source(lambda: self.time_ms / 1000)
+        _screen = init_display(self.screen_size)
+
+        self.game = Game(enums.ClientType.SINGLE, _screen)
+        mc.pages_history.append(self.game)
+        self.game.setup()
+        self.wait_loaded()
+
+    def wait_loaded(self):
+        """Blocks until the assets of the current wave are decoded by the loading threads and converted."""
+        while self.game.current_wave.started and not self.game.current_wave.check_loaded():
+            self.game.assets_manager.convert_step()
+            time.sleep(0.001)
+
+    def step(self):
+        """Runs a single frame of game logic."""
+        if self.on_step != None:
+            self.on_step(self)
+
+        mc.dt = self.dt
+        profiler.begin_frame()
+        _start = time.perf_counter()
+        self.game.update(events = [])
+        profiler.lap("update")
+        mc.popup_group.update()
+        profiler.lap("popups")
+        self.update_time_s += time.perf_counter() - _start
+        profiler.end_frame()
+
+        self.time_ms += self.dt * FRAME_MS
+        self.frame += 1
+
+    def run(self, frames: int):
+        """Runs the specified number of frames, or until the player dies.
+
+        Args:
+            frames (int): The maximum number of steps.
+
+        Returns:
+            int: The number of steps actually run.
+        """
+        for i in range(frames):
+            if not self.game.player.is_alive:
+                return i
+            self.step()
+        return frames
+
+    def run_wave(self, max_frames: int = 60 * 60 * 10):
+        """Runs the current wave until it ends, then skips the wave summary and starts the next one.
+
+        Args:
+            max_frames (int, optional): The maximum number of steps before giving up. Defaults to 10 simulated minutes.
+
+        Returns:
+            bool: If the wave was finished.
+        """
+        for _ in range(max_frames):
+            if not self.game.player.is_alive:
+                return False
+            if self.game.wave_summary != None:
+                self.game.next_wave()
+                self.wait_loaded()
+                return True
+            self.step()
+        return False
+
+    def close(self):
+        """Restores the real game clock and quits pygame."""
+        game_clock.reset_source()
+        if self.game in mc.pages_history:
+            mc.pages_history.remove(self.game)
+        pygame.quit()
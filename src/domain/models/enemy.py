@@ -1,12 +1,16 @@
-import pygame, datetime, random
+import pygame, random
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, enums, constants, math_utillity as math
-from domain.services import game_controller, menu_controller as mc, resources, assets_manager
+from domain.services import game_controller, menu_controller as mc, resources, assets_manager, game_clock
 from domain.models.progress_bar import ProgressBar
-from domain.models.ui.popup_text import Popup
+from domain.models.ui.popup_text import popup_pool, MAX_POOLED_POPUPS
 from domain.models.rectangle_sprite import Rectangle
+from domain.models.hitbox import Hitbox
+from domain.models.interpolation_buffer import InterpolationBuffer
 
+DAMAGE_POPUP_MERGE_MS = 300
+"""Hits on the same enemy within this time of the previous one are added to the damage number already on screen."""
 
 
 class Enemy(pygame.sprite.Sprite):
@@ -33,9 +37,18 @@ class Enemy(pygame.sprite.Sprite):
 
         self.killer = 0
         self.headshot_kill = False
-        self.death_time: datetime.datetime = None
+        self.death_time: float = None
         self.fade_out_ms = 1000
         self.image_alpha = 255
+        self.damage_popup = None
+        """The last damage number shown for this enemy, that new hits may be added to."""
+        self.damage_popup_value = 0
+        """The total damage shown in `damage_popup`."""
+        self.last_damage_popup_time: float = None
+        self.faded_image: pygame.Surface = None
+        """The copy of the current frame with `image_alpha` applied, while fading out."""
+        self.faded_source: pygame.Surface = None
+        """The frame that `faded_image` was copied from."""
         self.death_callback: function = kwargs.pop("death_callback", None)
         
         self.pos: vec = vec((pos))
@@ -58,7 +71,7 @@ class Enemy(pygame.sprite.Sprite):
         self.dying = False
         self.death_frame = 0
         
-        self.image = game_controller.scale_image(pygame.image.load(resources.get_enemy_path(self.enemy_name, enums.AnimActions.IDLE)), self.image_scale, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.image = game_controller.load_image(resources.get_enemy_path(self.enemy_name, enums.AnimActions.IDLE), self.image_scale, enums.ConvertType.CONVERT_ALPHA)
         self.size = self.image.get_size()
         
         self.attack_start_sounds: list[pygame.mixer.Sound] = None
@@ -71,6 +84,9 @@ class Enemy(pygame.sprite.Sprite):
         
         self.last_rect = self.rect.copy()
         
+        self.net_buffer = InterpolationBuffer()
+        """The positions received from the host, when this is a guest."""
+        
         self.hitbox_body: Rectangle = Rectangle(self.rect.size, self.rect.topleft, owner = self)
         self.hitbox_head: Rectangle = None
         
@@ -93,6 +109,11 @@ class Enemy(pygame.sprite.Sprite):
         self.rect.topleft = (self.pos.x, self.pos.y)
     
     def client_update(self, **kwargs):
+        _pos = self.net_buffer.sample(game_controller.net_time_ms())
+        if _pos != None:
+            self.pos = _pos
+            self.update_rect()
+        
         if not self.is_alive or self.dying:
             return
             
@@ -101,7 +122,7 @@ class Enemy(pygame.sprite.Sprite):
         player_center: vec = vec(player.rect.center)
         
         def flip():
-            self.image = pygame.transform.flip(self.image, True, False)
+            self.image = self.assets_manager.get_mirror(self.image)
             
         if self.last_frame_dir.x > self.dir.x:
             flip()
@@ -122,7 +143,7 @@ class Enemy(pygame.sprite.Sprite):
         player_center: vec = vec(player.rect.center)
         
         def flip():
-            self.image = pygame.transform.flip(self.image, True, False)
+            self.image = self.assets_manager.get_mirror(self.image)
             self.last_frame_dir = self.dir.copy()
             self.speed.x = 0
         
@@ -195,10 +216,7 @@ class Enemy(pygame.sprite.Sprite):
 
        
     def draw(self, surface: pygame.Surface, offset: vec):
-        _result = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-        _result.blit(self.image, (0,0))
-        _result.set_alpha(self.image_alpha)
-        surface.blit(_result, self.pos - offset)
+        surface.blit(self.get_faded_image(), self.pos - offset)
         
         # self.blit_debug = True
         # pygame.draw.rect(surface, colors.BLUE, math.rect_offset(self.rect, -offset), 1)
@@ -206,10 +224,8 @@ class Enemy(pygame.sprite.Sprite):
 
 
         self.health_bar.rect.center = vec(self.rect.centerx, self.rect.top - 15) - offset
-        _result_health_bar = pygame.Surface(self.health_bar.image.get_size(), pygame.SRCALPHA)
-        _result_health_bar.blit(self.health_bar.image, (0,0))
-        self.health_bar.image = _result_health_bar
-        self.health_bar.image.set_alpha(self.image_alpha)
+        if self.health_bar.image.get_alpha() != self.image_alpha:
+            self.health_bar.image.set_alpha(self.image_alpha)
         self.health_bar.draw(surface, vec(0,0))
         
         if self.blit_debug:
@@ -221,6 +237,37 @@ class Enemy(pygame.sprite.Sprite):
         self.player_offset = offset
         
         
+    def get_faded_image(self):
+        """Gets the current frame with the death fade applied.
+
+        The frames are shared by all the enemies of the same type, so the alpha is applied to a copy, that is only
+        recreated when the frame changes.
+
+        Returns:
+            pygame.Surface: The frame itself if fully opaque, otherwise the faded copy.
+        """
+        if self.image_alpha >= 255:
+            return self.image
+        if self.faded_source is not self.image:
+            self.faded_source = self.image
+            self.faded_image = self.image.copy()
+        self.faded_image.set_alpha(self.image_alpha)
+        return self.faded_image
+    
+    def get_frame(self, frames: list[pygame.Surface], index: float, mirrored = False):
+        """Gets a frame of an animation, already scaled to `image_scale`.
+
+        Args:
+            frames (list[pygame.Surface]): The loaded frames of the animation.
+            index (float): The current frame index of the animation.
+            mirrored (bool, optional): If the mirrored frame should be returned. Defaults to False.
+
+        Returns:
+            pygame.Surface: The shared frame. It must not be modified.
+        """
+        _frames, _mirrored_frames = self.assets_manager.get_frame_set(frames, self.image_scale)
+        return (_mirrored_frames if mirrored else _frames)[int(index)]
+    
     def get_frames(self, anim_action: enums.AnimActions):
         match anim_action:
             case enums.AnimActions.RUN:
@@ -250,7 +297,7 @@ class Enemy(pygame.sprite.Sprite):
                 return self.assets_manager.get_assets(self.enemy_name, str(anim_action))
 
     def fade_out_anim(self):
-        anim_end = (self.death_time + datetime.timedelta(milliseconds=self.fade_out_ms))
+        anim_end = (self.death_time + self.fade_out_ms)
         
         self.image_alpha = mc.fade_out_color(colors.WHITE, 255, self.death_time, anim_end)[3]
 
@@ -316,12 +363,39 @@ class Enemy(pygame.sprite.Sprite):
             self.headshot_kill = head_shot
             
                 
-        _popup_args = constants.POPUPS["damage"].copy()
-        if head_shot:
-            _popup_args["text_color"] = colors.YELLOW
-            
-        mc.popup(Popup(f'-{round(value,2)}', self.pos + vec(self.rect.width / 2 - 20,-30) - self.player_offset, **_popup_args))
+        self.show_damage_popup(value, head_shot)
         return not self.is_alive
+    
+    def show_damage_popup(self, value: float, head_shot = False):
+        """Shows the damage taken above the enemy. Hits within `DAMAGE_POPUP_MERGE_MS` of the previous one are added to the
+        number already on screen, so a shotgun blast or a splash shows a single rolling number.
+
+        Args:
+            value (float): The damage taken.
+            head_shot (bool, optional): If the hit was a headshot, shown in yellow. Defaults to False.
+        """
+        _now = game_clock.now_ms()
+        _pos = self.pos + vec(self.rect.width / 2 - 20,-30) - self.player_offset
+        _name = f'damage_{self.id}'
+        _popup = self.damage_popup
+        
+        # the popup may have been killed and reused by another enemy, so the name is checked too
+        if _popup != None and _popup.alive() and _popup.name == _name and _now - self.last_damage_popup_time <= DAMAGE_POPUP_MERGE_MS:
+            self.damage_popup_value += value
+            _popup.set_text(f'-{round(self.damage_popup_value,2)}')
+            if head_shot:
+                _popup.text_color = colors.YELLOW
+            _popup.restart(_pos)
+        elif popup_pool.active_count < MAX_POOLED_POPUPS:
+            _popup_args = constants.POPUPS["damage"].copy()
+            if head_shot:
+                _popup_args["text_color"] = colors.YELLOW
+            self.damage_popup = popup_pool.acquire(f'-{round(value,2)}', _pos, name = _name, **_popup_args)
+            self.damage_popup_value = value
+            mc.popup(self.damage_popup)
+        else:
+            return
+        self.last_damage_popup_time = _now
 
 
     def get_health(self, value: float):
@@ -331,7 +405,9 @@ class Enemy(pygame.sprite.Sprite):
         self.health = math.clamp(self.health + value, 0, self.health_bar.max_value)
         
         self.health_bar.add_value(value)
-        mc.popup(Popup(f'+{value}', self.pos + vec(self.rect.width / 2 - 20,-30) - self.player_offset, **constants.POPUPS["health"]))
+        if popup_pool.active_count >= MAX_POOLED_POPUPS:
+            return
+        mc.popup(popup_pool.acquire(f'+{value}', self.pos + vec(self.rect.width / 2 - 20,-30) - self.player_offset, **constants.POPUPS["health"]))
         
       
     
@@ -362,13 +438,30 @@ class Enemy(pygame.sprite.Sprite):
         }
         return values
     
-    def load_netdata(self, data: dict):
+    def load_netdata(self, data: dict, **kwargs):
+        """Loads the state received from the host.
+
+        Args:
+            data (dict): The values returned by `get_netdata` on the host.
+            remote_time_ms (float, optional): The host time when the state was captured. If specified, the position is interpolated by `client_update` instead of applied right away.
+            local_time_ms (float, optional): The local time when the state was received.
+        """
+        remote_time_ms = kwargs.pop("remote_time_ms", None)
+        local_time_ms = kwargs.pop("local_time_ms", None)
+        
         self.enemy_name = enums.Enemies[data.pop("enemy_name", str(enums.Enemies.Z_ROGER.name))]
-        self.rect = pygame.Rect(data.pop("rect", (0,0, 1,1)))
+        _rect = pygame.Rect(data.pop("rect", (0,0, 1,1)))
         self.speed = vec(data.pop("speed", (0,0)))
         self.acceleration = vec(data.pop("acceleration", (0,0)))
         self.dir = vec(data.pop("dir", (0,0)))
-        self.pos = vec(data.pop("pos", (0,0)))
+        _pos = vec(data.pop("pos", (0,0)))
+        
+        if remote_time_ms == None:
+            self.rect = _rect
+            self.pos = _pos
+        else:
+            self.rect.size = _rect.size
+            self.net_buffer.push(remote_time_ms, _pos, self.speed, local_time_ms)
         
         
         _health = data.pop("health", 0)
@@ -387,10 +480,22 @@ class Enemy(pygame.sprite.Sprite):
         for item, value in data.items():
             setattr(self, item, value)
     
+    def set_hit_rectangle(self, size, pos):
+        """Places the attack area of the enemy, reusing the same hitbox across attacks.
+
+        Args:
+            size (tuple[float, float]): The size of the attack area.
+            pos (tuple[float, float]): The position of the top-left corner of the attack area.
+        """
+        if self.hit_rectangle == None:
+            self.hit_rectangle = Hitbox(size, pos)
+        else:
+            self.hit_rectangle.set(size, pos)
+    
     def attack_collision(self, obj):
         _hit_targets = []
         for group in self.attack_targets:
-            collisions = pygame.sprite.spritecollide(obj, group, False)
+            collisions = game_controller.spritecollide(obj, group)
             if collisions:
                 _hit_targets.extend([*collisions])
         return _hit_targets
\ No newline at end of file
@@ -0,0 +1,60 @@
+import pygame
+from pygame.math import Vector2 as vec
+
+from domain.utils import colors
+
+class Hitbox:
+    """A lightweight collision area, with no image, meant to be updated in place instead of recreated every frame.
+
+    It has the `rect` and `radius` that `pygame.sprite.spritecollide` and `pygame.sprite.collide_circle` expect from a sprite,
+    so it can be tested against sprite groups, but it can't be added to one.
+    """
+    __slots__ = ("rect", "radius", "border_color")
+
+    def __init__(self, size = (0,0), pos = (0,0), **kwargs):
+        self.rect = pygame.Rect(pos, size)
+        """The area of the hitbox."""
+
+        self.radius = kwargs.pop("radius", 0)
+        """The radius used by `pygame.sprite.collide_circle`."""
+
+        self.border_color = kwargs.pop("border_color", colors.RED)
+        """The color of the outline drawn for debugging."""
+
+    def set(self, size, pos):
+        """Moves and resizes the hitbox.
+
+        Args:
+            size (tuple[float, float]): The new size.
+            pos (tuple[float, float]): The new position of the top-left corner.
+
+        Returns:
+            Hitbox: This same hitbox.
+        """
+        self.rect.size = size
+        self.rect.topleft = pos
+        return self
+
+    def set_circle(self, radius: float, center):
+        """Turns the hitbox into the bounding square of a circle, for `pygame.sprite.collide_circle`.
+
+        Args:
+            radius (float): The radius of the circle.
+            center (tuple[float, float]): The center of the circle.
+
+        Returns:
+            Hitbox: This same hitbox.
+        """
+        self.radius = radius
+        self.rect.size = (radius*2, radius*2)
+        self.rect.center = center
+        return self
+
+    def draw(self, surface: pygame.Surface, offset: vec):
+        """Draws the outline of the hitbox, for debugging only.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            offset (vec): The camera offset.
+        """
+        pygame.draw.rect(surface, self.border_color, self.rect.move(-offset.x, -offset.y), 1)
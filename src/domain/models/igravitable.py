@@ -1,21 +1,58 @@
 from pygame.math import Vector2 as vec
-import pygame
+import pygame, weakref
 
 class IGravitable:
     """Objects that are affected by the gravity.
     """
-    instances = []
+    _registry: weakref.WeakSet = weakref.WeakSet()
+    """The live gravitable objects. Objects are dropped as soon as they are garbage collected or unregistered."""
+
     def __init__(self):
-        self.__class__.instances.append(self)
-        
-    
+        IGravitable.register(self)
+
+    @staticmethod
+    def register(obj):
+        """Adds the object to the registry, so it's processed by the gravity.
+
+        Args:
+            obj (IGravitable): The object to register.
+        """
+        IGravitable._registry.add(obj)
+
+    @staticmethod
+    def unregister(obj):
+        """Removes the object from the registry, if present.
+
+        Args:
+            obj (IGravitable): The object to unregister.
+        """
+        IGravitable._registry.discard(obj)
+
+    @staticmethod
+    def instances():
+        """Gets the live objects that have gravity or collision enabled.
+
+        Returns:
+            list[IGravitable]: A snapshot of the active objects, safe to iterate while objects are created or collected.
+        """
+        return [obj for obj in list(IGravitable._registry) if obj.gravity_enabled or obj.collision_enabled]
+
+    @staticmethod
+    def count():
+        """Gets the number of live registered objects, regardless of their gravity and collision flags.
+
+        Returns:
+            int: The size of the registry.
+        """
+        return len(IGravitable._registry)
+
     speed: vec = vec(0,0)
     acceleration: vec = vec(0,0)
-    
+
     size = (10,10)
     rect = pygame.Rect((0,0), size)
     last_rect = rect.copy()
     gravity_scale = 1
-    
+
     gravity_enabled = True
-    collision_enabled = True
\ No newline at end of file
+    collision_enabled = True
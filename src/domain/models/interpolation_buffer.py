@@ -0,0 +1,109 @@
+import math
+from collections import deque
+from pygame.math import Vector2 as vec
+
+_FRAME_MS = 1000 / 60
+"""The duration of a frame when `menu_controller.dt` is 1, used to convert the speeds to pixels per millisecond."""
+
+class InterpolationBuffer:
+    """Timestamped positions received from the network, rendered a fixed delay behind the newest one so the motion is smooth between packets.
+
+    When no packet arrives for longer than the delay, the position is predicted from the last known speed, and the
+    difference to the corrected position is smoothed out over a few frames once the next packet arrives.
+    """
+    def __init__(self, **kwargs):
+        self.delay_ms = kwargs.pop("delay_ms", 100)
+        """How far behind the newest received state the entity is rendered."""
+        self.max_extrapolation_ms = kwargs.pop("max_extrapolation_ms", 200)
+        """For how long the position is predicted after the newest state, before the entity stops."""
+        self.correction_ms = kwargs.pop("correction_ms", 100)
+        """The time constant used to smooth out the prediction errors."""
+
+        self._states: deque[tuple[float, vec, vec]] = deque(maxlen=kwargs.pop("size", 32))
+        self._clock_offset: float = None
+        self._error = vec(0,0)
+        self._last_output: vec = None
+        self._last_sample_ms: float = None
+        self._last_render_ms: float = None
+        self._last_state_ms: float = None
+
+    def __len__(self):
+        return len(self._states)
+
+    def push(self, remote_time_ms: float, pos: vec, speed: vec, local_time_ms: float):
+        """Adds a received state to the buffer.
+
+        Args:
+            remote_time_ms (float): The time of the sender when the state was captured.
+            pos (vec): The position of the entity.
+            speed (vec): The speed of the entity, in pixels per frame.
+            local_time_ms (float): The local time when the state was received.
+        """
+        if len(self._states) > 0 and remote_time_ms <= self._states[-1][0]:
+            return
+
+        # the fastest packet gives the best estimate of the clocks difference, drifting slowly to follow slower networks
+        _offset = local_time_ms - remote_time_ms
+        if self._clock_offset == None or _offset < self._clock_offset:
+            self._clock_offset = _offset
+        else:
+            self._clock_offset += (_offset - self._clock_offset) * 0.01
+
+        self._states.append((remote_time_ms, vec(pos), vec(speed)))
+
+    def sample(self, local_time_ms: float):
+        """Gets the position of the entity at the specified local time.
+
+        Args:
+            local_time_ms (float): The current local time.
+
+        Returns:
+            vec | None: The interpolated or predicted position, or None if nothing was received yet.
+        """
+        if len(self._states) == 0:
+            return None
+
+        _render_time = local_time_ms - self._clock_offset - self.delay_ms
+
+        # a new state only moves the target if the last output was predicted past the newest state, so the previous
+        # render time is sampled again with it, and just that jump is smoothed out
+        if self._states[-1][0] != self._last_state_ms and self._last_output != None:
+            self._error = self._last_output - self._target(self._last_render_ms)
+        self._last_state_ms = self._states[-1][0]
+        _target = self._target(_render_time)
+
+        if self._last_sample_ms != None and self._error.length_squared() > 0:
+            self._error *= math.exp(-(local_time_ms - self._last_sample_ms) / self.correction_ms)
+            if self._error.length_squared() < 0.01:
+                self._error = vec(0,0)
+        self._last_sample_ms = local_time_ms
+        self._last_render_ms = _render_time
+
+        self._last_output = _target + self._error
+        return self._last_output
+
+    def _target(self, render_time: float):
+        _oldest = self._states[0]
+        if render_time <= _oldest[0]:
+            return vec(_oldest[1])
+
+        _newest = self._states[-1]
+        if render_time >= _newest[0]:
+            _elapsed = min(render_time - _newest[0], self.max_extrapolation_ms)
+            return _newest[1] + _newest[2] * (_elapsed / _FRAME_MS)
+
+        while len(self._states) > 2 and self._states[1][0] <= render_time:
+            self._states.popleft()
+
+        _from, _to = self._states[0], self._states[1]
+        _t = (render_time - _from[0]) / (_to[0] - _from[0])
+        return _from[1].lerp(_to[1], _t)
+
+    def clear(self):
+        self._states.clear()
+        self._clock_offset = None
+        self._error = vec(0,0)
+        self._last_output = None
+        self._last_sample_ms = None
+        self._last_render_ms = None
+        self._last_state_ms = None
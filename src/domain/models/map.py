@@ -13,7 +13,7 @@ class Map(pygame.sprite.Sprite):
         self.floor_y = kwargs.pop("floor_y", 20)
         """The vertical distance from the bottom of the screen to the map floor.""" 
         
-        self.image = game_controller.scale_image(pygame.image.load(image), 1.5, convert_type=enums.ConvertType.CONVERT)
+        self.image = game_controller.load_processed_image(image, 1.5, enums.ConvertType.CONVERT)
         """The map image/surface.""" 
         
         self.size = self.image.get_size()
@@ -1,111 +1,434 @@
-import ast
-from pygame.math import Vector2 as vec
+import struct, threading
+from collections import OrderedDict
+from enum import Enum
 
-from domain.models.enemy import Enemy
-from domain.content.weapons.projectile import Projectile
-from domain.models.wave_result import WaveResult
 from domain.utils import enums
-from domain.services import game_controller
+
+PROTOCOL_VERSION = 3
+"""The version of the binary layout below. Must be increased whenever any schema changes, so older clients reject the packets."""
+
+MAX_PACKET_SIZE = 65507
+"""The maximum payload of a UDP datagram, used as the receiving buffer size."""
+
+KEYFRAME_INTERVAL = 100
+"""Every how many packets the entities are sent in full instead of as deltas."""
+
+_MAGIC = b'NZ'
+_HEADER = struct.Struct('<2sBII')
+_COUNT = struct.Struct('<H')
+_SEQUENCE = struct.Struct('<I')
+_RECORD = struct.Struct('<II')
+
+PLAYER_SCHEMA = [
+    ("time_ms", "d"),
+    ("net_id", "B"),
+    ("command_id", "B"),
+    ("player_rect", "4i"),
+    ("player_last_rect", "4i"),
+    ("player_speed", "2f"),
+    ("player_acceleration", "2f"),
+    ("player_health", "f"),
+    ("player2_score", "f"),
+    ("player_wave_ready", "?"),
+    ("player_turning_dir", "b"),
+    ("player_jumping", "?"),
+    ("player_running", "?"),
+    ("player_falling_ground", "?"),
+    ("player_firing", "?"),
+    ("player_mouse_pos", "2h"),
+    ("player_aim_angle", "f"),
+]
+"""The fields of the player state, sent once per packet."""
+
+ENEMY_SCHEMA = [
+    ("id", "I"),
+    ("name", "16p"),
+    ("enemy_name", "B", enums.Enemies),
+    ("image_scale", "f"),
+    ("rect", "4i"),
+    ("is_alive", "?"),
+    ("health", "f"),
+    ("pos", "2f"),
+    ("jump_force", "f"),
+    ("damage", "f"),
+    ("movement_speed", "f"),
+    ("speed", "2f"),
+    ("acceleration", "2f"),
+    ("dir", "2f"),
+    ("running", "?"),
+    ("attacking", "?"),
+    ("grounded", "?"),
+    ("dying", "?"),
+]
+"""The fields of each enemy, matching `Enemy.get_netdata()`."""
+
+BULLET_SCHEMA = [
+    ("id", "I"),
+    ("owner", "B"),
+    ("angle", "f"),
+    ("rect", "4i"),
+    ("speed", "f"),
+    ("damage", "f"),
+    ("bullet_type", "B", enums.BulletType),
+]
+"""The fields of each bullet, matching `Projectile.get_netdata()`."""
+
+WAVE_RESULT_SCHEMA = [
+    ("player_character", "B", enums.Characters),
+    ("wave_number", "H"),
+    ("score", "f"),
+    ("money", "f"),
+    ("kills_count", "H"),
+    ("headshot_kills_count", "H"),
+    ("wave_interval_s", "f"),
+]
+"""The fields of each wave result, matching `WaveResult.get_netdata()`."""
+
+
+class Codec:
+    """Packs and unpacks dictionaries to fixed size binary records, following a schema.
+
+    Each schema entry is a tuple of (key, struct format) or (key, struct format, Enum type). Enum fields
+    are sent as the member index and exchanged with the rest of the game as the member name. String fields
+    raise ValueError when the encoded value doesn't fit, instead of being silently truncated by struct.
+    """
+    def __init__(self, schema: list[tuple]):
+        self.schema = schema
+        self.struct = struct.Struct('<' + ''.join(field[1] for field in schema))
+        self.size = self.struct.size
+        self.keys = [field[0] for field in schema]
+        self.full_mask = (1 << len(schema)) - 1
+
+        self._lengths = []
+        self._max_bytes = {}
+        """The maximum encoded size of each string field, by index. Pascal strings ('p') use one of the bytes for the length."""
+        for i, field in enumerate(schema):
+            _format = field[1]
+            self._lengths.append(int(_format[:-1]) if len(_format) > 1 and _format[-1] not in 'sp' else 1)
+            if _format[-1] in 'sp':
+                self._max_bytes[i] = struct.calcsize(_format) - (1 if _format[-1] == 'p' else 0)
+
+        self._field_structs = [struct.Struct('<' + field[1]) for field in schema]
+        self._enum_members = {field[0]: list(field[2]) for field in schema if len(field) > 2}
+
+    def _flatten(self, index: int, val):
+        field = self.schema[index]
+        key = field[0]
+        if key in self._enum_members:
+            if not isinstance(val, Enum):
+                val = field[2][val]
+            return (self._enum_members[key].index(val),)
+        elif field[1][-1] in 'sp':
+            _data = str(val).encode('utf-8')
+            if len(_data) > self._max_bytes[index]:
+                raise ValueError(f'"{key}" is longer than {self._max_bytes[index]} bytes: {val}')
+            return (_data,)
+        elif self._lengths[index] > 1:
+            return tuple(val)
+        return (val,)
+
+    def _restore(self, index: int, flat: tuple):
+        field = self.schema[index]
+        key = field[0]
+        if key in self._enum_members:
+            return self._enum_members[key][flat[0]].name
+        elif field[1][-1] in 'sp':
+            return flat[0].decode('utf-8')
+        elif self._lengths[index] > 1:
+            return flat
+        return flat[0]
+
+    def pack(self, values: dict):
+        flat = []
+        for i, key in enumerate(self.keys):
+            flat.extend(self._flatten(i, values[key]))
+        return self.struct.pack(*flat)
+
+    def unpack_from(self, buff: bytes, offset: int = 0):
+        flat = self.struct.unpack_from(buff, offset)
+        result = {}
+        f = 0
+        for i, key in enumerate(self.keys):
+            length = self._lengths[i]
+            result[key] = self._restore(i, flat[f:f+length])
+            f += length
+        return result
+
+    def pack_list(self, items: list[dict]):
+        return _COUNT.pack(len(items)) + b''.join(self.pack(item) for item in items)
+
+    def unpack_list(self, buff: bytes, offset: int):
+        count = _COUNT.unpack_from(buff, offset)[0]
+        offset += _COUNT.size
+        items = []
+        for _ in range(count):
+            items.append(self.unpack_from(buff, offset))
+            offset += self.size
+        return items, offset
+
+    def changed_mask(self, values: dict, baseline: dict):
+        """Gets a bitmask of the fields that differ between `values` and `baseline`, where bit `i` is the i-th schema field."""
+        mask = 0
+        for i, key in enumerate(self.keys):
+            if values[key] != baseline[key]:
+                mask |= 1 << i
+        return mask
+
+    def pack_fields(self, values: dict, mask: int):
+        """Packs only the fields flagged in `mask`."""
+        return b''.join(self._field_structs[i].pack(*self._flatten(i, values[key])) for i, key in enumerate(self.keys) if mask & (1 << i))
+
+    def unpack_fields(self, buff: bytes, offset: int, mask: int, into: dict):
+        """Unpacks the fields flagged in `mask` into the `into` dictionary.
+
+        Returns:
+            int: The offset right after the unpacked fields.
+        """
+        for i, key in enumerate(self.keys):
+            if mask & (1 << i):
+                into[key] = self._restore(i, self._field_structs[i].unpack_from(buff, offset))
+                offset += self._field_structs[i].size
+        return offset
+
+
+_player_codec = Codec(PLAYER_SCHEMA)
+_enemy_codec = Codec(ENEMY_SCHEMA)
+_bullet_codec = Codec(BULLET_SCHEMA)
+_wave_result_codec = Codec(WAVE_RESULT_SCHEMA)
+
+
+class DeltaStream:
+    """Replicates a list of entities (dictionaries with an unique "id") as deltas against the last snapshot acknowledged by the peer.
+
+    Each written stream contains the sequence of its baseline (0 for a keyframe), the spawned and changed entities with a bitmask
+    of the fields that were sent, and the ids of the entities that were removed since the baseline.
+    """
+    def __init__(self, codec: Codec, **kwargs):
+        self.codec = codec
+        self.keyframe_interval = kwargs.pop("keyframe_interval", KEYFRAME_INTERVAL)
+        """Every how many packets a full snapshot is sent, so the peer recovers from any inconsistency."""
+        self.history_size = kwargs.pop("history_size", 64)
+        """How many snapshots are kept waiting for acknowledgement."""
+
+        self._sent: OrderedDict[int, dict[int, dict]] = OrderedDict()
+        self._acked_sequence = 0
+        self._received: OrderedDict[int, dict[int, dict]] = OrderedDict()
+
+    def ack(self, sequence: int):
+        """Marks the snapshot sent with `sequence` as received by the peer, discarding the older ones."""
+        if sequence <= self._acked_sequence or sequence not in self._sent:
+            return
+        self._acked_sequence = sequence
+        while next(iter(self._sent)) < sequence:
+            self._sent.popitem(last=False)
+
+    def write(self, sequence: int, items: list[dict]):
+        """Encodes the entities as a delta against the last acknowledged snapshot.
+
+        Args:
+            sequence (int): The sequence of the packet being written.
+            items (list[dict]): The current state of every entity.
+
+        Returns:
+            bytes: The encoded stream.
+        """
+        snapshot = {item["id"]: item for item in items}
+
+        baseline_sequence = self._acked_sequence
+        if sequence % self.keyframe_interval == 0 or baseline_sequence not in self._sent:
+            baseline_sequence = 0
+        baseline = self._sent.get(baseline_sequence, {})
+
+        records = []
+        for _id, item in snapshot.items():
+            if _id in baseline:
+                mask = self.codec.changed_mask(item, baseline[_id])
+                if mask == 0:
+                    continue
+            else:
+                mask = self.codec.full_mask
+            records.append(_RECORD.pack(_id, mask) + self.codec.pack_fields(item, mask))
+        removed = [_id for _id in baseline.keys() if _id not in snapshot]
+
+        self._sent[sequence] = snapshot
+        if len(self._sent) > self.history_size:
+            self._sent.popitem(last=False)
+
+        return _SEQUENCE.pack(baseline_sequence) +\
+            _COUNT.pack(len(records)) + b''.join(records) +\
+            _COUNT.pack(len(removed)) + b''.join(_SEQUENCE.pack(_id) for _id in removed)
+
+    def read(self, buff: bytes, offset: int):
+        """Decodes a stream created by `write`, applying it over the referenced baseline.
+
+        Args:
+            buff (bytes): The received buffer.
+            offset (int): Where the stream starts in the buffer.
+
+        Returns:
+            tuple[dict[int, dict] | None, int]: The resulting snapshot (None if its baseline is no longer known) and the offset after the stream.
+        """
+        baseline_sequence = _SEQUENCE.unpack_from(buff, offset)[0]
+        offset += _SEQUENCE.size
+
+        baseline = None
+        if baseline_sequence == 0:
+            baseline = {}
+        elif baseline_sequence in self._received:
+            baseline = self._received[baseline_sequence]
+
+        snapshot = {} if baseline == None else {_id: dict(item) for _id, item in baseline.items()}
+
+        count = _COUNT.unpack_from(buff, offset)[0]
+        offset += _COUNT.size
+        for _ in range(count):
+            _id, mask = _RECORD.unpack_from(buff, offset)
+            offset += _RECORD.size
+            offset = self.codec.unpack_fields(buff, offset, mask, snapshot.setdefault(_id, {}))
+
+        count = _COUNT.unpack_from(buff, offset)[0]
+        offset += _COUNT.size
+        for _ in range(count):
+            snapshot.pop(_SEQUENCE.unpack_from(buff, offset)[0], None)
+            offset += _SEQUENCE.size
+
+        if baseline == None:
+            return None, offset
+        return snapshot, offset
+
+    def store(self, sequence: int, snapshot: dict[int, dict]):
+        """Keeps a snapshot returned by `read`, so the peer can use it as baseline."""
+        self._received[sequence] = snapshot
+        if len(self._received) > self.history_size:
+            self._received.popitem(last=False)
+
+
+class SnapshotBuffer:
+    """Hands the newest value produced by one thread to another thread, discarding the values that were replaced before being taken."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = None
+
+    def put(self, value):
+        with self._lock:
+            self._value = value
+
+    def take(self):
+        """Gets the newest value and empties the buffer.
+
+        Returns:
+            Any: The newest value, or None if nothing was put since the last call.
+        """
+        with self._lock:
+            value, self._value = self._value, None
+        return value
+
+
+class NetSession:
+    """The replication state of a connection with one peer."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        """Serializes the access of the sending and receiving threads to the delta streams."""
+        self.sequence = 0
+        """The sequence of the last packet sent."""
+        self.remote_sequence = 0
+        """The sequence of the last packet received and loaded."""
+        self.enemies = DeltaStream(_enemy_codec)
+        self.bullets = DeltaStream(_bullet_codec)
+
 
 class Data:
     def __init__(self, **kwargs):
         self.enemies = []
         self.bullets = []
         self.wave_results = kwargs.pop("wave_results", [])
-        
+
         self.player_rect = kwargs.pop("player_rect", (0,0, 1,1))
         self.player_speed = kwargs.pop("player_speed", (0,0))
         self.player_acceleration = kwargs.pop("player_acceleration", (0,0))
         self.player_last_rect = kwargs.pop("player_last_rect", self.player_rect)
         self.player_health = kwargs.pop("player_health", 0)
-        
+
         self.player2_score = kwargs.pop("player2_score", 0)
         self.player_wave_ready = kwargs.pop("player_wave_ready", False)
-        
+
         #animation
         self.player_turning_dir = kwargs.pop("player_turning_dir", 0)
         self.player_jumping = kwargs.pop("player_jumping", False)
         self.player_running = kwargs.pop("player_running", False)
         self.player_falling_ground = kwargs.pop("player_falling_ground", False)
         self.player_firing = kwargs.pop("player_firing", False)
-        
+
         self.player_mouse_pos = kwargs.pop("player_mouse_pos", (0,0))
         self.player_aim_angle = kwargs.pop("player_aim_angle", 0)
-        
+
         self.net_id = kwargs.pop("net_id", 0)
         self.command_id = kwargs.pop("command_id", 0)
         
-        
-        
-        if game_controller._enemy_netdata_keys == None:
-            game_controller._enemy_netdata_keys = list(Enemy((0,0),enums.Enemies.Z_ROGER, None).get_netdata().keys())
-        if game_controller._bullet_netdata_keys == None:
-            game_controller._bullet_netdata_keys = list(Projectile(vec(0,0),0,0,0,0,0).get_netdata().keys())
-        if game_controller._waveresult_netdata_keys == None:
-            game_controller._waveresult_netdata_keys = list(WaveResult().get_netdata().keys())
-    
-    def _get_values(self, val):
-        if type(val) == dict:
-            return self._get_values_dict(val)
-        elif type(val) == list:
-            return self._get_values_list(val)
-        else:
-            return val
-    
-    def _get_values_dict(self, source: dict):
-        result = []
-        for val in source.values():
-            result.append(self._get_values(val))
-        
-        return result
-    
-    def _get_values_list(self, source: list):
-        result = []
-        for val in source:
-            result.append(self._get_values(val))
-        
-        return result
-    
-    def _get_buffer(self):
-        result= []
-        attributes = [a for a in self.__dict__.keys() if not a.startswith('_')]
-        
-        for att in attributes:
-            val = getattr(self, att)
-            
-            result.append(self._get_values(val))
-        
-        return str(result).encode('utf-8')
-        
-    def _load_buffer(self, buff: bytes):
-        string = buff.decode('utf-8')
-        array: list = ast.literal_eval(string)
-        
-        attributes = [a for a in self.__dict__.keys() if not a.startswith('_')]
-        for i, att in enumerate(attributes):
-            if type(getattr(self, att)) != list:
-                setattr(self, att, array[i])
-        
-        self.enemies = []
-        self.bullets = []
-        self.wave_results = []
-            
-            
-        self.enemies = []
-        self.bullets = []
-        self.wave_results = []
-            
-        for i, enemy in enumerate(array[0]):
-            self.enemies.append({})
-            for v, en_val in enumerate(enemy):
-                self.enemies[i][game_controller._enemy_netdata_keys[v]] = en_val
-                
-        for i, bullet in enumerate(array[1]):
-            self.bullets.append({})
-            for v, b_val in enumerate(bullet):
-                self.bullets[i][game_controller._bullet_netdata_keys[v]] = b_val
-
-        for i, result in enumerate(array[2]):
-            self.wave_results.append({})
-            for v, res_val in enumerate(result):
-                self.wave_results[i][game_controller._waveresult_netdata_keys[v]] = res_val
\ No newline at end of file
+        self.time_ms = kwargs.pop("time_ms", 0)
+        """The time of the sender when this state was captured, used to interpolate the received positions."""
+
+    def _get_buffer(self, session: NetSession):
+        """Serializes this data to the binary wire format.
+
+        Args:
+            session (NetSession): The replication state of the connection this packet is going to be sent to.
+
+        Returns:
+            bytes: The header, followed by the player state, enemies, bullets and wave results.
+        """
+        with session.lock:
+            session.sequence += 1
+            return _HEADER.pack(_MAGIC, PROTOCOL_VERSION, session.sequence, session.remote_sequence) +\
+                _player_codec.pack(self.__dict__) +\
+                session.enemies.write(session.sequence, self.enemies) +\
+                session.bullets.write(session.sequence, self.bullets) +\
+                _wave_result_codec.pack_list(self.wave_results)
+
+    def _load_buffer(self, buff: bytes, session: NetSession):
+        """Loads the values of a buffer created by `_get_buffer` into this object.
+
+        Args:
+            buff (bytes): The received buffer.
+            session (NetSession): The replication state of the connection this packet came from.
+
+        Returns:
+            bool: False if the packet was ignored, because it's from another protocol version, arrived out of order, references an unknown baseline or is malformed.
+        """
+        if len(buff) < _HEADER.size:
+            return False
+        magic, version, sequence, ack = _HEADER.unpack_from(buff)
+        if magic != _MAGIC or version != PROTOCOL_VERSION:
+            return False
+
+        with session.lock:
+            if sequence <= session.remote_sequence:
+                return False
+
+            # nothing is committed to the session until the whole packet is decoded, so a truncated or foreign one is just dropped
+            try:
+                offset = _HEADER.size
+                player_values = _player_codec.unpack_from(buff, offset)
+                offset += _player_codec.size
+
+                enemies, offset = session.enemies.read(buff, offset)
+                bullets, offset = session.bullets.read(buff, offset)
+                if enemies == None or bullets == None:
+                    return False
+                wave_results, offset = _wave_result_codec.unpack_list(buff, offset)
+            except (struct.error, IndexError, ValueError):
+                return False
+
+            session.remote_sequence = sequence
+            session.enemies.ack(ack)
+            session.bullets.ack(ack)
+            session.enemies.store(sequence, enemies)
+            session.bullets.store(sequence, bullets)
+
+        for key, value in player_values.items():
+            setattr(self, key, value)
+        # the game pops values from these dictionaries, so it gets copies of the stored snapshots
+        self.enemies = [dict(e) for e in enemies.values()]
+        self.bullets = [dict(b) for b in bullets.values()]
+        self.wave_results = wave_results
+        return True
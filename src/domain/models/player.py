@@ -1,9 +1,9 @@
-import pygame, math as maths, datetime, random
+import pygame, math as maths, random
 
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, constants, enums, math_utillity as math
-from domain.services import game_controller, menu_controller as mc, resources
+from domain.services import game_controller, menu_controller as mc, resources, game_clock, asset_archive
 from domain.content.weapons.semi_auto import SemiAuto
 from domain.content.weapons.shotgun import Shotgun
 from domain.content.weapons.full_auto import FullAuto
@@ -14,7 +14,8 @@ from domain.models.weapon import Weapon
 from domain.models.progress_bar import ProgressBar
 from domain.models.rectangle_sprite import Rectangle
 from domain.models.backpack import BackPack
-from domain.models.ui.popup_text import Popup
+from domain.models.interpolation_buffer import InterpolationBuffer
+from domain.models.ui.popup_text import Popup, popup_pool
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, pos, character: enums.Characters, **kwargs):
@@ -44,7 +45,7 @@ class Player(pygame.sprite.Sprite):
         self.jump_stamina_drain = kwargs.pop("jump_stamina_drain", 4)
         self.attack_stamina_drain = kwargs.pop("attack_stamina_drain", 1)
         self.roll_stamina_drain = kwargs.pop("roll_stamina_drain", 3)
-        self.last_stamina_use = datetime.datetime.now()
+        self.last_stamina_use = game_clock.now_ms()
 
         self.score = 0
         """The amount of points of the player"""
@@ -72,7 +73,7 @@ class Player(pygame.sprite.Sprite):
         """If the player is touching the ground (or any jumpable object)."""
         self.image_scale = 2
         """How much the image will be scaled from original file."""
-        self.idle_frame = game_controller.scale_image(pygame.image.load(resources.get_character_path(self.character, enums.AnimActions.IDLE)), self.image_scale, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.idle_frame = game_controller.load_image(resources.get_character_path(self.character, enums.AnimActions.IDLE), self.image_scale, enums.ConvertType.CONVERT_ALPHA)
 
         self.image = self.idle_frame.copy()
         """The surface of the player."""
@@ -91,6 +92,9 @@ class Player(pygame.sprite.Sprite):
         self.player2_mouse_pos: vec = vec(0,0)
         """The mouse position of the other player."""
         self.player2_rect: pygame.Rect = pygame.Rect(0,0,1,1)
+        
+        self.net_buffer = InterpolationBuffer()
+        """The positions received from the network, when this is player 2."""
 
         self.upgrades_map: dict = kwargs.pop("upgrades_map", None)
         """Upgrades that the player bought for this character."""
@@ -107,14 +111,14 @@ class Player(pygame.sprite.Sprite):
         self.add_throwable(enums.Throwables.MOLOTOV, 3)
 
         """Time in milliseconds to wait since last weapon switch to be able to switch again."""
-        self.last_weapon_switch: datetime.datetime = datetime.datetime.now()
+        self.last_weapon_switch: float = game_clock.now_ms()
 
         self.turning_dir = 0
         """The directino that tha player is turning to (left: -1, right: 1)."""
         self.turning_frame = 0
         """The current frame index of the turning animation."""
         turn_folder = resources.get_character_path(self.character, enums.AnimActions.TURN)
-        self.turn_frames = game_controller.load_sprites(turn_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.turn_frames = game_controller.load_sprites(turn_folder, self.image_scale, enums.ConvertType.CONVERT_ALPHA)
         """The frames of the turning animation."""
 
         self.jumping_sideways = False
@@ -122,7 +126,7 @@ class Player(pygame.sprite.Sprite):
         self.jumping_frame = 0
         """The current frame index of the jumping animation."""
         jump_folder = resources.get_character_path(self.character, enums.AnimActions.JUMP)
-        self.jump_frames = game_controller.load_sprites(jump_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.jump_frames = game_controller.load_sprites(jump_folder, self.image_scale, enums.ConvertType.CONVERT_ALPHA)
         """The frames of the jumping animation."""
         self.jump_frames.append(self.jump_frames[-1])
         self.jumping = False
@@ -132,7 +136,7 @@ class Player(pygame.sprite.Sprite):
         self.running_frame = 0
         """The current frame index of the running animation."""
         run_folder = resources.get_character_path(self.character, enums.AnimActions.RUN)
-        self.run_frames = game_controller.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.run_frames = game_controller.load_sprites(run_folder, self.image_scale, enums.ConvertType.CONVERT_ALPHA)
         """The frames of the running animation."""
 
         self.rolling = False
@@ -140,9 +144,9 @@ class Player(pygame.sprite.Sprite):
         self.rolling_frame = 0
         """The current frame index of the rolling animation."""
         roll_folder = resources.get_character_path(self.character, enums.AnimActions.ROLL)
-        self.roll_frames = game_controller.load_sprites(roll_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.roll_frames = game_controller.load_sprites(roll_folder, self.image_scale, enums.ConvertType.CONVERT_ALPHA)
 
-        self.last_roll = datetime.datetime.now()
+        self.last_roll = game_clock.now_ms()
         self.roll_cooldown_ms = kwargs.pop("roll_cooldown_ms", 2000)
         self.rolling_forward = False
         self.friction_mutiplier = kwargs.pop("friction_mutiplier", 1)
@@ -154,7 +158,7 @@ class Player(pygame.sprite.Sprite):
         self.crouched_frame = 0
         """The current frame index of the rolling animation."""
         crouch_folder = resources.get_character_path(self.character, enums.AnimActions.CROUCH)
-        self.crouch_frames = game_controller.load_sprites(crouch_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.crouch_frames = game_controller.load_sprites(crouch_folder, self.image_scale, enums.ConvertType.CONVERT_ALPHA)
         self.raising = False
         self.crouch_step = 0
         self.crouch_distance_step = 6
@@ -165,8 +169,13 @@ class Player(pygame.sprite.Sprite):
         self.falling_ground_frame = 0
         """The current frame index of the falling ground animation."""
         fall_ground_folder = resources.get_character_path(self.character, enums.AnimActions.FALL_GROUND)
-        self.fall_ground_frames = game_controller.load_sprites(fall_ground_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.fall_ground_frames = game_controller.load_sprites(fall_ground_folder, self.image_scale, enums.ConvertType.CONVERT_ALPHA)
         """The frames of the falling ground animation."""
+        
+        self.mirrors: dict = {}
+        """The mirrored frames of the animations that depend on the facing direction, by frame, both ways."""
+        for _frames in [self.turn_frames, self.jump_frames, self.run_frames, self.roll_frames, self.crouch_frames]:
+            game_controller.mirror_frames(_frames, mirrors = self.mirrors)
 
         self.changing_weapon = False
         """If the weapon change animation is running."""
@@ -178,7 +187,7 @@ class Player(pygame.sprite.Sprite):
         """The current frame index of the gravestone blood dropping."""
         self.grave_blood_frames = game_controller.load_sprites(f'{resources.IMAGES_PATH}items\\grave_stone_blood', _grave_scale, enums.ConvertType.CONVERT_ALPHA)
         """The frames of the gravestone blood dropping animation."""
-        self.grave_stone_frame = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}items\\grave_stone.png'), _grave_scale, enums.ConvertType.CONVERT_ALPHA)
+        self.grave_stone_frame = game_controller.load_image(f'{resources.IMAGES_PATH}items\\grave_stone.png', _grave_scale, enums.ConvertType.CONVERT_ALPHA)
         """The gravestone image without blood."""
 
         self.health_bar: ProgressBar = None
@@ -200,8 +209,8 @@ class Player(pygame.sprite.Sprite):
         self.player2_offset = vec(0,0)
 
         self.is_player1 = self.name == "P1"
-        self.jump_sounds = pygame.mixer.Sound(resources.get_player_sfx(self.character, enums.AnimActions.JUMP))
-        self.fall_sound = pygame.mixer.Sound(resources.get_player_sfx(self.character, enums.AnimActions.FALL_GROUND))
+        self.jump_sounds = asset_archive.load_sound(resources.get_player_sfx(self.character, enums.AnimActions.JUMP))
+        self.fall_sound = asset_archive.load_sound(resources.get_player_sfx(self.character, enums.AnimActions.FALL_GROUND))
         self.damage_sounds = game_controller.load_sounds(resources.get_player_sfx(self.character, enums.AnimActions.TAKE_DAMAGE), 0.5)
 
         self.reload_popup: Popup = None
@@ -212,8 +221,8 @@ class Player(pygame.sprite.Sprite):
             self.health_bar = ProgressBar(self.max_health, pygame.Rect((self.rect.left, self.rect.top), (self.rect.width * 1.3, 8)), border_width = 1)
 
     def change_weapon(self, slot: int = None):
-        _now = datetime.datetime.now()
-        if self.last_weapon_switch + datetime.timedelta(milliseconds=self.current_weapon.weapon_switch_ms) > _now:
+        _now = game_clock.now_ms()
+        if self.last_weapon_switch + self.current_weapon.weapon_switch_ms > _now:
             return False
 
         if type(self.backpack.equipped_primary) != type(self.backpack.equipped_secondary):
@@ -282,7 +291,7 @@ class Player(pygame.sprite.Sprite):
             self.hitbox_body.update_pos()
 
         self.movement(game)
-        _now = datetime.datetime.now()
+        _now = game_clock.now_ms()
 
 
         if self.sprinting and not self.crouching and not self.rolling:
@@ -315,7 +324,7 @@ class Player(pygame.sprite.Sprite):
         else:
             self.friction_mutiplier = 1
 
-        if not self.sprinting and not self.jumping and not _attacking and _now > self.last_stamina_use + datetime.timedelta(milliseconds=self.stamina_regen_delay_ms) and not self.rolling:
+        if not self.sprinting and not self.jumping and not _attacking and _now > self.last_stamina_use + self.stamina_regen_delay_ms and not self.rolling:
             self.stamina_bar.add_value(self.stamina_regen_rate * mc.dt)
 
         self.stamina = self.stamina_bar.value
@@ -344,9 +353,9 @@ class Player(pygame.sprite.Sprite):
         #region Weapon Animation
 
         def flip():
-            self.current_weapon.current_frame = pygame.transform.flip(self.current_weapon.current_frame, False, True)
+            self.current_weapon.current_frame = self.current_weapon.get_mirror(self.current_weapon.current_frame)
             self.current_weapon.last_dir = self.current_weapon.dir
-            self.current_throwable.current_frame = pygame.transform.flip(self.current_throwable.current_frame, False, True)
+            self.current_throwable.current_frame = self.current_throwable.get_mirror(self.current_throwable.current_frame)
             self.current_throwable.last_dir = self.current_throwable.dir
 
         if game.focused:
@@ -568,7 +577,7 @@ class Player(pygame.sprite.Sprite):
         self.update_feet()
 
         if pygame.K_LCTRL in game.pressed_keys and self.stamina > self.roll_stamina_drain and self.grounded and not _collid_wall:
-            _now = datetime.datetime.now()
+            _now = game_clock.now_ms()
             
             if self.current_throwable.throwing or self.current_throwable.cook_start_time != None:
                 return
@@ -576,7 +585,7 @@ class Player(pygame.sprite.Sprite):
             if self.current_weapon.reloading:
                 return
 
-            if _now < self.last_roll + datetime.timedelta(milliseconds= self.roll_cooldown_ms):
+            if _now < self.last_roll + self.roll_cooldown_ms:
                 return
 
             if pressing_right and not pressing_left:
@@ -631,21 +640,35 @@ class Player(pygame.sprite.Sprite):
         
         return self.current_weapon.reload()
 
+    def get_frame(self, frames: list[pygame.Surface], index: float, mirrored = False):
+        """Gets a frame of an animation, or its mirror registered at load time.
+
+        Args:
+            frames (list[pygame.Surface]): The frames of the animation.
+            index (float): The current frame index of the animation.
+            mirrored (bool, optional): If the mirrored frame should be returned. Defaults to False.
+
+        Returns:
+            pygame.Surface: The shared frame. It must not be modified.
+        """
+        _frame = frames[int(index)]
+        if mirrored:
+            return game_controller.get_mirror(_frame, self.mirrors)
+        return _frame
+
     def turn_anim(self, speed: float):
         self.turning_frame = math.clamp(self.turning_frame + (speed * self.turning_dir), 0, len(self.turn_frames)-1)
 
         if self.turning_frame == len(self.turn_frames)-1:
             self.running = True if self.turning_dir != 0 else False
             self.turning_dir = 0
-        self.image = game_controller.scale_image(self.turn_frames[int(self.turning_frame)], self.image_scale)
-        if self.turning_dir > 0 and self.acceleration.x > 0 or\
-           self.turning_dir < 0 and self.acceleration.x < 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.turn_frames, self.turning_frame, self.turning_dir > 0 and self.acceleration.x > 0 or\
+                                    self.turning_dir < 0 and self.acceleration.x < 0)
 
     def change_weapon_anim(self):
-        now = datetime.datetime.now()
+        now = game_clock.now_ms()
         start = self.last_weapon_switch
-        end = self.last_weapon_switch + datetime.timedelta(milliseconds=self.current_weapon.weapon_switch_ms)
+        end = self.last_weapon_switch + self.current_weapon.weapon_switch_ms
 
         if end < now:
             self.changing_weapon = False
@@ -668,27 +691,23 @@ class Player(pygame.sprite.Sprite):
         if self.jumping_frame > len(self.jump_frames)-1:
             self.jumping_frame = 0
             self.jumping_sideways = False
-        self.image = game_controller.scale_image(self.jump_frames[int(self.jumping_frame)], self.image_scale)
-        if self.speed.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.jump_frames, self.jumping_frame, self.speed.x > 0)
         self.jumping_frame += speed
 
     def fall_ground_anim(self, speed: float):
         if self.falling_ground_frame > len(self.fall_ground_frames)-1:
-            self.image = game_controller.scale_image(self.fall_ground_frames[int(len(self.fall_ground_frames)-1)], self.image_scale)
+            self.image = self.fall_ground_frames[int(len(self.fall_ground_frames)-1)]
             self.falling_ground_frame = 0
             self.falling_ground = False
             return
-        self.image = game_controller.scale_image(self.fall_ground_frames[int(self.falling_ground_frame)], self.image_scale)
+        self.image = self.fall_ground_frames[int(self.falling_ground_frame)]
         self.falling_ground_frame += speed
 
     def run_anim(self, speed: float):
         self.running_frame += speed
         if self.running_frame > len(self.run_frames):
             self.running_frame = 0
-        self.image = game_controller.scale_image(self.run_frames[int(self.running_frame)], self.image_scale)
-        if self.speed.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.run_frames, self.running_frame, self.speed.x > 0)
 
     def crouch_anim(self, speed: float, reverse = False):
         if reverse:
@@ -707,9 +726,7 @@ class Player(pygame.sprite.Sprite):
                 self.image = self.idle_frame.copy()
             self.raising = False
             return
-        self.image = game_controller.scale_image(self.crouch_frames[int(self.crouched_frame)], self.image_scale)
-        if self.current_weapon.dir == 1:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.crouch_frames, self.crouched_frame, self.current_weapon.dir == 1)
 
     def roll_anim(self, speed: float):
         if int(self.rolling_frame) == 0 and self.crouching:
@@ -724,9 +741,7 @@ class Player(pygame.sprite.Sprite):
             self.rolling_frame = 0
             self.rolling = False
             self.rolling_forward = False
-        self.image = game_controller.scale_image(self.roll_frames[int(self.rolling_frame)], self.image_scale)
-        if self.speed.x > 0:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.get_frame(self.roll_frames, self.rolling_frame, self.speed.x > 0)
 
     def take_damage(self, value: float):
         if value < 0:
@@ -735,9 +750,9 @@ class Player(pygame.sprite.Sprite):
         self.health_bar.remove_value(value)
 
         if self.is_player1:
-            mc.popup(Popup(f'-{round(value,2)}', self.pos + vec(self.rect.width / 2 - 20,-30) - self.offset_camera, **constants.POPUPS["damage"]))
+            mc.popup(popup_pool.acquire(f'-{round(value,2)}', self.pos + vec(self.rect.width / 2 - 20,-30) - self.offset_camera, **constants.POPUPS["damage"]))
         else:
-            mc.popup(Popup(f'-{round(value,2)}', self.pos + vec(self.rect.width / 2 - 20,-30) - self.offset_camera - self.player2_offset, **constants.POPUPS["damage"]))
+            mc.popup(popup_pool.acquire(f'-{round(value,2)}', self.pos + vec(self.rect.width / 2 - 20,-30) - self.offset_camera - self.player2_offset, **constants.POPUPS["damage"]))
 
         rand_sound = random.randint(0, len(self.damage_sounds)-1)
         self.damage_sounds[rand_sound].play()
@@ -750,7 +765,7 @@ class Player(pygame.sprite.Sprite):
             return
         self.health = math.clamp(self.health + value, 0, self.health_bar.max_value)
         self.health_bar.add_value(value)
-        mc.popup(Popup(f'+{value}', self.pos + vec(self.rect.width / 2 - 20,-30) - self.offset_camera - self.player2_offset, **constants.POPUPS["health"]))
+        mc.popup(popup_pool.acquire(f'+{value}', self.pos + vec(self.rect.width / 2 - 20,-30) - self.offset_camera - self.player2_offset, **constants.POPUPS["health"]))
 
     def add_weapon(self, weapon_type: enums.Weapons, equip = True):
         existing_weapon = self.backpack.get_weapon(weapon_type)
@@ -41,6 +41,9 @@ class ProgressBar(pygame.sprite.Sprite):
         self.hide_on_full = kwargs.pop("hide_on_full", True)
         """If the bar should be hidden when it's value is at the maximum, to prevend overflow of healthbars."""
         
+        self.rendered_state: tuple = None
+        """The values the image was last drawn with. The image is only redrawn when they change."""
+        
         
         
     def set_rect(self, value: pygame.Rect):
@@ -51,6 +54,7 @@ class ProgressBar(pygame.sprite.Sprite):
         """        
         self.rect = value
         self.image = pygame.Surface(self.rect.size)
+        self.rendered_state = None
         self.value_ratio = self.max_value / self.rect.width
     
     def draw(self, screen: pygame.Surface, offset: vec):
@@ -100,9 +104,23 @@ class ProgressBar(pygame.sprite.Sprite):
         else:
             self.value = math.clamp(self.value + value, 0, self.max_value)
         
+    def needs_render(self):
+        """Checks if the values of the bar changed since the image was last drawn, and marks them as drawn.
+
+        Returns:
+            bool: If the image must be redrawn.
+        """
+        _state = (self.value, self.target_value, self.max_value, self.rect.size)
+        if _state == self.rendered_state:
+            return False
+        self.rendered_state = _state
+        return True
+    
     def update_bar(self):
         """Updates the surface of the bar, without animating.
         """        
+        if not self.needs_render():
+            return
         self.image.fill(self.back_color)
 
         #current health
@@ -114,7 +132,6 @@ class ProgressBar(pygame.sprite.Sprite):
     def update_bar_animation(self):
         """Updates the surface of the bar, with animation.
         """        
-        self.image.fill(self.back_color)
         transition_width = 0
         transition_color = colors.RED
         
@@ -136,6 +153,10 @@ class ProgressBar(pygame.sprite.Sprite):
             self.value = math.clamp(_value, 0, self.max_value)
             transition_width = int(abs(self.target_value - self.value) / self.value_ratio)
             transition_color = self.anim_remove_color
+        
+        if not self.needs_render():
+            return
+        self.image.fill(self.back_color)
             
         _rect = pygame.Rect(0,0, self.value / self.value_ratio, self.rect.height)
         
@@ -78,6 +78,10 @@ class Rectangle(pygame.sprite.Sprite, IGravitable):
     def draw(self, surface: pygame.Surface, offset: vec):
         surface.blit(self.image, self.rect.topleft - offset)
         
+    def kill(self):
+        IGravitable.unregister(self)
+        super().kill()
+        
     def take_damage(self, value: float, attacker = None):
         self.take_damage_callback(value, attacker)
     
@@ -0,0 +1,79 @@
+import heapq, itertools
+
+from domain.services import game_clock
+
+class Timer:
+    """A callback registered in a `Scheduler`, returned so it can be cancelled."""
+    __slots__ = ("due_ms", "callback", "cancelled")
+
+    def __init__(self, due_ms: float, callback):
+        self.due_ms = due_ms
+        """The game time when the callback is due."""
+        self.callback = callback
+        """The function called with no arguments when the timer is due."""
+        self.cancelled = False
+        """If the timer was cancelled before firing. Cancelled timers stay in the heap until they are popped."""
+
+    def cancel(self):
+        self.cancelled = True
+
+class Scheduler:
+    """Fires callbacks when their due time is reached, keeping the timers in a heap ordered by due time.
+
+    Each update only looks at the timers that are due, so its cost doesn't grow with the number of pending timers.
+    """
+    def __init__(self):
+        self._heap: list[tuple[float, int, Timer]] = []
+        self._counter = itertools.count()
+        """Breaks ties between timers with the same due time, so they fire in the order they were scheduled."""
+        self.now_ms: float = None
+        """The game time of the last update."""
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule_at(self, due_ms: float, callback):
+        """Registers a callback to be called at the specified game time.
+
+        Args:
+            due_ms (float): The game time, from `game_clock.now_ms()`. Times in the past fire on the next update.
+            callback (callable): The function to call, with no arguments.
+
+        Returns:
+            Timer: The timer, to cancel it if needed.
+        """
+        timer = Timer(due_ms, callback)
+        heapq.heappush(self._heap, (due_ms, next(self._counter), timer))
+        return timer
+
+    def schedule(self, delay_ms: float, callback):
+        """Registers a callback to be called after the specified delay from now.
+
+        Args:
+            delay_ms (float): The delay in milliseconds of game time.
+            callback (callable): The function to call, with no arguments.
+
+        Returns:
+            Timer: The timer, to cancel it if needed.
+        """
+        return self.schedule_at(game_clock.now_ms() + delay_ms, callback)
+
+    def update(self, now_ms: float = None):
+        """Calls the callbacks of all the timers due until the specified time, in due order.
+
+        Callbacks may schedule new timers; the ones already due fire in this same update.
+
+        Args:
+            now_ms (float, optional): The current game time. Defaults to `game_clock.now_ms()`.
+        """
+        if now_ms == None:
+            now_ms = game_clock.now_ms()
+        self.now_ms = now_ms
+        while len(self._heap) > 0 and self._heap[0][0] <= now_ms:
+            timer = heapq.heappop(self._heap)[2]
+            if not timer.cancelled:
+                timer.callback()
+
+    def clear(self):
+        """Drops all the pending timers."""
+        self._heap.clear()
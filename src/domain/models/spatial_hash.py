@@ -0,0 +1,103 @@
+import pygame, math
+
+class SpatialHashGroup(pygame.sprite.Group):
+    """A sprite group that also buckets its sprites in cells along the map's x axis, so collision queries only test the sprites near the queried object.
+
+    Sprites added or removed are inserted/removed from the cells right away, but moving sprites are only re-bucketed by `rebuild()`, which must be called once per frame after they move.
+    """
+    def __init__(self, *sprites, **kwargs):
+        self.cell_size = kwargs.pop("cell_size", 128)
+        """The width, in pixels, of each cell of the grid."""
+
+        self._cells: dict[int, list[pygame.sprite.Sprite]] = {}
+        self._sprite_cells: dict[pygame.sprite.Sprite, range] = {}
+        self._margin = 0
+        """How far, in pixels, the custom collision tests of the sprites can reach beyond their rects. The custom queries are widened by it."""
+
+        super().__init__(*sprites)
+
+    def _get_reach(self, sprite: pygame.sprite.Sprite):
+        # custom tests can reach beyond the rect (collide_circle uses the radius or the half diagonal)
+        _rect = sprite.rect
+        _reach = getattr(sprite, "radius", None)
+        if _reach == None:
+            _reach = math.hypot(_rect.width, _rect.height) / 2
+        return max(_reach, _rect.width / 2)
+
+    def _span(self, left: float, right: float):
+        return range(math.floor(left / self.cell_size), math.floor(right / self.cell_size) + 1)
+
+    def _insert(self, sprite: pygame.sprite.Sprite):
+        _span = self._span(sprite.rect.left, sprite.rect.right)
+        self._sprite_cells[sprite] = _span
+        self._margin = max(self._margin, self._get_reach(sprite) - sprite.rect.width / 2)
+        for c in _span:
+            _cell = self._cells.get(c)
+            if _cell == None:
+                self._cells[c] = [sprite]
+            else:
+                _cell.append(sprite)
+
+    def _discard(self, sprite: pygame.sprite.Sprite):
+        _span = self._sprite_cells.pop(sprite, None)
+        if _span == None:
+            return
+        for c in _span:
+            _cell = self._cells.get(c)
+            if _cell != None and sprite in _cell:
+                _cell.remove(sprite)
+
+    def add_internal(self, sprite, layer = None):
+        super().add_internal(sprite, layer)
+        self._insert(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._discard(sprite)
+
+    def rebuild(self):
+        """Re-buckets all sprites of the group at their current positions, and updates the reach of their custom collision tests."""
+        self._cells.clear()
+        self._sprite_cells.clear()
+        self._margin = 0
+        for s in self.sprites():
+            self._insert(s)
+
+    def query(self, left: float, right: float):
+        """Gets the sprites whose cells overlap the specified horizontal range.
+
+        Args:
+            left (float): The left bound of the range, in map coordinates.
+            right (float): The right bound of the range, in map coordinates.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The candidate sprites, without duplicates. They still need the narrow collision test.
+        """
+        _span = self._span(left, right)
+        if len(_span) == 1:
+            return list(self._cells.get(_span.start, ()))
+
+        _candidates = {}
+        for c in _span:
+            for s in self._cells.get(c, ()):
+                _candidates[s] = None
+        return list(_candidates)
+
+    def spritecollide(self, sprite: pygame.sprite.Sprite, collided = None):
+        """Same as `pygame.sprite.spritecollide` without dokill, but only testing the sprites in the cells overlapped by the sprite.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite to test against the group.
+            collided (callable, optional): The narrow collision test, like `pygame.sprite.collide_circle`. Defaults to None, which compares the rects.
+                It must not reach beyond the radius of the sprites, or their half diagonal when they have none.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The sprites of the group that collide with the sprite.
+        """
+        _rect = sprite.rect
+        if collided == None:
+            return [s for s in self.query(_rect.left, _rect.right) if _rect.colliderect(s.rect)]
+
+        # the targets are bucketed by their rects, so the ones whose reach extends into the range from a neighbouring cell are included too
+        _reach = self._get_reach(sprite) + self._margin
+        return [s for s in self.query(_rect.centerx - _reach, _rect.centerx + _reach) if collided(sprite, s)]
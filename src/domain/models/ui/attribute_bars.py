@@ -1,7 +1,7 @@
-import pygame, datetime
+import pygame
 from pygame.math import Vector2 as vec
 
-from domain.services import game_controller, menu_controller
+from domain.services import game_controller, menu_controller, game_clock
 from domain.utils import colors, constants, enums, math_utillity as math
 
 class AttributeBar:
@@ -29,7 +29,7 @@ class AttributeBar:
         self.bar_border_radius = kwargs.pop("bar_border_radius", 5)
         
         self.upgrade_blink_ms = kwargs.pop("upgrade_blink_ms", 0)
-        self.last_upgrade_blink: datetime.datetime = datetime.datetime.now()
+        self.last_upgrade_blink: float = game_clock.now_ms()
         self.upgrade_visible = True
         
         self.bars_margin = kwargs.pop("bars_margin", 5)
@@ -76,9 +76,9 @@ class AttributeBar:
             _half_bar_rect = _bar_rect.copy()
             _half_bar_rect.width /= 2
             
-            _now = datetime.datetime.now()
+            _now = game_clock.now_ms()
             
-            if _now > self.last_upgrade_blink + datetime.timedelta(milliseconds=self.upgrade_blink_ms):
+            if _now > self.last_upgrade_blink + self.upgrade_blink_ms:
                 self.last_upgrade_blink = _now
                 self.upgrade_visible = not self.upgrade_visible
             
@@ -2,7 +2,7 @@ import pygame
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, constants, enums
-from domain.services import game_controller, menu_controller, resources
+from domain.services import game_controller, menu_controller, resources, asset_archive
 
 #button class
 class Button(pygame.sprite.Sprite):
@@ -21,13 +21,13 @@ class Button(pygame.sprite.Sprite):
         self.block_raycast = kwargs.pop("block_raycast", True)
         self.visible = kwargs.pop("visible", True)
         self.text_color = kwargs.pop("text_color", colors.WHITE)
-        self.text_font: pygame.font.Font = kwargs.pop("text_font", pygame.font.SysFont('arial', 30))
+        self.text_font: pygame.font.Font = kwargs.pop("text_font", resources.sys_font('arial', 30))
         self.text_surface: pygame.Surface = None
         self.hover_scale = kwargs.pop("hover_scale", 1.1)
         
         self.last_clicked = True
-        self.sound_clicked = pygame.mixer.Sound(resources.get_ui_sfx(enums.SFXUI.BTN_CLICK))
-        self.sound_hover = pygame.mixer.Sound(resources.get_ui_sfx(enums.SFXUI.BTN_HOVER))
+        self.sound_clicked = asset_archive.load_sound(resources.get_ui_sfx(enums.SFXUI.BTN_CLICK))
+        self.sound_hover = asset_archive.load_sound(resources.get_ui_sfx(enums.SFXUI.BTN_HOVER))
         
         
         if len(self.text) > 0:
@@ -60,7 +60,7 @@ class Button(pygame.sprite.Sprite):
         self.center = self.rect.center
         
     def set_image(self, file_path: str):
-        self.image = pygame.image.load(file_path).convert_alpha()
+        self.image = asset_archive.load_image(file_path).convert_alpha()
         if self.scale != 1:
             self.image = game_controller.scale_image(self.image, self.scale)
         self.start_image = self.image.copy()
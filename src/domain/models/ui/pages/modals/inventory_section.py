@@ -1,8 +1,8 @@
-import pygame, datetime
+import pygame
 from pygame.math import Vector2 as vec
 
 from domain.models.player import Player
-from domain.services import menu_controller, game_controller, resources
+from domain.services import menu_controller, game_controller, resources, game_clock, asset_archive
 from domain.utils import colors, constants, enums, math_utillity as math
 from domain.models.ui.button import Button
 from domain.models.ui.popup_text import Popup
@@ -18,13 +18,13 @@ class Inventory:
         self.player = player
         self.panel_margin = panel_margin
         self.inv_v_scrollbar: ScrollBar = None
-        self.purchase_sound = pygame.mixer.Sound(f'{resources.SOUNDS_PATH}sound_effects\\ui\\purchase.mp3')
+        self.purchase_sound = asset_archive.load_sound(f'{resources.SOUNDS_PATH}sound_effects\\ui\\purchase.mp3')
         self.purchase_sound.set_volume(0.3)
         
         
         self.image: pygame.Surface = None
         self.on_return = kwargs.pop("on_return", lambda: None)
-        self.start_time = datetime.datetime.now()
+        self.start_time = game_clock.now_ms()
         
         self.selected_card: StoreItem = None
         self.selected_weapon: Weapon = None
@@ -318,7 +318,7 @@ class Inventory:
         
         header_rect = pygame.Rect((0,0), (image_rect.width, txt_store_title_rect.height + 10))
         
-        p1_icon = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\characters\\{self.player.character.value}\\head_icon.png'), 2.5, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        p1_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\characters\\{self.player.character.value}\\head_icon.png', 2.5, enums.ConvertType.CONVERT_ALPHA)
         p1_icon_rect = p1_icon.get_rect()
         p1_icon_rect.left = txt_store_title_rect.right + 30
         p1_icon_rect.centery = txt_store_title_rect.centery
@@ -340,10 +340,11 @@ class Inventory:
         
         primary_icon, primary_icon_rect = None, None
         if bkp.equipped_primary != None:
-            primary_icon = pygame.image.load(resources.get_weapon_path(bkp.equipped_primary, enums.AnimActions.ICON))
+            _icon_path = resources.get_weapon_path(bkp.equipped_primary, enums.AnimActions.ICON)
+            primary_icon = game_controller.load_image(_icon_path)
             _max_dim = max(primary_icon.get_width(), primary_icon.get_height())
             _percentage = ((primary_slot_rect.width * 100 / _max_dim)/100) * 1.1
-            primary_icon = game_controller.scale_image(primary_icon, _percentage, enums.ConvertType.CONVERT_ALPHA)
+            primary_icon = game_controller.load_image(_icon_path, _percentage, enums.ConvertType.CONVERT_ALPHA)
             primary_icon_rect = primary_icon.get_rect()
             primary_icon_rect.center = primary_slot_rect.center
         
@@ -363,10 +364,11 @@ class Inventory:
         
         secondary_icon, secondary_icon_rect = None, None
         if bkp.equipped_secondary != None:
-            secondary_icon = pygame.image.load(resources.get_weapon_path(bkp.equipped_secondary, enums.AnimActions.ICON))
+            _icon_path = resources.get_weapon_path(bkp.equipped_secondary, enums.AnimActions.ICON)
+            secondary_icon = game_controller.load_image(_icon_path)
             _max_dim = max(secondary_icon.get_width(), secondary_icon.get_height())
             _percentage = ((secondary_slot_rect.width * 100 / _max_dim)/100) * 1.1
-            secondary_icon = game_controller.scale_image(secondary_icon, _percentage, enums.ConvertType.CONVERT_ALPHA)
+            secondary_icon = game_controller.load_image(_icon_path, _percentage, enums.ConvertType.CONVERT_ALPHA)
             secondary_icon_rect = secondary_icon.get_rect()
             secondary_icon_rect.center = secondary_slot_rect.center
         
@@ -672,11 +674,11 @@ class Inventory:
                 
                 #icons
                 if self.pistol_ammo_icon == None:
-                    self.pistol_ammo_icon = pygame.image.load(f'{resources.IMAGES_PATH}ui\\pistol_ammo_icon.png')
-                    self.shotgun_ammo_icon = pygame.image.load(f'{resources.IMAGES_PATH}ui\\shotgun_ammo_icon.png')
-                    self.rifle_ammo_icon = pygame.image.load(f'{resources.IMAGES_PATH}ui\\rifle_ammo_icon.png')
-                    self.sniper_ammo_icon = pygame.image.load(f'{resources.IMAGES_PATH}ui\\sniper_ammo_icon.png')
-                    self.rocket_ammo_icon = pygame.image.load(f'{resources.IMAGES_PATH}ui\\rocket_ammo_icon.png')
+                    self.pistol_ammo_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\pistol_ammo_icon.png')
+                    self.shotgun_ammo_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\shotgun_ammo_icon.png')
+                    self.rifle_ammo_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\rifle_ammo_icon.png')
+                    self.sniper_ammo_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\sniper_ammo_icon.png')
+                    self.rocket_ammo_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\rocket_ammo_icon.png')
                     
                     _icons = [self.pistol_ammo_icon, self.shotgun_ammo_icon, self.rifle_ammo_icon, self.sniper_ammo_icon, self.rocket_ammo_icon]
                     _max_size = max([max(i.get_size()) for i in _icons])
@@ -803,10 +805,10 @@ class Inventory:
                 _has_bkp_upgrade = bkp.upgrade_step < len(constants.ITEMS_UPGRADES["backpack"])
                 _btn_upgrade_bkp = self.buttons[3]
                 
-                _now = datetime.datetime.now()
+                _now = game_clock.now_ms()
                 if _btn_upgrade_bkp.hovered:
                     _elapsed = _now - self.start_time
-                    _ms = _elapsed.microseconds/1000 - _elapsed.seconds/1000
+                    _ms = _elapsed % 1000
                     _show = (_ms > 300)
                     if _show and _has_bkp_upgrade:
                         pnl_right.blit(_txt_pistol_upgrade, _txt_pistol_upgrade_rect)
@@ -1,8 +1,8 @@
 import pygame
 from pygame.math import Vector2 as vec
 
-from domain.services import menu_controller, resources
-from domain.utils import colors, constants
+from domain.services import menu_controller, resources, game_clock
+from domain.utils import colors, constants, enums
 from domain.models.ui.button import Button
 from domain.models.ui.pages.modals.modal import Modal
 
@@ -37,16 +37,21 @@ class Pause(Modal):
         if self.game.game_over_popup != None:
             self.game.game_over_popup.destroy()
         menu_controller.pages_history = menu_controller.pages_history[:1]
+        game_clock.resume()
         
     def show(self):
         self.game.focused = False
         self.active = True
         pygame.mixer.music.pause()
+        # the other player keeps playing in multiplayer, so only a single player game stops the time
+        if self.game.client_type == enums.ClientType.SINGLE:
+            game_clock.pause()
         
     def hide(self):
         self.active = False
         self.game.focused = True
         pygame.mixer.music.unpause()
+        game_clock.resume()
     
     def set_tab(self, i: int):
         self.tab_index = i
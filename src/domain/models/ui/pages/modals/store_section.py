@@ -2,7 +2,7 @@ import pygame
 from pygame.math import Vector2 as vec
 
 from domain.models.player import Player
-from domain.services import menu_controller, game_controller, resources
+from domain.services import menu_controller, game_controller, resources, asset_archive
 from domain.utils import colors, constants, enums
 from domain.models.ui.button import Button
 from domain.models.ui.popup_text import Popup
@@ -18,7 +18,7 @@ class Store:
         self.player = player
         self.panel_margin = panel_margin
         self.store_v_scrollbar: ScrollBar = None
-        self.purchase_sound = pygame.mixer.Sound(f'{resources.SOUNDS_PATH}sound_effects\\ui\\purchase.mp3')
+        self.purchase_sound = asset_archive.load_sound(f'{resources.SOUNDS_PATH}sound_effects\\ui\\purchase.mp3')
         self.purchase_sound.set_volume(0.3)
         
         
@@ -355,7 +355,7 @@ class Store:
             self.store_v_scrollbar = ScrollBar(enums.Orientation.VERTICAL, vec(1, 4 * (ammo_panel_rect.height + 50)), pygame.Rect((screen_rect.width - self.panel_margin.x, self.panel_margin.y + _item_description_size.y), (20,screen_rect.height - self.panel_margin.y*2 - _item_description_size.y)), use_arrows = False)
             
             
-        p1_icon = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\characters\\{self.player.character.value}\\head_icon.png'), 2.5, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        p1_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\characters\\{self.player.character.value}\\head_icon.png', 2.5, enums.ConvertType.CONVERT_ALPHA)
         p1_icon_rect = p1_icon.get_rect()
         p1_icon_rect.left = txt_store_title_rect.right + 30
         p1_icon_rect.centery = txt_store_title_rect.centery
@@ -412,7 +412,7 @@ class Store:
             txt_card_title_rect.top = _description_rect.top
             
             #icon
-            icon = game_controller.scale_image(pygame.image.load(self.selected_card.icon_path), self.selected_card.store_icon_scale, convert_type=enums.ConvertType.CONVERT_ALPHA)
+            icon = game_controller.load_image(self.selected_card.icon_path, self.selected_card.store_icon_scale, enums.ConvertType.CONVERT_ALPHA)
             icon_rect = icon.get_rect()
             icon_rect.centerx = txt_card_title_rect.centerx
             icon_rect.top = txt_card_title_rect.bottom + 10
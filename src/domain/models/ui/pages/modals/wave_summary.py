@@ -1,8 +1,8 @@
-import pygame, datetime
+import pygame
 from pygame.math import Vector2 as vec
 
 from domain.models.wave_result import WaveResult
-from domain.services import menu_controller, game_controller, resources
+from domain.services import menu_controller, game_controller, resources, game_clock
 from domain.utils import colors, constants, enums
 from domain.models.ui.button import Button
 from domain.models.ui.pages.modals.modal import Modal
@@ -19,7 +19,7 @@ class WaveSummary(Modal):
         self.p2_ready = False
         self.timed_out = False
         self.tab_index = 0
-        self.start_time = kwargs.pop("start_time", datetime.datetime.now())
+        self.start_time = kwargs.pop("start_time", game_clock.now_ms())
         
         
         self.store_section = Store(self.P1_RESULT.player, self.panel_margin, on_return = lambda: self.set_tab(0))
@@ -87,11 +87,11 @@ class WaveSummary(Modal):
         _player_panels_margin = vec(30, 0)
        
         wave_title = menu_controller.get_text_surface(f'Survived Wave {self.P1_RESULT.wave_number}', colors.RED, resources.px_font(80))
-        p1_icon = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\characters\\{self.P1_RESULT.player_character.value}\\head_icon.png'), 4, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        p1_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\characters\\{self.P1_RESULT.player_character.value}\\head_icon.png', 4, enums.ConvertType.CONVERT_ALPHA)
         p1_title = menu_controller.get_text_surface(self.P1_RESULT.player_character.value, colors.WHITE, resources.px_font(60))
         
         if self.P2_RESULT != None:
-            p2_icon = game_controller.scale_image(pygame.image.load(f'{resources.IMAGES_PATH}ui\\characters\\{self.P2_RESULT.player_character.value}\\head_icon.png'), 4, convert_type=enums.ConvertType.CONVERT_ALPHA)
+            p2_icon = game_controller.load_image(f'{resources.IMAGES_PATH}ui\\characters\\{self.P2_RESULT.player_character.value}\\head_icon.png', 4, enums.ConvertType.CONVERT_ALPHA)
             p2_title = menu_controller.get_text_surface(self.P2_RESULT.player_character.value, colors.WHITE, resources.px_font(60))
 
         lbl_score = menu_controller.get_text_surface("wave score:", colors.WHITE, resources.px_font(28))
@@ -172,12 +172,13 @@ class WaveSummary(Modal):
         super().draw(screen)
         
         if not self.timed_out:
-            _elapsed = datetime.datetime.now() - self.start_time
-            _remaining = datetime.timedelta(seconds=self.P1_RESULT.wave_interval_s) - _elapsed
-            _color = colors.WHITE if _remaining.seconds > 10 else colors.RED
-            timer = menu_controller.get_text_surface(f'{_remaining.seconds}s', _color, resources.px_font(50))
-            _ms = _remaining.microseconds/1000 - _remaining.seconds/1000
-            if _remaining.seconds > 10 or (_ms > 400):
+            _elapsed = game_clock.now_ms() - self.start_time
+            _remaining = self.P1_RESULT.wave_interval_s * 1000 - _elapsed
+            _seconds = int(_remaining // 1000)
+            _color = colors.WHITE if _seconds > 10 else colors.RED
+            timer = menu_controller.get_text_surface(f'{_seconds}s', _color, resources.px_font(50))
+            _ms = _remaining % 1000
+            if _seconds > 10 or (_ms > 400):
                 screen.blit(timer, self.panel_margin + vec(10,10))
         
         match self.tab_index:
@@ -215,7 +216,7 @@ class WaveSummary(Modal):
         for b in self.buttons:
             b.update()
             
-        if datetime.datetime.now() > self.start_time + datetime.timedelta(seconds= self.P1_RESULT.wave_interval_s):
+        if game_clock.now_ms() > self.start_time + self.P1_RESULT.wave_interval_s * 1000:
             self.timed_out = True
             
     def blit_debug(self, screen, **kwargs):
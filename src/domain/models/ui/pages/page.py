@@ -1,5 +1,6 @@
 import pygame
 
+from domain.services import asset_archive
 from domain.models.ui.button import Button
 
 class Page:
@@ -15,7 +16,7 @@ class Page:
             b.update()
             
     def set_background(self, image_path: str):
-        self.background_image = pygame.transform.scale(pygame.image.load(image_path).convert(), self.screen.get_size())
+        self.background_image = pygame.transform.scale(asset_archive.load_image(image_path).convert(), self.screen.get_size())
         
     def draw(self):
         for b in self.buttons:
@@ -1,13 +1,22 @@
-import pygame, datetime
+import pygame
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, math_utillity as math
-from domain.services import menu_controller
+from domain.utils.recyclables import ObjectPool
+from domain.services import menu_controller, resources, game_clock
 
 class Popup(pygame.sprite.Sprite):
     def __init__(self, text: str, pos: vec, **kwargs) -> None:
         super().__init__()
         
+        self.pool: ObjectPool = None
+        """The pool this popup was acquired from, released to when killed."""
+        self.in_pool = False
+        """If this popup was released and is waiting to be reused."""
+        self.reset(text, pos, **kwargs)
+        
+    def reset(self, text: str, pos: vec, **kwargs):
+        """Sets the popup up with the specified text and options, both when created and when reused from `popup_pool`."""
         self.name = kwargs.pop("name", None)
         """A string to represent this popup. Used when 'unique' is true to prevent repeated popups."""
         self.unique = kwargs.pop("unique", False)
@@ -29,7 +38,7 @@ class Popup(pygame.sprite.Sprite):
         """The width of the text box borders. Defaults to 0."""
         self.padding: vec = kwargs.pop("padding", vec(5,2))
         """The distance between the text box borders and the text. Defaults to vec(5,2)."""
-        self.font = kwargs.pop("font", pygame.font.SysFont('arial', 12))
+        self.font = kwargs.pop("font", resources.sys_font('arial', 12))
         """The font of the text. Defaults to Arial 12."""
         self.fade_in_ms = kwargs.pop("fade_in_ms", 0)
         """The time in milliseconds to animate the fade in effect. Defaults to 0."""
@@ -51,9 +60,10 @@ class Popup(pygame.sprite.Sprite):
         
         self.image = self.rerender()
         """The surface of the popup."""
+        self._rendered_state: tuple = None
         
-        self._show_time: datetime.datetime = None
-        self._hide_time: datetime.datetime = None
+        self._show_time: float = None
+        self._hide_time: float = None
         
         if self.fade_in_ms > 0:
                 self._current_text_color = colors.set_alpha(self.text_color, 0)
@@ -81,24 +91,52 @@ class Popup(pygame.sprite.Sprite):
         result.blit(text_surface, self.padding + vec(self.border_width, self.border_width))
         return result
        
+    def set_text(self, text: str):
+        """Changes the text of the popup, resizing its text box.
+
+        Args:
+            text (str): The new text.
+        """
+        self.text = text
+        self.rect.size = vec(self.font.size(self.text)) + (self.padding *2) + vec(self.border_width, self.border_width)*2
+        
+    def restart(self, pos: vec = None):
+        """Restarts the timeout of a popup already on screen, fully visible and without fading in again.
+
+        Args:
+            pos (vec, optional): The new starting position. Defaults to the current one.
+        """
+        if pos != None:
+            self.start_pos = pos
+        self.rect.topleft = self.start_pos
+        self._current_text_color = self.text_color
+        self._current_background_color = self.background_color
+        self._current_border_color = self.border_color
+        self.show(True)
+        
     def destroy(self):
         """Kills itself, no longer being processed."""
         self.use_blink_anim = False
         self.kill()
         
+    def kill(self):
+        super().kill()
+        if self.pool != None:
+            self.pool.release(self)
+        
     def show(self, override = False):
         """Shows the popup, animating the fade in if enabled."""
         self._hide_time = None
         if self._show_time == None or override:
-            self._show_time = datetime.datetime.now()
+            self._show_time = game_clock.now_ms()
         
     def hide(self, override = False):
         """Hides and kills the popup, animating the fade out if enabled."""
         if self._hide_time == None or override:
-            self._hide_time = datetime.datetime.now()
+            self._hide_time = game_clock.now_ms()
             
     def _fade_in_anim(self):
-        anim_end = (self._show_time + datetime.timedelta(milliseconds=self.fade_in_ms))
+        anim_end = (self._show_time + self.fade_in_ms)
         
         self._current_text_color = menu_controller.fade_in_color(self.text_color, colors.alpha_or_default(self.text_color, 255)[3], self._show_time, anim_end)
         if self.background_color != None:
@@ -108,7 +146,7 @@ class Popup(pygame.sprite.Sprite):
     
     
     def _fade_out_anim(self):
-        anim_end = (self._hide_time + datetime.timedelta(milliseconds=self.fade_out_ms))
+        anim_end = (self._hide_time + self.fade_out_ms)
         
         self._current_text_color = menu_controller.fade_out_color(self.text_color, colors.alpha_or_default(self.text_color, 255)[3], self._hide_time, anim_end)
         if self.background_color != None:
@@ -123,9 +161,9 @@ class Popup(pygame.sprite.Sprite):
         
         # If has time out and it's reached, start hiding
         if self.timeout_ms != None:
-            _deadline = self._show_time + datetime.timedelta(milliseconds = self.timeout_ms)
-            if datetime.datetime.now() > _deadline and self._hide_time == None:
-                self._hide_time = datetime.datetime.now()
+            _deadline = self._show_time + self.timeout_ms
+            if game_clock.now_ms() > _deadline and self._hide_time == None:
+                self._hide_time = game_clock.now_ms()
         
         # If has fade in animation and it's not done yet, start fading in
         if self.fade_in_ms > 0:
@@ -158,9 +196,16 @@ class Popup(pygame.sprite.Sprite):
         if self._show_time == None:
             return
         
-        self.image = self.rerender()
+        # the image only changes while fading or when the text changes
+        _state = (self.text, self._current_text_color, self._current_background_color, self._current_border_color, self.rect.size)
+        if _state != self._rendered_state:
+            self.image = self.rerender()
+            self._rendered_state = _state
         screen.blit(self.image, self.rect)
-        
-    
-    
-    
\ No newline at end of file
+
+
+MAX_POOLED_POPUPS = 40
+"""The maximum number of popups from `popup_pool` on screen at once. New damage and health numbers are skipped above it."""
+
+popup_pool = ObjectPool(Popup, 128)
+"""The pool of the short-lived popups, such as damage and health numbers. Popups kept by their creator after being killed must not come from it."""
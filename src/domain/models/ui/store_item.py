@@ -1,7 +1,7 @@
 import pygame
 from pygame.math import Vector2 as vec
 
-from domain.services import game_controller, menu_controller, resources
+from domain.services import game_controller, menu_controller, resources, asset_archive
 from domain.utils import colors, constants, enums
 
 class StoreItem:
@@ -35,7 +35,7 @@ class StoreItem:
         self.z_index = kwargs.pop("z_index", 0)
         self.block_raycast = kwargs.pop("block_raycast", True)
         
-        self.icon = pygame.image.load(self.icon_path).convert_alpha()
+        self.icon = asset_archive.load_image(self.icon_path).convert_alpha()
         _icon_ratio = self.rect.width / self.icon.get_width()
         self.icon_scale = _icon_ratio * 0.7 * kwargs.pop("icon_scale", 1)
         self.store_icon_scale = kwargs.pop("store_icon_scale", 4)
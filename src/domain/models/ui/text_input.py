@@ -4,6 +4,7 @@ import pyperclip
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors
+from domain.services import resources
 
 pygame.font.init()
 
@@ -53,7 +54,7 @@ class TextInput:
         self.tab_callback = kwargs.pop("tab_callback", self._process_tab)
         """The function to be called when pressing the tab key. The default is to add 4 spaces."""
         
-        self._font_object = kwargs.pop("font", pygame.font.SysFont('arial', 25))
+        self._font_object = kwargs.pop("font", resources.sys_font('arial', 25))
         self._antialias = kwargs.pop("antialias", True)
         self._font_color = kwargs.pop("font_color", colors.BLACK)
         
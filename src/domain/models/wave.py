@@ -1,8 +1,9 @@
-import pygame, datetime, threading, random
+import pygame, threading, random
 
-from domain.services import menu_controller, resources, assets_manager
+from domain.services import menu_controller, resources, game_clock, game_controller, profiler
 from domain.models.rectangle_sprite import Rectangle
 from domain.models.enemy import Enemy
+from domain.models.spatial_hash import SpatialHashGroup
 from pygame.math import Vector2 as vec
 from domain.utils import enums, constants
 from domain.models.wave_result import WaveResult
@@ -17,12 +18,30 @@ from domain.content.enemies.z_raimundo import ZRaimundo
 from domain.content.enemies.z_ronald import ZRonald  
  
 
+def get_enemy_types(enemies: list[dict]):
+    """Gets the enemy types whose assets a wave needs, including the ones spawned by other enemies.
+
+    Args:
+        enemies (list[dict]): The "enemies" list of a wave in `constants.WAVES`.
+
+    Returns:
+        list[enums.Enemies]: The enemy types, without repetition.
+    """
+    enemy_types: list[enums.Enemies] = []
+    for e in enemies:
+        _type = e.get("type", enums.Enemies.Z_ROGER)
+        if _type not in enemy_types:
+            enemy_types.append(_type)
+            if _type == enums.Enemies.Z_RONALD and enums.Enemies.Z_RONALDO not in enemy_types:
+                enemy_types.append(enums.Enemies.Z_RONALDO)
+    return enemy_types
+
 class Wave():
     def __init__(self, game, **kwargs):
         
         _enemies_dict: list[dict] = kwargs.pop("enemies", [])
         self.total_enemies = sum([e["count"] for e in _enemies_dict])
-        self.enemy_types: list[enums.Enemies] = []
+        self.enemy_types = get_enemy_types(_enemies_dict)
         _total_spawn_chance = sum([e["spawn_chance_multiplier"] for e in _enemies_dict])
         self.enemies: list[dict] = []
         self.enemies_spawn_chances: dict = {}
@@ -34,10 +53,6 @@ class Wave():
             self.enemies_spawn_chances[_type] = (e["spawn_chance_multiplier"] * 100 / _total_spawn_chance)/100
             self.enemies_max[_type] = e["max_alive"]
             
-            if _type not in self.enemy_types:
-                self.enemy_types.append(_type)
-                if _type == enums.Enemies.Z_RONALD and enums.Enemies.Z_RONALDO not in self.enemy_types:
-                    self.enemy_types.append(enums.Enemies.Z_RONALDO)
             for _ in range(_count):
                 self.enemies.append(e.copy())
                 
@@ -47,7 +62,7 @@ class Wave():
         self.wave_message = kwargs.pop("wave_message", "")
         self.enemies_current_id = 0
         self.enemies_group = pygame.sprite.Group()
-        self.enemies_hitbox_group = pygame.sprite.Group()
+        self.enemies_hitbox_group = SpatialHashGroup()
         self.money_multiplier = kwargs.pop("money_multiplier", 1)
         self.wave_interval_s = kwargs.pop("wave_interval_s", 15)
         self.start_delay_ms = kwargs.pop("start_delay_ms", 2000)
@@ -61,16 +76,17 @@ class Wave():
         self.started = False
         self.finished = False
         
-        self.last_spawn_time: datetime = None
-        self.start_time: datetime.datetime = None
+        self.last_spawn_time: float = None
+        self.start_time: float = None
 
         self.players_scores = {
             1: WaveResult(),
             2: WaveResult(),
         }
         
-        self.delayed_finish_time: datetime.datetime = None
-        self.assets_manager = assets_manager.AssetsManager(self.enemy_types)
+        self.delayed_finish_time: float = None
+        self.assets_manager = game.assets_manager
+        """The assets cache of the game, shared by all waves."""
         self.loaded = False
 
     def update(self, **kwargs):
@@ -80,24 +96,33 @@ class Wave():
         if not self.loaded:
             return
         elif self.start_time == None:
-            self.start_time = datetime.datetime.now()
+            self.start_time = game_clock.now_ms()
         
-        if datetime.datetime.now() < self.start_time + datetime.timedelta(milliseconds=self.start_delay_ms):
+        if game_clock.now_ms() < self.start_time + self.start_delay_ms:
             return
 
         self.enemies_count = len(self.enemies_group.sprites())
     
-        if self.delayed_finish_time != None and datetime.datetime.now() >= self.delayed_finish_time:
-            self.end_wave()
-    
     def draw(self, screen: pygame.Surface, offset: vec):
+        _view = game_controller.get_view_rect(offset)
         for e in self.enemies_group.sprites():
-            e.draw(screen, offset)
+            if _view.colliderect(e.rect):
+                e.draw(screen, offset)
+                profiler.count("enemies drawn")
+            else:
+                # still needed to place the damage popups of off-screen enemies
+                e.player_offset = offset
+                profiler.count("enemies culled")
 
     def start(self):
         self.started = True
-        thread = threading.Thread(target=self.load_resources)
-        thread.start()
+        self.assets_manager.acquire(self.enemy_types)
+        # the types already used in previous waves or prefetched during the wave summary are kept loaded
+        if self.assets_manager.is_loaded(self.enemy_types):
+            self.loaded = True
+        else:
+            thread = threading.Thread(target=self.load_resources)
+            thread.start()
         
             
         title_popup = Popup(f"Wave {self.wave_number}", vec(0,0), **constants.POPUPS["wave_title"])
@@ -110,8 +135,17 @@ class Wave():
             menu_controller.popup(message_popup)
 
     def load_resources(self):
-        self.assets_manager.load_resources()
-        self.loaded = True
+        self.assets_manager.load_resources(self.enemy_types)
+        
+    def check_loaded(self):
+        """Marks the wave as loaded once the assets of all its types are decoded and converted by `AssetsManager.convert_step`.
+
+        Returns:
+            bool: If the wave is loaded.
+        """
+        if not self.loaded:
+            self.loaded = self.assets_manager.is_loaded(self.enemy_types)
+        return self.loaded
 
 
     def get_id(self):
@@ -152,7 +186,12 @@ class Wave():
         
     def delay_end_wave(self, delay_ms: float):
         if self.delayed_finish_time == None:
-            self.delayed_finish_time = datetime.datetime.now() + datetime.timedelta(milliseconds=delay_ms)
+            self.delayed_finish_time = game_clock.now_ms() + delay_ms
+            self.game.scheduler.schedule_at(self.delayed_finish_time, self.delayed_end_wave)
+
+    def delayed_end_wave(self):
+        if not self.finished:
+            self.end_wave()
 
     def end_wave(self):
         self.players_scores[1].money = (self.players_scores[1].score / 4) * self.money_multiplier
@@ -213,4 +252,6 @@ class Wave():
 
             
     def update_enemies(self):
-        self.enemies_group.update(group_name = "enemies", game = self.game, client_type = self.game.client_type)
\ No newline at end of file
+        self.enemies_group.update(group_name = "enemies", game = self.game, client_type = self.game.client_type)
+        # the hitboxes moved with their enemies, so the bullets of this frame need them re-bucketed
+        self.enemies_hitbox_group.rebuild()
\ No newline at end of file
@@ -1,9 +1,9 @@
-import pygame,datetime
+import pygame
 from pygame.math import Vector2 as vec
 
 
 from domain.utils import colors, enums
-from domain.services import game_controller, menu_controller, resources
+from domain.services import game_controller, menu_controller, resources, game_clock
 from domain.models.ui.popup_text import Popup
 from domain.models.backpack import BackPack
 
@@ -80,7 +80,7 @@ class Weapon(pygame.sprite.Sprite):
         self.fire_frames = [pygame.Surface((1,1))]
         """The animation frames of this weapon when firing/attacking."""
             
-        self.idle_frame = game_controller.scale_image(pygame.image.load(resources.get_weapon_path(self.weapon_type, enums.AnimActions.IDLE)), self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
+        self.idle_frame = game_controller.load_image(resources.get_weapon_path(self.weapon_type, enums.AnimActions.IDLE), self.weapon_scale, enums.ConvertType.CONVERT_ALPHA)
         """The image of this weapon when not animating."""
             
         self.image = self.idle_frame
@@ -89,6 +89,10 @@ class Weapon(pygame.sprite.Sprite):
         self.current_frame = self.idle_frame
         """The image of the current animation frame, without rotating."""
         
+        self.mirrors: dict = {}
+        """The vertically mirrored frames, used while pointing left, by frame, both ways."""
+        self.add_mirrors([self.idle_frame])
+        
 
         self.rect = self.image.get_rect()
         """The rect of this weapon."""
@@ -134,13 +138,25 @@ class Weapon(pygame.sprite.Sprite):
     def update(self, **kwargs):
         pass
     
+    def add_mirrors(self, *frames_lists: list[pygame.Surface]):
+        """Creates the vertical mirrors of the animations once, at load time, so pointing left doesn't flip the frames every frame.
+
+        Args:
+            frames_lists (list[pygame.Surface]): The frames of each animation.
+        """
+        for frames in frames_lists:
+            game_controller.mirror_frames(frames, False, True, self.mirrors)
+    
+    def get_mirror(self, image: pygame.Surface):
+        return game_controller.get_mirror(image, self.mirrors, False, True)
+    
     def draw(self, screen: pygame.Surface, offset: vec):
         screen.blit(self.image, vec(self.rect.topleft) - vec(0,0))
            
     
            
     def reload(self):
-        now = datetime.datetime.now()
+        now = game_clock.now_ms()
         
         # if ran out of ammo
         if self.player_backpack.get_ammo(self.bullet_type) <= 0:
@@ -149,7 +165,7 @@ class Weapon(pygame.sprite.Sprite):
         if self.magazine_bullets >= self.magazine_size:
             return
         # if is still reloading
-        if self.reload_start_time != None and now - datetime.timedelta(milliseconds= self.reload_delay_ms) <= self.reload_start_time:
+        if self.reload_start_time != None and now - self.reload_delay_ms <= self.reload_start_time:
             return
         # if is still firing
         if self.firing or self.pumping:
@@ -182,21 +198,21 @@ class Weapon(pygame.sprite.Sprite):
                 self.empty_sound.play()
             return False
         
-        _now = datetime.datetime.now()
+        _now = game_clock.now_ms()
         
         #if the player is switching weapons
         if self.changing_weapon:
             return
         
         # if is still reloading
-        if self.reload_start_time != None and _now - datetime.timedelta(milliseconds= self.reload_delay_ms) <= self.reload_start_time:
+        if self.reload_start_time != None and _now - self.reload_delay_ms <= self.reload_start_time:
             return
         
         if self.last_shot_time == None:
             self.last_shot_time = _now
             return True
         
-        if _now - datetime.timedelta(milliseconds= self.fire_rate_ratio/self.fire_rate) > self.last_shot_time:
+        if _now - (self.fire_rate_ratio/self.fire_rate) > self.last_shot_time:
             return True
         
         return False
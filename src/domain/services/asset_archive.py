@@ -0,0 +1,323 @@
+import os, io, mmap, struct, json, threading
+import pygame
+
+from domain.utils import enums
+from domain.services import resources
+
+enabled = True
+"""If the assets are read from the archive when it exists. Disabled, or for files missing from it, they're read from the resources folder."""
+
+PACKED_EXTENSIONS = (".png", ".mp3", ".ttf")
+"""The files bundled by `pack`. Project files such as .psd are left out."""
+
+_HEADER = struct.Struct("<4sIQ")
+"""The magic bytes, the format version and the size of the JSON index that follows."""
+_MAGIC = b"NZPK"
+_VERSION = 1
+
+_archive: mmap.mmap = None
+_index: dict[str, tuple[int, int, int]] = None
+"""The offset, size and modification time of each file, by entry name."""
+_folders: dict[str, list[str]] = None
+"""The manifest of the folders: the sorted names of the files and folders inside each one, by entry name.
+Built from the archive index, or from a single walk of the resources folder when there's no archive."""
+_files: set[str] = None
+"""The manifest of the files, by entry name."""
+_open_lock = threading.Lock()
+
+def get_entry_name(path: str):
+    """Gets the name of a file in the archive, relative to the resources folder.
+
+    The paths built by `resources` are accepted as they are, either relative or starting with `ROOT_PATH`, with or without a trailing separator.
+    Names are lowercase, since the game was made on a case-insensitive file system.
+
+    Args:
+        path (str): The path to the file or folder.
+
+    Returns:
+        str: The entry name, or None if the path is outside the resources folder.
+    """
+    _name = path.replace("/", "\\")
+    _root = resources.ROOT_PATH.replace("/", "\\")
+    if _name.startswith(_root):
+        _name = _name[len(_root):]
+    if not _name.startswith(resources.RESOURCES_PATH):
+        return None
+    _name = _name[len(resources.RESOURCES_PATH):]
+    while "\\\\" in _name:
+        _name = _name.replace("\\\\", "\\")
+    return _name.strip("\\").lower()
+
+def open_archive(path: str = None):
+    """Memory-maps the archive and reads its index. Called on the first access, so it only needs to be called to reopen it after `pack`.
+
+    In the DEV environment the archive is checked against the resources folder, and ignored if any asset was edited, added or removed since it was packed.
+
+    Args:
+        path (str, optional): The path to the archive. Defaults to `resources.ARCHIVE_PATH`.
+
+    Returns:
+        bool: If the archive was opened.
+    """
+    global _archive, _index, _folders, _files
+    close_archive()
+    if path == None:
+        path = resources.ARCHIVE_PATH
+    # a truncated archive, shorter than the header, is read from the folder like a missing one
+    if enabled and os.path.exists(path) and os.path.getsize(path) >= _HEADER.size:
+        with open(path, "rb") as f:
+            _archive = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _magic, _version, _index_size = _HEADER.unpack_from(_archive)
+        if _magic == _MAGIC and _version == _VERSION:
+            _entries = json.loads(bytes(_archive[_HEADER.size:_HEADER.size + _index_size]))
+            if resources.ENVIRONMENT != enums.Environment.DEV or not _is_stale(_entries):
+                # the index is published last, since `is_open` only waits for this function while it's None
+                _folders, _files = _build_manifest(_entries.keys())
+                _index = {name.lower(): tuple(entry) for name, entry in _entries.items()}
+                return True
+            print(f"{path} is out of date, reading the assets from the resources folder. Run pack_assets.py to update it")
+        close_archive()
+
+    _folders, _files = _build_manifest(name for name, _ in _walk_resources())
+    _index = {}
+    return False
+
+def _is_stale(entries: dict[str, list[int]]):
+    """Checks if the files in the resources folder changed since the archive was packed.
+
+    Args:
+        entries (dict[str, list[int]]): The index of the archive.
+
+    Returns:
+        bool: If a packed file was edited or removed, or a new one was added.
+    """
+    _files = _walk_resources(PACKED_EXTENSIONS)
+    if len(_files) != len(entries):
+        return True
+    for name, full_path in _files:
+        _entry = entries.get(name)
+        if _entry == None:
+            return True
+        _stat = os.stat(full_path)
+        if _entry[1] != _stat.st_size or _entry[2] != _stat.st_mtime_ns:
+            return True
+    return False
+
+def _walk_resources(extensions: tuple[str] = None):
+    """Lists the files in the resources folder, in a stable order.
+
+    Args:
+        extensions (tuple[str], optional): The extensions of the files to list. Defaults to None, listing all files.
+
+    Returns:
+        list[tuple[str, str]]: The entry name and the full path of each file.
+    """
+    _source = resources.ROOT_PATH + resources.RESOURCES_PATH
+    _files: list[tuple[str, str]] = []
+    for folder, folders, files in os.walk(_source):
+        folders.sort()
+        for file in sorted(files):
+            if extensions == None or file.lower().endswith(extensions):
+                _full_path = os.path.join(folder, file)
+                _files.append((os.path.relpath(_full_path, _source).replace(os.sep, "\\"), _full_path))
+    return _files
+
+def _build_manifest(names):
+    """Builds the manifest of the folders and files from their entry names.
+
+    Args:
+        names (Iterable[str]): The entry names of the files.
+
+    Returns:
+        tuple[dict[str, list[str]], set[str]]: The children of each folder and the files, by entry name.
+    """
+    _folders, _files = {"": []}, set()
+    for name in names:
+        _files.add(name.lower())
+        _parts = name.split("\\")
+        for i in range(len(_parts)):
+            _children = _folders.setdefault("\\".join(_parts[:i]).lower(), [])
+            if _parts[i] not in _children:
+                _children.append(_parts[i])
+    # sorted, so animation frames are in the same order on every file system
+    for children in _folders.values():
+        children.sort()
+    return _folders, _files
+
+def close_archive():
+    """Closes the archive and drops the manifest, rebuilt on the next access."""
+    global _archive, _index, _folders, _files
+    if _archive != None:
+        _archive.close()
+    _archive, _index, _folders, _files = None, None, None, None
+
+def is_open():
+    if _index == None:
+        with _open_lock:
+            if _index == None:
+                open_archive()
+    return _archive != None
+
+def _get_entry(path: str):
+    if not is_open():
+        return None
+    _name = get_entry_name(path)
+    if _name == None:
+        return None
+    return _index.get(_name)
+
+def exists(path: str):
+    """Checks if a file or folder exists in the manifest, without touching the disk. Paths outside the resources folder or missing from the manifest are checked on disk.
+
+    Args:
+        path (str): The path to the file or folder.
+
+    Returns:
+        bool: If the file or folder exists.
+    """
+    is_open()
+    _name = get_entry_name(path)
+    if _name != None and (_name in _files or _name in _folders):
+        return True
+    return os.path.exists(path)
+
+def listdir(path: str):
+    """Lists the files and folders inside a folder of the manifest, without touching the disk. Paths outside the resources folder or missing from the manifest are listed from disk.
+
+    Args:
+        path (str): The path to the folder.
+
+    Returns:
+        list[str]: The names of the files and folders, sorted by name.
+    """
+    is_open()
+    _name = get_entry_name(path)
+    if _name == None or _name not in _folders:
+        return os.listdir(path)
+    return list(_folders[_name])
+
+def count(path: str):
+    """Counts the files and folders inside a folder of the manifest. Paths outside the resources folder or missing from the manifest are counted on disk.
+
+    Args:
+        path (str): The path to the folder.
+
+    Returns:
+        int: The number of files and folders, or 0 if the folder doesn't exist.
+    """
+    is_open()
+    _name = get_entry_name(path)
+    if _name != None and _name in _folders:
+        return len(_folders[_name])
+    return len(os.listdir(path)) if os.path.isdir(path) else 0
+
+def read(path: str):
+    """Gets the bytes of a packed file, as a slice of the memory-mapped archive, without copying them.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        memoryview: The bytes of the file, or None if it isn't packed.
+    """
+    _entry = _get_entry(path)
+    if _entry == None:
+        return None
+    _offset, _size = _entry[0], _entry[1]
+    return memoryview(_archive)[_offset:_offset + _size]
+
+def open_file(path: str):
+    """Gets a file to be handed to the pygame loaders, which accept both a path and a file object.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        io.BytesIO | str: The packed file, or the path itself if it isn't packed.
+    """
+    _data = read(path)
+    if _data == None:
+        return path
+    return io.BytesIO(_data)
+
+def get_signature(path: str):
+    """Gets the modification time and size of a file, to detect when it changes.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        tuple[int, int]: The modification time in nanoseconds and the size in bytes, or None if the file doesn't exist.
+    """
+    _entry = _get_entry(path)
+    if _entry != None:
+        return _entry[2], _entry[1]
+    try:
+        _stat = os.stat(path)
+    except OSError:
+        return None
+    return _stat.st_mtime_ns, _stat.st_size
+
+def load_image(path: str):
+    """Loads an image from the archive, or from disk if it isn't packed.
+
+    Args:
+        path (str): The path to the image file.
+
+    Returns:
+        pygame.Surface: The loaded image, not converted.
+    """
+    _file = open_file(path)
+    if type(_file) == str:
+        return pygame.image.load(_file)
+    return pygame.image.load(_file, os.path.basename(path.replace("\\", "/")))
+
+def load_sound(path: str):
+    """Loads a sound from the archive, or from disk if it isn't packed.
+
+    Args:
+        path (str): The path to the sound file.
+
+    Returns:
+        pygame.mixer.Sound: The loaded sound.
+    """
+    return pygame.mixer.Sound(open_file(path))
+
+def pack(archive_path: str = None):
+    """Bundles the files in the resources folder into a single archive, with an index of the offset of each file.
+
+    Args:
+        archive_path (str, optional): The path to the archive, overwritten if it exists. Defaults to `resources.ARCHIVE_PATH`.
+
+    Returns:
+        int: The number of packed files.
+    """
+    if archive_path == None:
+        archive_path = resources.ARCHIVE_PATH
+    _files = _walk_resources(PACKED_EXTENSIONS)
+
+    # the offsets depend on the size of the index, so it's serialized until its length stops changing
+    _entries = {}
+    _index_data = b""
+    while True:
+        _offset = _HEADER.size + len(_index_data)
+        for name, full_path in _files:
+            _stat = os.stat(full_path)
+            _entries[name] = (_offset, _stat.st_size, _stat.st_mtime_ns)
+            _offset += _stat.st_size
+        _new_data = json.dumps(_entries).encode("utf-8")
+        _done = len(_new_data) == len(_index_data)
+        _index_data = _new_data
+        if _done:
+            break
+
+    close_archive()
+    _temp_path = f'{archive_path}.tmp'
+    with open(_temp_path, "wb") as archive:
+        archive.write(_HEADER.pack(_MAGIC, _VERSION, len(_index_data)))
+        archive.write(_index_data)
+        for name, full_path in _files:
+            with open(full_path, "rb") as f:
+                archive.write(f.read())
+    os.replace(_temp_path, archive_path)
+    return len(_files)
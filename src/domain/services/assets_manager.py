@@ -1,11 +1,53 @@
-import os, pickle
+import os, pickle, threading, time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from domain.utils import enums
 from domain.services import resources, game_controller
 
+DECODE_WORKERS = max(2, os.cpu_count() or 1)
+"""How many folders of frames and sounds are decoded at the same time."""
+CONVERT_BUDGET_MS = 4
+"""How long the main thread may spend converting decoded frames in each frame, so the loading screen keeps responding."""
+
+_decode_pool: ThreadPoolExecutor = None
+
+def get_decode_pool():
+    """Gets the thread pool that decodes the asset files, shared by every `AssetsManager`."""
+    global _decode_pool
+    if _decode_pool == None:
+        _decode_pool = ThreadPoolExecutor(max_workers = DECODE_WORKERS, thread_name_prefix = "assets")
+    return _decode_pool
+
+
 class AssetsManager:
-    def __init__ (self, enemy_types: list[enums.Enemies]):
-        self.enemy_types = enemy_types
+    """Loads and keeps the assets of each enemy type across waves, so a type is only loaded again after being evicted.
+
+    Waves hold a reference to the types they use with `acquire` and `release`. Types no wave references can be dropped with `evict`.
+    """
+    def __init__ (self, enemy_types: list[enums.Enemies] = None):
+        self.enemy_types = enemy_types if enemy_types != None else []
+        """The types loaded by `load_resources` when called without arguments."""
+        self.loaded_types: set[enums.Enemies] = set()
+        """The types whose assets are currently loaded."""
+        self.ref_counts: dict[enums.Enemies, int] = {}
+        """How many waves are using each type."""
+        self.load_lock = threading.Lock()
+        """Prevents a prefetch and a wave from loading the same types at the same time."""
+        self.prefetch_thread: threading.Thread = None
+        self.convert_queue: deque[tuple[enums.Enemies, list, int, enums.ConvertType]] = deque()
+        """The decoded frames waiting to be converted to the display format by `convert_step`, on the main thread."""
+        self.pending_converts: dict[enums.Enemies, int] = {}
+        """How many frames of each type are still in `convert_queue`."""
+        self.decode_progress: dict[enums.Enemies, tuple[int, int]] = {}
+        """The decoded and total folders of each type being loaded."""
+        self.convert_totals: dict[enums.Enemies, int] = {}
+        """How many frames of each type were queued to be converted."""
+        
+        self.frame_sets: dict[tuple[int, float], tuple[list, list, list]] = {}
+        """The frames scaled to each enemy scale and their mirrors, by the id of the loaded frames list and the scale."""
+        self.mirrors: dict = {}
+        """Each scaled frame and its mirror, both ways."""
         
         #region z_roger
         self.z_roger_damage_sounds, self.z_roger_death_sounds, self.z_roger_attack_sounds = None, None, None
@@ -48,145 +90,365 @@ class AssetsManager:
     
     def get_assets(self, enemy_type: enums.Enemies, attr_name: str):
         return getattr(self, f'{enemy_type.value}_{attr_name}')
-        
     
-    def load_resources(self):
-        for t in self.enemy_types:
-            match t:
-                case enums.Enemies.Z_ROGER:
-                    self.load_roger()
-                case enums.Enemies.Z_RONALDO:
-                    self.load_ronaldo()
-                case enums.Enemies.Z_ROBERT:
-                    self.load_robert()
-                case enums.Enemies.Z_RUI:
-                    self.load_rui()
-                case enums.Enemies.Z_RAIMUNDO:
-                    self.load_raimundo()
-                case enums.Enemies.Z_RAVEN:
-                    self.load_raven()
-                case enums.Enemies.Z_RONALD:
-                    self.load_ronald()
-        
+    def get_frame_set(self, frames: list, scale: float):
+        """Gets the frames scaled and mirrored, scaling and mirroring the whole animation only the first time it's requested.
+
+        Args:
+            frames (list[pygame.Surface]): The loaded frames of an animation, as returned by `get_assets`.
+            scale (float): The scale of the enemy.
+
+        Returns:
+            tuple[list[pygame.Surface], list[pygame.Surface]]: The scaled frames and their mirrors, in the same order.
+        """
+        key = (id(frames), scale)
+        frame_set = self.frame_sets.get(key)
+        if frame_set == None:
+            _scaled = [game_controller.scale_image(f, scale) for f in frames]
+            # the source list is kept in the value so its id can't be reused while the entry exists
+            frame_set = (_scaled, game_controller.mirror_frames(_scaled, mirrors = self.mirrors), frames)
+            self.frame_sets[key] = frame_set
+        return frame_set[0], frame_set[1]
+    
+    def get_mirror(self, image):
+        return game_controller.get_mirror(image, self.mirrors)
         
     
+    def is_loaded(self, enemy_types: list[enums.Enemies]):
+        return all(t in self.loaded_types for t in enemy_types)
+    
+    def acquire(self, enemy_types: list[enums.Enemies]):
+        """Marks the types as used by a wave, so they're not evicted until released.
+
+        Args:
+            enemy_types (list[enums.Enemies]): The enemy types of the wave.
+        """
+        for t in enemy_types:
+            self.ref_counts[t] = self.ref_counts.get(t, 0) + 1
+            
+    def release(self, enemy_types: list[enums.Enemies]):
+        """Marks the types as no longer used by a wave. They stay loaded until `evict` is called.
+
+        Args:
+            enemy_types (list[enums.Enemies]): The enemy types of the wave.
+        """
+        for t in enemy_types:
+            if self.ref_counts.get(t, 0) > 0:
+                self.ref_counts[t] -= 1
+    
+    def evict(self, keep: list[enums.Enemies] = None):
+        """Unloads the types that no wave is using and that are not in `keep`.
+
+        Skipped while a prefetch is loading, which holds `load_lock` for the whole decoding, so the main thread never waits for it.
+        The unused types are then evicted on the next wave.
+
+        Args:
+            keep (list[enums.Enemies], optional): Types to keep loaded even without references, such as the ones of the next wave. Defaults to None.
+
+        Returns:
+            bool: If the types were evicted.
+        """
+        if keep == None:
+            keep = []
+        if not self.load_lock.acquire(blocking=False):
+            return False
+        try:
+            for t in list(self.loaded_types):
+                if self.ref_counts.get(t, 0) > 0 or t in keep:
+                    continue
+                self.unload(t)
+        finally:
+            self.load_lock.release()
+        return True
+    
+    def unload(self, enemy_type: enums.Enemies):
+        """Drops the assets of a type, with its scaled and mirrored frames.
+
+        Args:
+            enemy_type (enums.Enemies): The enemy type to unload.
+        """
+        _prefix = f'{enemy_type.value}_'
+        _lists = []
+        for name, value in vars(self).items():
+            if name.startswith(_prefix) and value != None:
+                _lists.append(value)
+                setattr(self, name, None)
+        
+        for key, frame_set in list(self.frame_sets.items()):
+            if not any(frame_set[2] is l for l in _lists):
+                continue
+            for image in frame_set[0] + frame_set[1]:
+                self.mirrors.pop(image, None)
+            del self.frame_sets[key]
+        self.loaded_types.discard(enemy_type)
+    
+    def prefetch(self, enemy_types: list[enums.Enemies]):
+        """Loads the types on a background thread, such as the ones of the next wave while the wave summary is shown.
+
+        Args:
+            enemy_types (list[enums.Enemies]): The enemy types to load.
+        """
+        if self.is_loaded(enemy_types):
+            return
+        self.prefetch_thread = threading.Thread(target=self.load_resources, args=(enemy_types,), daemon=True)
+        self.prefetch_thread.start()
+    
+    def load_resources(self, enemy_types: list[enums.Enemies] = None):
+        """Decodes the assets of the types that aren't loaded yet, all folders at once in the decode pool, and waits for them.
+
+        The frames are then queued to be converted by `convert_step` on the main thread, and the types are only loaded after that.
+
+        Args:
+            enemy_types (list[enums.Enemies], optional): The types to load. Defaults to `enemy_types`.
+        """
+        if enemy_types == None:
+            enemy_types = self.enemy_types
+        with self.load_lock:
+            _types = [t for t in enemy_types if t not in self.loaded_types and t not in self.pending_converts]
+            for t in _types:
+                self.decode_progress[t] = (0, 0)
+                self.load_type(t)
+            for t in _types:
+                self.resolve_type(t)
+    
+    def load_sprites(self, folder_path: str, convert_type: enums.ConvertType = enums.ConvertType.CONVERT):
+        """Queues the frames of a folder to be decoded in the decode pool. Called by the load methods of each type.
+
+        Args:
+            folder_path (str): The path to the folder containing the images.
+            convert_type (enums.ConvertType, optional): The conversion done later by `convert_step`. Defaults to enums.ConvertType.CONVERT.
+
+        Returns:
+            Future: The decoding job, replaced by the frames in `resolve_type`.
+        """
+        _job = get_decode_pool().submit(game_controller.load_sprites, folder_path, convert_type = enums.ConvertType.NO_CONVERT)
+        _job.convert_type = convert_type
+        return _job
+    
+    def load_sounds(self, folder_path: str, volume: int = 1):
+        """Queues the sounds of a folder to be decoded in the decode pool. Called by the load methods of each type.
+
+        Args:
+            folder_path (str): The path to the folder containing the sounds.
+            volume (int, optional): The volume of the sounds. Defaults to 1.
+
+        Returns:
+            Future: The decoding job, replaced by the sounds in `resolve_type`.
+        """
+        _job = get_decode_pool().submit(game_controller.load_sounds, folder_path, volume)
+        _job.convert_type = None
+        return _job
+    
+    def resolve_type(self, enemy_type: enums.Enemies):
+        """Waits for the decoding jobs of a type, replacing each one with its result and queuing the frames to be converted.
+
+        Args:
+            enemy_type (enums.Enemies): The enemy type being loaded.
+        """
+        _prefix = f'{enemy_type.value}_'
+        _jobs = [(name, value) for name, value in vars(self).items() if name.startswith(_prefix) and isinstance(value, Future)]
+        _to_convert: list[tuple[list, enums.ConvertType]] = []
+        for i, (name, job) in enumerate(_jobs):
+            _result = job.result()
+            setattr(self, name, _result)
+            self.decode_progress[enemy_type] = (i + 1, len(_jobs))
+            if job.convert_type != None and job.convert_type != enums.ConvertType.NO_CONVERT and _result != None:
+                _to_convert.append((_result, job.convert_type))
+        
+        _converts = sum(len(frames) for frames, _ in _to_convert)
+        self.convert_totals[enemy_type] = _converts
+        if _converts == 0:
+            self.loaded_types.add(enemy_type)
+            return
+        # the count is set before queuing, since the main thread may start converting right away
+        self.pending_converts[enemy_type] = _converts
+        for frames, convert_type in _to_convert:
+            for i in range(len(frames)):
+                self.convert_queue.append((enemy_type, frames, i, convert_type))
+    
+    def convert_step(self, budget_ms: float = None):
+        """Converts the decoded frames to the display format, which must be done on the main thread, until the time budget runs out.
+        Called every frame; the types are marked as loaded when all their frames are converted.
+
+        Args:
+            budget_ms (float, optional): The maximum time to spend converting. Defaults to None, converting everything queued.
+        """
+        _start = time.perf_counter()
+        while len(self.convert_queue) > 0:
+            enemy_type, frames, index, convert_type = self.convert_queue.popleft()
+            match convert_type:
+                case enums.ConvertType.CONVERT:
+                    frames[index] = frames[index].convert()
+                case enums.ConvertType.CONVERT_ALPHA:
+                    frames[index] = frames[index].convert_alpha()
+            
+            self.pending_converts[enemy_type] -= 1
+            if self.pending_converts[enemy_type] == 0:
+                del self.pending_converts[enemy_type]
+                self.loaded_types.add(enemy_type)
+            if budget_ms != None and (time.perf_counter() - _start) * 1000 >= budget_ms:
+                break
+    
+    def get_progress(self, enemy_types: list[enums.Enemies]):
+        """Gets how much of the loading of the types is done. Decoding and converting count as half of each type.
+
+        Args:
+            enemy_types (list[enums.Enemies]): The types being loaded.
+
+        Returns:
+            float: The progress, from 0 to 1.
+        """
+        if len(enemy_types) == 0:
+            return 1
+        _progress = 0
+        for t in enemy_types:
+            if t in self.loaded_types:
+                _progress += 1
+                continue
+            _decoded, _total = self.decode_progress.get(t, (0, 0))
+            if _total > 0:
+                _progress += 0.5 * _decoded / _total
+            _converts = self.convert_totals.get(t, 0)
+            if t in self.pending_converts and _converts > 0:
+                _progress += 0.5 * (1 - self.pending_converts[t] / _converts)
+        return _progress / len(enemy_types)
+    
+    def load_type(self, enemy_type: enums.Enemies):
+        match enemy_type:
+            case enums.Enemies.Z_ROGER:
+                self.load_roger()
+            case enums.Enemies.Z_RONALDO:
+                self.load_ronaldo()
+            case enums.Enemies.Z_ROBERT:
+                self.load_robert()
+            case enums.Enemies.Z_RUI:
+                self.load_rui()
+            case enums.Enemies.Z_RAIMUNDO:
+                self.load_raimundo()
+            case enums.Enemies.Z_RAVEN:
+                self.load_raven()
+            case enums.Enemies.Z_RONALD:
+                self.load_ronald()
+    
+    
+    
     def load_roger(self):
         run_folder = resources.get_enemy_path(enums.Enemies.Z_ROGER, enums.AnimActions.RUN)
-        self.z_roger_run_frames = game_controller.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_roger_run_frames = self.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         attack_folder = resources.get_enemy_path(enums.Enemies.Z_ROGER, enums.AnimActions.ATTACK)
-        self.z_roger_attack_frames = game_controller.load_sprites(attack_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_roger_attack_frames = self.load_sprites(attack_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         death_folder = resources.get_enemy_path(enums.Enemies.Z_ROGER, enums.AnimActions.DEATH)
-        self.z_roger_death_frames = game_controller.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_roger_death_frames = self.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
-        self.z_roger_damage_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROGER, enums.AnimActions.TAKE_DAMAGE), 0.1)
-        self.z_roger_death_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROGER, enums.AnimActions.DEATH), 0.2)
-        self.z_roger_attack_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROGER, enums.AnimActions.ATTACK), 0.2)
+        self.z_roger_damage_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROGER, enums.AnimActions.TAKE_DAMAGE), 0.1)
+        self.z_roger_death_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROGER, enums.AnimActions.DEATH), 0.2)
+        self.z_roger_attack_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROGER, enums.AnimActions.ATTACK), 0.2)
 
         
     def load_ronaldo(self):
         run_folder = resources.get_enemy_path(enums.Enemies.Z_RONALDO, enums.AnimActions.RUN)
-        self.z_ronaldo_run_frames = game_controller.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_ronaldo_run_frames = self.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         attack_folder = resources.get_enemy_path(enums.Enemies.Z_RONALDO, enums.AnimActions.ATTACK)
-        self.z_ronaldo_attack_frames = game_controller.load_sprites(attack_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_ronaldo_attack_frames = self.load_sprites(attack_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         death_folder = resources.get_enemy_path(enums.Enemies.Z_RONALDO, enums.AnimActions.DEATH)
-        self.z_ronaldo_death_frames = game_controller.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_ronaldo_death_frames = self.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
-        self.z_ronaldo_damage_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALDO, enums.AnimActions.TAKE_DAMAGE), 0.1)
-        self.z_ronaldo_death_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALDO, enums.AnimActions.DEATH), 0.2)
-        self.z_ronaldo_attack_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALDO, enums.AnimActions.ATTACK), 0.2)
+        self.z_ronaldo_damage_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALDO, enums.AnimActions.TAKE_DAMAGE), 0.1)
+        self.z_ronaldo_death_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALDO, enums.AnimActions.DEATH), 0.2)
+        self.z_ronaldo_attack_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALDO, enums.AnimActions.ATTACK), 0.2)
         
         
     def load_robert(self):
         run_folder = resources.get_enemy_path(enums.Enemies.Z_ROBERT, enums.AnimActions.RUN)
-        self.z_robert_run_frames = game_controller.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_robert_run_frames = self.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         attack_folder = resources.get_enemy_path(enums.Enemies.Z_ROBERT, enums.AnimActions.ATTACK)
-        self.z_robert_attack_frames = game_controller.load_sprites(attack_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_robert_attack_frames = self.load_sprites(attack_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         death_folder = resources.get_enemy_path(enums.Enemies.Z_ROBERT, enums.AnimActions.DEATH)
-        self.z_robert_death_frames = game_controller.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_robert_death_frames = self.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
-        self.z_robert_damage_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROBERT, enums.AnimActions.TAKE_DAMAGE), 0.1)
-        self.z_robert_death_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROBERT, enums.AnimActions.DEATH), 0.2)
-        self.z_robert_attack_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROBERT, enums.AnimActions.ATTACK), 0.2)
+        self.z_robert_damage_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROBERT, enums.AnimActions.TAKE_DAMAGE), 0.1)
+        self.z_robert_death_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROBERT, enums.AnimActions.DEATH), 0.2)
+        self.z_robert_attack_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_ROBERT, enums.AnimActions.ATTACK), 0.2)
         
         
     def load_rui(self):
         run_folder = resources.get_enemy_path(enums.Enemies.Z_RUI, enums.AnimActions.RUN)
-        self.z_rui_run_frames = game_controller.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_rui_run_frames = self.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         attack_folder = resources.get_enemy_path(enums.Enemies.Z_RUI, enums.AnimActions.ATTACK)
-        self.z_rui_attack_frames1 = game_controller.load_sprites(attack_folder + "\\01", convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self.z_rui_attack_frames2 = game_controller.load_sprites(attack_folder + "\\02", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_rui_attack_frames1 = self.load_sprites(attack_folder + "\\01", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_rui_attack_frames2 = self.load_sprites(attack_folder + "\\02", convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         death_folder = resources.get_enemy_path(enums.Enemies.Z_RUI, enums.AnimActions.DEATH)
-        self.z_rui_death_frames = game_controller.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_rui_death_frames = self.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
-        self.z_rui_damage_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RUI, enums.AnimActions.TAKE_DAMAGE), 0.4)
-        self.z_rui_death_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RUI, enums.AnimActions.DEATH).replace("01.mp3",""), 0.4)
-        self.z_rui_attack_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RUI, enums.AnimActions.ATTACK), 0.4)
-        self.z_rui_bump_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RUI, enums.AnimActions.BUMP), 0.5)
+        self.z_rui_damage_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RUI, enums.AnimActions.TAKE_DAMAGE), 0.4)
+        self.z_rui_death_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RUI, enums.AnimActions.DEATH).replace("01.mp3",""), 0.4)
+        self.z_rui_attack_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RUI, enums.AnimActions.ATTACK), 0.4)
+        self.z_rui_bump_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RUI, enums.AnimActions.BUMP), 0.5)
         
         
     def load_raven(self):
         run_folder = resources.get_enemy_path(enums.Enemies.Z_RAVEN, enums.AnimActions.RUN)
-        self.z_raven_run_frames = game_controller.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raven_run_frames = self.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         attack_folder = resources.get_enemy_path(enums.Enemies.Z_RAVEN, enums.AnimActions.ATTACK)
-        self.z_raven_attack_frames = game_controller.load_sprites(attack_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raven_attack_frames = self.load_sprites(attack_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         death_folder = resources.get_enemy_path(enums.Enemies.Z_RAVEN, enums.AnimActions.DEATH)
-        self.z_raven_death_frames = game_controller.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raven_death_frames = self.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
-        self.z_raven_damage_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAVEN, enums.AnimActions.TAKE_DAMAGE), 0.1)
-        self.z_raven_death_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAVEN, enums.AnimActions.DEATH), 0.8)
-        self.z_raven_attack_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAVEN, enums.AnimActions.ATTACK), 0.2)
-        self.z_raven_dash_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAVEN, enums.AnimActions.DASH), 0.1)
+        self.z_raven_damage_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAVEN, enums.AnimActions.TAKE_DAMAGE), 0.1)
+        self.z_raven_death_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAVEN, enums.AnimActions.DEATH), 0.8)
+        self.z_raven_attack_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAVEN, enums.AnimActions.ATTACK), 0.2)
+        self.z_raven_dash_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAVEN, enums.AnimActions.DASH), 0.1)
         
         
     def load_raimundo(self):
         run_folder = resources.get_enemy_path(enums.Enemies.Z_RAIMUNDO, enums.AnimActions.RUN)
-        self.z_raimundo_run_frames_1 = game_controller.load_sprites(run_folder + "\\01", convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self.z_raimundo_run_frames_2 = game_controller.load_sprites(run_folder + "\\02", convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self.z_raimundo_run_frames_3 = game_controller.load_sprites(run_folder + "\\03", convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self.z_raimundo_run_frames_4 = game_controller.load_sprites(run_folder + "\\04", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_run_frames_1 = self.load_sprites(run_folder + "\\01", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_run_frames_2 = self.load_sprites(run_folder + "\\02", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_run_frames_3 = self.load_sprites(run_folder + "\\03", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_run_frames_4 = self.load_sprites(run_folder + "\\04", convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         attack_folder = resources.get_enemy_path(enums.Enemies.Z_RAIMUNDO, enums.AnimActions.ATTACK)
-        self.z_raimundo_attack_frames1 = game_controller.load_sprites(attack_folder + "\\01", convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self.z_raimundo_attack_frames2 = game_controller.load_sprites(attack_folder + "\\02", convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self.z_raimundo_attack_frames3 = game_controller.load_sprites(attack_folder + "\\03", convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self.z_raimundo_attack_frames4 = game_controller.load_sprites(attack_folder + "\\04", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_attack_frames1 = self.load_sprites(attack_folder + "\\01", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_attack_frames2 = self.load_sprites(attack_folder + "\\02", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_attack_frames3 = self.load_sprites(attack_folder + "\\03", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_attack_frames4 = self.load_sprites(attack_folder + "\\04", convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         death_folder = resources.get_enemy_path(enums.Enemies.Z_RAIMUNDO, enums.AnimActions.DEATH)
-        self.z_raimundo_death_frames1 = game_controller.load_sprites(death_folder + "\\01", convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self.z_raimundo_death_frames2 = game_controller.load_sprites(death_folder + "\\02", convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self.z_raimundo_death_frames3 = game_controller.load_sprites(death_folder + "\\03", convert_type=enums.ConvertType.CONVERT_ALPHA)
-        self.z_raimundo_death_frames4 = game_controller.load_sprites(death_folder + "\\04", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_death_frames1 = self.load_sprites(death_folder + "\\01", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_death_frames2 = self.load_sprites(death_folder + "\\02", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_death_frames3 = self.load_sprites(death_folder + "\\03", convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_death_frames4 = self.load_sprites(death_folder + "\\04", convert_type=enums.ConvertType.CONVERT_ALPHA)
         
-        self.z_raimundo_helmet_frames = game_controller.load_sprites(f'{resources.IMAGES_PATH}enemies\\{str(enums.Enemies.Z_RAIMUNDO.value)}\\helmet_breaking\\', convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_raimundo_helmet_frames = self.load_sprites(f'{resources.IMAGES_PATH}enemies\\{str(enums.Enemies.Z_RAIMUNDO.value)}\\helmet_breaking\\', convert_type=enums.ConvertType.CONVERT_ALPHA)
         
-        self.z_raimundo_damage_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAIMUNDO, enums.AnimActions.TAKE_DAMAGE), 0.1)
-        self.z_raimundo_death_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAIMUNDO, enums.AnimActions.DEATH), 0.2)
-        self.z_raimundo_attack_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAIMUNDO, enums.AnimActions.ATTACK), 0.2)
-        self.z_raimundo_helmet_bullet_sounds = game_controller.load_sounds(f'{resources.SOUNDS_PATH}sound_effects\\enemies\\{str(enums.Enemies.Z_RAIMUNDO.value)}\\helmet_bullet_hit\\', 0.2)
+        self.z_raimundo_damage_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAIMUNDO, enums.AnimActions.TAKE_DAMAGE), 0.1)
+        self.z_raimundo_death_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAIMUNDO, enums.AnimActions.DEATH), 0.2)
+        self.z_raimundo_attack_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RAIMUNDO, enums.AnimActions.ATTACK), 0.2)
+        self.z_raimundo_helmet_bullet_sounds = self.load_sounds(f'{resources.SOUNDS_PATH}sound_effects\\enemies\\{str(enums.Enemies.Z_RAIMUNDO.value)}\\helmet_bullet_hit\\', 0.2)
         
     def load_ronald(self):
         run_folder = resources.get_enemy_path(enums.Enemies.Z_RONALD, enums.AnimActions.RUN)
-        self.z_ronald_run_frames = game_controller.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_ronald_run_frames = self.load_sprites(run_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         attack_folder = resources.get_enemy_path(enums.Enemies.Z_RONALD, enums.AnimActions.ATTACK)
-        self.z_ronald_attack_frames = game_controller.load_sprites(attack_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_ronald_attack_frames = self.load_sprites(attack_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
         death_folder = resources.get_enemy_path(enums.Enemies.Z_RONALD, enums.AnimActions.DEATH)
-        self.z_ronald_death_frames = game_controller.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
+        self.z_ronald_death_frames = self.load_sprites(death_folder, convert_type=enums.ConvertType.CONVERT_ALPHA)
         
-        self.z_ronald_damage_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALD, enums.AnimActions.TAKE_DAMAGE), 0.1)
-        self.z_ronald_death_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALD, enums.AnimActions.DEATH), 0.2)
-        self.z_ronald_attack_sounds = game_controller.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALD, enums.AnimActions.ATTACK), 0.2)
+        self.z_ronald_damage_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALD, enums.AnimActions.TAKE_DAMAGE), 0.1)
+        self.z_ronald_death_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALD, enums.AnimActions.DEATH), 0.2)
+        self.z_ronald_attack_sounds = self.load_sounds(resources.get_enemy_sfx(enums.Enemies.Z_RONALD, enums.AnimActions.ATTACK), 0.2)
 
 
 
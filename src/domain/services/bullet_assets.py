@@ -0,0 +1,124 @@
+import pygame
+
+from domain.utils import enums
+from domain.services import resources, game_controller, asset_archive
+
+ROTATION_STEP = 3
+"""The angle granularity, in degrees, of the pre-rotated bullet images."""
+
+_bullet_images: dict[tuple[enums.BulletType, float], pygame.Surface] = {}
+_bullet_rotations: dict[tuple[enums.BulletType, float], list[pygame.Surface]] = {}
+_charge_frames: dict[tuple[enums.Throwables, float], list[pygame.Surface]] = {}
+_explosion_frames: list[pygame.Surface] = None
+_explosion_sounds: dict[float, list[pygame.mixer.Sound]] = {}
+_floor_flames_frames: tuple[list[pygame.Surface], list[pygame.Surface], list[pygame.Surface]] = None
+
+def get_bullet_image(bullet_type: enums.BulletType, scale: float = 1):
+    """Gets the image of the specified bullet type, loading it from disk only once.
+
+    Args:
+        bullet_type (enums.BulletType): The type of the bullet.
+        scale (float, optional): The scale of the image. Defaults to 1.
+
+    Returns:
+        pygame.Surface: The shared bullet image. It must not be modified.
+    """
+    key = (bullet_type, scale)
+    image = _bullet_images.get(key)
+    if image == None:
+        image = game_controller.load_image(resources.get_bullet_path(bullet_type), scale, enums.ConvertType.CONVERT_ALPHA)
+        _bullet_images[key] = image
+    return image
+
+def get_rotated_bullet(bullet_type: enums.BulletType, scale: float, angle: float):
+    """Gets the bullet image rotated to the nearest `ROTATION_STEP` of the specified angle.
+
+    All the rotated variants of a bullet type are computed together the first time any of them is requested.
+
+    Args:
+        bullet_type (enums.BulletType): The type of the bullet.
+        scale (float): The scale of the image.
+        angle (float): The angle in degrees.
+
+    Returns:
+        pygame.Surface: The shared rotated image. It must not be modified.
+    """
+    key = (bullet_type, scale)
+    rotations = _bullet_rotations.get(key)
+    if rotations == None:
+        image = get_bullet_image(bullet_type, scale)
+        rotations = [pygame.transform.rotate(image, a) for a in range(0, 360, ROTATION_STEP)]
+        _bullet_rotations[key] = rotations
+
+    return rotations[round(angle / ROTATION_STEP) % len(rotations)]
+
+def get_charge_frames(charge_type: enums.Throwables, scale: float = 1):
+    """Gets the animation frames of the specified throwable charge, loading them from disk only once.
+
+    Args:
+        charge_type (enums.Throwables): The type of the throwable.
+        scale (float, optional): The scale of the frames. Defaults to 1.
+
+    Returns:
+        list[pygame.Surface]: The shared list of frames. It must not be modified.
+    """
+    key = (charge_type, scale)
+    frames = _charge_frames.get(key)
+    if frames == None:
+        frames = game_controller.load_sprites(resources.get_weapon_path(charge_type, enums.AnimActions.SHOOT), scale, enums.ConvertType.CONVERT_ALPHA)
+        _charge_frames[key] = frames
+    return frames
+
+def get_explosion_frames():
+    """Gets the frames of the explosion effect, loading them from disk only once.
+
+    Returns:
+        list[pygame.Surface]: The shared list of frames. It must not be modified.
+    """
+    global _explosion_frames
+    if _explosion_frames == None:
+        _explosion_frames = game_controller.load_sprites(f'{resources.IMAGES_PATH}weapons\\effects\\explosion_01', convert_type=enums.ConvertType.CONVERT_ALPHA)
+    return _explosion_frames
+
+def get_explosion_sounds(volume: float = 1):
+    """Gets the explosion sounds with the specified volume, loading them from disk only once per volume.
+
+    Args:
+        volume (float, optional): The volume of the sounds. Defaults to 1.
+
+    Returns:
+        list[pygame.mixer.Sound]: The shared list of sounds.
+    """
+    sounds = _explosion_sounds.get(volume)
+    if sounds == None:
+        sounds = [asset_archive.load_sound(resources.get_weapon_sfx(enums.Weapons.RPG,enums.AnimActions.HIT) + f'0{i}.mp3') for i in range(1,4)]
+        for s in sounds:
+            s.set_volume(volume)
+        _explosion_sounds[volume] = sounds
+    return sounds
+
+def get_floor_flames_frames():
+    """Gets the start, end and loop frames of the floor flames effect, loading them from disk only once.
+
+    Returns:
+        tuple[list[pygame.Surface], list[pygame.Surface], list[pygame.Surface]]: The shared start, end and loop frames. They must not be modified.
+    """
+    global _floor_flames_frames
+    if _floor_flames_frames == None:
+        _floor_flames_frames = (
+            game_controller.load_sprites(f'{resources.IMAGES_PATH}weapons\\effects\\floor_flames\\start',2, enums.ConvertType.CONVERT_ALPHA),
+            game_controller.load_sprites(f'{resources.IMAGES_PATH}weapons\\effects\\floor_flames\\end',2, enums.ConvertType.CONVERT_ALPHA),
+            game_controller.load_sprites(f'{resources.IMAGES_PATH}weapons\\effects\\floor_flames\\loop',2, enums.ConvertType.CONVERT_ALPHA)
+        )
+    return _floor_flames_frames
+
+def preload_bullet(bullet_type: enums.BulletType, scale: float = 1):
+    """Loads and rotates the image of the specified bullet type ahead of time, so the first shot doesn't hit the disk.
+
+    Args:
+        bullet_type (enums.BulletType): The type of the bullet.
+        scale (float, optional): The scale of the image. Defaults to 1.
+    """
+    if bullet_type == enums.BulletType.MELEE:
+        return
+    get_rotated_bullet(bullet_type, scale, 0)
@@ -0,0 +1,75 @@
+import time
+
+_source = time.perf_counter
+"""The function that returns the current time in seconds. Replaced by `set_source` to drive the game from a simulated clock."""
+_paused = False
+_scale = 1
+_anchor_source_ms = _source() * 1000
+"""The source time when the clock was last paused, resumed or rescaled."""
+_anchor_game_ms = _anchor_source_ms
+"""The game time when the clock was last paused, resumed or rescaled."""
+
+def _source_ms():
+    return _source() * 1000
+
+def _anchor():
+    global _anchor_source_ms, _anchor_game_ms
+    _anchor_game_ms = now_ms()
+    _anchor_source_ms = _source_ms()
+
+def now_ms():
+    """Gets the current game time. It doesn't advance while paused, and advances `scale` times faster than the source.
+
+    Returns:
+        float: The time in milliseconds, from a monotonic source.
+    """
+    if _paused:
+        return _anchor_game_ms
+    return _anchor_game_ms + (_source_ms() - _anchor_source_ms) * _scale
+
+def pause():
+    """Freezes the game time, so the timers don't run out while the game is paused."""
+    global _paused
+    if _paused:
+        return
+    _anchor()
+    _paused = True
+
+def resume():
+    """Continues the game time from where it was paused."""
+    global _paused, _anchor_source_ms
+    if not _paused:
+        return
+    _anchor_source_ms = _source_ms()
+    _paused = False
+
+def is_paused():
+    return _paused
+
+def set_scale(scale: float):
+    """Changes the speed of the game time, without jumping.
+
+    Args:
+        scale (float): How many game milliseconds pass for each millisecond of the source.
+    """
+    global _scale
+    _anchor()
+    _scale = scale
+
+def get_scale():
+    return _scale
+
+def set_source(source):
+    """Replaces the time source of the game, such as the simulated clock of a headless run. The game time continues from its current value.
+
+    Args:
+        source (callable): A function with no arguments that returns the current time in seconds.
+    """
+    global _source, _anchor_source_ms
+    _anchor()
+    _source = source
+    _anchor_source_ms = _source_ms()
+
+def reset_source():
+    """Restores the real monotonic time source."""
+    set_source(time.perf_counter)
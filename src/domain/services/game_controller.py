@@ -1,10 +1,13 @@
 import pygame, socket, threading, time
 from pygame.math import Vector2 as vec
+from collections import OrderedDict
 import math
 import os
 
 from domain.utils import constants, enums
-from domain.services import menu_controller, resources
+from domain.services import menu_controller, resources, game_clock, pixel_cache, asset_archive
+from domain.models.network_data import Data as NetData, MAX_PACKET_SIZE, NetSession
+from domain.models.spatial_hash import SpatialHashGroup
 
 screen_size: vec = vec(0,0)
 map_size: vec = vec(0,0)
@@ -12,14 +15,43 @@ map_size: vec = vec(0,0)
 bullet_target_groups = []
 enemy_target_groups = []
 collision_group = None
+scheduler = None
 players_groups = None
 
 enemies_count = 0
 bullets_count = 0
 
-_enemy_netdata_keys = None
-_bullet_netdata_keys = None
-_waveresult_netdata_keys = None
+CULL_MARGIN = 100
+"""How far outside the screen, in pixels, objects are still drawn, so sprites bigger than their rect don't pop in at the edges."""
+
+ROTATION_STEP = 1
+"""The angle granularity, in degrees, of the rotated images cached by `get_rotated_image`."""
+ROTATION_CACHE_SIZE = 1024
+"""The maximum number of rotated images kept before the least recently used one is dropped."""
+_rotation_cache: OrderedDict = OrderedDict()
+rotation_cache_hits = 0
+rotation_cache_misses = 0
+
+IMAGE_CACHE_SIZE = 256
+"""The maximum number of surfaces kept by `load_image` before the least recently used one is dropped."""
+_image_cache: OrderedDict = OrderedDict()
+image_cache_hits = 0
+image_cache_misses = 0
+
+def spritecollide(sprite: pygame.sprite.Sprite, group: pygame.sprite.Group, collided = None):
+    """Gets the sprites of the group that collide with the sprite, using the group's spatial hash when it has one.
+
+    Args:
+        sprite (pygame.sprite.Sprite): The sprite to test against the group.
+        group (pygame.sprite.Group): The group of targets.
+        collided (callable, optional): The narrow collision test, like `pygame.sprite.collide_circle`. Defaults to None, which compares the rects.
+
+    Returns:
+        list[pygame.sprite.Sprite]: The colliding sprites.
+    """
+    if isinstance(group, SpatialHashGroup):
+        return group.spritecollide(sprite, collided)
+    return pygame.sprite.spritecollide(sprite, group, False, collided)
 
 def get_enemy_id():
     global enemies_count
@@ -88,6 +120,7 @@ def restart_game(game):
         game (domain.engine.game): The game to be restarted.
     """
     menu_controller.pages_history = menu_controller.pages_history[:-1]
+    game_clock.resume()
     menu_controller.pages_history[-1].start_game(game.client_type)
     
 def load_sounds(folder_path: str, volume: int = 1):
@@ -100,10 +133,10 @@ def load_sounds(folder_path: str, volume: int = 1):
         list[mixer.Sound]: A list of the sounds.
     """    
     _path = resources.ROOT_PATH + folder_path
-    if not os.path.exists(_path):
+    if not asset_archive.exists(_path):
         return
     
-    sounds = [pygame.mixer.Sound(_path + "\\" + img) for img in os.listdir(_path) if img.endswith('.mp3')]
+    sounds = [asset_archive.load_sound(_path + "\\" + img) for img in asset_archive.listdir(_path) if img.endswith('.mp3')]
     if volume != 1:
         for s in sounds:
             s.set_volume(volume)
@@ -119,21 +152,36 @@ def load_sprites(folder_path: str, scale = 1, convert_type: enums.ConvertType =
         list[pygame.Surface]: A list of the images.
     """    
     _path = resources.ROOT_PATH + folder_path
-    if not os.path.exists(_path):
+    if not asset_archive.exists(_path):
         return
     
-    if scale != 1:
-        images = [scale_image(pygame.image.load(_path + "\\" + img), scale) for img in os.listdir(_path) if img.endswith('.png')]
-    else:
-        images = [pygame.image.load(_path + "\\" + img) for img in os.listdir(_path) if img.endswith('.png')]
+    return [load_processed_image(_path + "\\" + img, scale, convert_type) for img in asset_archive.listdir(_path) if img.endswith('.png')]
+
+def load_processed_image(path: str, scale: float = 1, convert_type: enums.ConvertType = enums.ConvertType.NO_CONVERT):
+    """Loads, scales and converts an image, reading the final pixels from `pixel_cache` when it was processed in a previous run.
+
+    Args:
+        path (str): The path to the image file.
+        scale (float, optional): The scale proportional to the original image (1.5, 2.0, 0.5...). Defaults to 1.
+        convert_type (enums.ConvertType, optional): The pixel format conversion to apply. Defaults to enums.ConvertType.NO_CONVERT.
+
+    Returns:
+        pygame.Surface: A new surface with the processed image.
+    """
+    image = pixel_cache.load(path, scale, convert_type)
+    if image != None:
+        return image
     
+    image = asset_archive.load_image(path)
+    if scale != 1:
+        image = scale_image(image, scale)
     match convert_type:
         case enums.ConvertType.CONVERT:
-            return [x.convert() for x in images]
+            image = image.convert()
         case enums.ConvertType.CONVERT_ALPHA:
-            return [x.convert_alpha() for x in images]
-        case _:
-            return images
+            image = image.convert_alpha()
+    pixel_cache.save(path, scale, convert_type, image)
+    return image
     
 def scale_image(image: pygame.Surface, scale: float, convert_type: enums.ConvertType = enums.ConvertType.NO_CONVERT):
     """Scales a image to the given float size.
@@ -155,19 +203,168 @@ def scale_image(image: pygame.Surface, scale: float, convert_type: enums.Convert
         case _:
             return img
 
+def mirror_frames(frames: list[pygame.Surface], flip_x = True, flip_y = False, mirrors: dict = None):
+    """Creates a mirrored copy of each frame. Meant to be called once at load time, so animations can pick
+    the frame for their facing direction instead of flipping it every frame.
+
+    Args:
+        frames (list[pygame.Surface]): The frames to be mirrored.
+        flip_x (bool, optional): If the frames should be mirrored horizontally. Defaults to True.
+        flip_y (bool, optional): If the frames should be mirrored vertically. Defaults to False.
+        mirrors (dict, optional): A lookup where each frame and its mirror are registered, both ways, to be used with `get_mirror`. Defaults to None.
+
+    Returns:
+        list[pygame.Surface]: The mirrored frames, in the same order.
+    """
+    mirrored = [pygame.transform.flip(f, flip_x, flip_y) for f in frames]
+    if mirrors != None:
+        for f, m in zip(frames, mirrored):
+            mirrors[f] = m
+            mirrors[m] = f
+    return mirrored
+
+def get_mirror(image: pygame.Surface, mirrors: dict, flip_x = True, flip_y = False):
+    """Gets the mirror of an image registered by `mirror_frames`, flipping it only if it wasn't registered.
+
+    Args:
+        image (pygame.Surface): The image to be mirrored.
+        mirrors (dict): The lookup the frames were registered in.
+        flip_x (bool, optional): If the image should be mirrored horizontally, when not registered. Defaults to True.
+        flip_y (bool, optional): If the image should be mirrored vertically, when not registered. Defaults to False.
+
+    Returns:
+        pygame.Surface: The mirrored image.
+    """
+    mirrored = mirrors.get(image)
+    if mirrored == None:
+        mirrored = pygame.transform.flip(image, flip_x, flip_y)
+    return mirrored
+
+def load_image(path: str, scale: float = 1, convert_type: enums.ConvertType = enums.ConvertType.NO_CONVERT):
+    """Loads an image from disk only the first time it's requested, returning a cached surface afterwards.
+
+    The returned surface is shared between every caller, so it must not be drawn on or modified.
+
+    Args:
+        path (str): The path to the image file.
+        scale (float, optional): The scale proportional to the original image (1.5, 2.0, 0.5...). Defaults to 1.
+        convert_type (enums.ConvertType, optional): The pixel format conversion to apply. Defaults to enums.ConvertType.NO_CONVERT.
+
+    Returns:
+        pygame.Surface: The loaded, scaled and converted image.
+    """
+    global image_cache_hits, image_cache_misses
+    
+    key = (path, scale, convert_type)
+    image = _image_cache.get(key)
+    if image != None:
+        image_cache_hits += 1
+        _image_cache.move_to_end(key)
+        return image
+    
+    image_cache_misses += 1
+    if scale == 1:
+        image = load_processed_image(path, 1, convert_type)
+    else:
+        image = pixel_cache.load(path, scale, convert_type)
+        if image == None:
+            # the unscaled source is cached as well, so other scales of the same file don't hit the disk again
+            image = scale_image(load_image(path), scale, convert_type)
+            pixel_cache.save(path, scale, convert_type, image)
+    
+    _image_cache[key] = image
+    if len(_image_cache) > IMAGE_CACHE_SIZE:
+        _image_cache.popitem(last=False)
+    return image
+
+def clear_image_cache():
+    """Removes every surface from the `load_image` cache and resets its hit/miss counters."""
+    global image_cache_hits, image_cache_misses
+    _image_cache.clear()
+    image_cache_hits = 0
+    image_cache_misses = 0
+
+def net_time_ms():
+    """Gets the time used to timestamp and interpolate the states exchanged with the other player.
+
+    Returns:
+        float: A monotonic time in milliseconds.
+    """
+    return time.perf_counter() * 1000
+
 def angle_to_mouse(pos: vec, mouse_pos: vec):
     rel_x, rel_y = mouse_pos.x - pos.x, mouse_pos.y - pos.y
     return (180 / math.pi) * -math.atan2(rel_y, rel_x)
     
-def rotate_to_angle(image: pygame.Surface, pos:vec, angle: float):
-    _image = pygame.transform.rotate(image, int(angle))
+def get_rotated_image(image: pygame.Surface, angle: float, step: float = None, cache: bool = True):
+    """Gets the image rotated to the specified angle, truncated to a multiple of `step`, rotating it only the first time.
+
+    The images are cached by identity, so mirrored frames have their own entries. The returned surface is shared,
+    so it must not be drawn on or modified.
+
+    Only immutable frames may be cached: a surface redrawn in place keeps its identity, so the cache would return its old
+    content, and a surface created every frame would only fill the cache. Those are rotated with `cache` set to False.
+
+    Args:
+        image (pygame.Surface): The image to be rotated.
+        angle (float): The angle in degrees.
+        step (float, optional): The angle granularity. Defaults to ROTATION_STEP.
+        cache (bool, optional): If the rotated image is read from and stored in the cache. Defaults to True.
+
+    Returns:
+        pygame.Surface: The rotated image.
+    """
+    global rotation_cache_hits, rotation_cache_misses
+    if step == None:
+        step = ROTATION_STEP
+    _angle = (int(angle / step) * step) % 360
+    if not cache:
+        return pygame.transform.rotate(image, _angle)
+    
+    key = (id(image), _angle)
+    cached = _rotation_cache.get(key)
+    # the source image is kept with the result, so its id can't be reused by another surface while cached
+    if cached != None and cached[0] is image:
+        rotation_cache_hits += 1
+        _rotation_cache.move_to_end(key)
+        return cached[1]
+    
+    rotation_cache_misses += 1
+    rotated_image = pygame.transform.rotate(image, _angle)
+    _rotation_cache[key] = (image, rotated_image)
+    _rotation_cache.move_to_end(key)
+    if len(_rotation_cache) > ROTATION_CACHE_SIZE:
+        _rotation_cache.popitem(last=False)
+    return rotated_image
+
+def clear_rotation_cache():
+    """Removes every image from the `get_rotated_image` cache and resets its hit/miss counters."""
+    global rotation_cache_hits, rotation_cache_misses
+    _rotation_cache.clear()
+    rotation_cache_hits = 0
+    rotation_cache_misses = 0
+
+def rotate_to_angle(image: pygame.Surface, pos:vec, angle: float, cache: bool = True):
+    _image = get_rotated_image(image, angle, cache = cache)
     _rect = _image.get_rect(center= pos)
     return _image, _rect
 
 def rotate_image(image: pygame.Surface, angle: float):
-    rotated_image = pygame.transform.rotate(image, angle)
+    rotated_image = get_rotated_image(image, angle)
     return rotated_image
 
+def get_view_rect(offset: vec, margin: float = CULL_MARGIN):
+    """Gets the area of the map visible on the screen, used to skip drawing what is off-screen.
+
+    Args:
+        offset (vec): The camera offset.
+        margin (float, optional): How much to grow the area on each side. Defaults to CULL_MARGIN.
+
+    Returns:
+        pygame.Rect: The visible area, in map coordinates.
+    """
+    return pygame.Rect(offset.x - margin, offset.y - margin, screen_size.x + margin*2, screen_size.y + margin*2)
+
 def point_to_angle_distance(pos: vec,distance: float, angle_in_radians: float):
     x = pos.x + (distance*math.cos(angle_in_radians))
     y = pos.y + (distance*math.sin(angle_in_radians))
@@ -226,36 +423,58 @@ def try_enter_game(game, host: str, port: int, timeout = 2):
         return False
        
 
-send_count = 0
-receive_count = 0
+SEND_INTERVAL_S = 1 / 30
+"""The minimum time between two packets sent to the other player. The remote entities are interpolated between packets, so this doesn't need to follow the frame rate."""
 
 def handle_connection(game, client: socket.socket, remote_address: tuple[str, int]):
-    """Function executing on a different thread, sending and receiving data from players.
+    """Function executing on a different thread, receiving data from the other player while a second thread sends it.
+
+    Neither thread touches the game objects: the main loop hands its state to `game.net_outbox` and applies the
+    newest received state from `game.net_inbox`, once per frame.
 
     Args:
         game (domain.engine.game): The game object.
         client (socket.socket): The client object.
-        player_id (int): The ID of the player executing this function.
+        remote_address (tuple[str, int]): The address of the other player.
     """ 
     client.settimeout(2)
+    session = NetSession()
+    
+    sender = threading.Thread(target=send_loop, args=(game, client, remote_address, session))
+    sender.start()
     
     while menu_controller.playing:
+        try:
+            received_buffer = client.recvfrom(MAX_PACKET_SIZE)[0]
+        except (ConnectionResetError, TimeoutError):
+            # a lost packet only delays the next state, it doesn't stop the sending
+            continue
         
-        #sending
-        net_data = game.get_net_data()
-        data_to_send = net_data._get_buffer()
-        client.sendto(data_to_send, remote_address)
-        
-        #receiving
-        received_buffer = client.recvfrom(4096)[0]
-        net_data._load_buffer(received_buffer)
-        # print(len(received_buffer))
-        
-        game.handle_received_data(net_data)
-            
-        time.sleep(0.01)
-              
+        net_data = NetData()
+        # ignores stale packets and packets from a different protocol version
+        if net_data._load_buffer(received_buffer, session):
+            game.net_inbox.put(net_data)
     
+    sender.join()
     print("closing connection")
     client.close()
-    
+
+def send_loop(game, client: socket.socket, remote_address: tuple[str, int], session: NetSession):
+    """Function executing on a different thread, sending the newest state of the game to the other player.
+
+    Args:
+        game (domain.engine.game): The game object.
+        client (socket.socket): The client object.
+        remote_address (tuple[str, int]): The address of the other player.
+        session (NetSession): The replication state of this connection.
+    """
+    while menu_controller.playing:
+        net_data = game.net_outbox.take()
+        if net_data != None:
+            try:
+                client.sendto(net_data._get_buffer(session), remote_address)
+            except OSError:
+                # an unreachable host or a full buffer only drops this state, the next one is sent after the interval
+                pass
+
+        time.sleep(SEND_INTERVAL_S)
@@ -1,9 +1,10 @@
-import pygame, sys, datetime, time
+import pygame, sys, time
+from collections import OrderedDict
 from pygame import locals as ls
 from pygame.math import Vector2 as vec
 
 from domain.services.save_manager import SaveManager
-from domain.services import resources
+from domain.services import resources, game_clock, profiler, asset_archive
 from domain.utils import constants, enums, math_utillity as math, colors
 from domain.models.ui.popup_text import Popup
 
@@ -26,6 +27,12 @@ config_state = {
 buttons = []
 dt = 0
 
+TEXT_CACHE_SIZE = 512
+"""The maximum number of rendered texts kept by `get_text_surface` before the least recently used one is dropped."""
+_text_cache: OrderedDict = OrderedDict()
+text_cache_hits = 0
+text_cache_misses = 0
+
 
 popup_group = pygame.sprite.Group()
 
@@ -55,20 +62,48 @@ def popup(popup: Popup, center = False):
 def quit_app():
     """Stops the game and closes application.
     """
+    profiler.stop_csv()
     pygame.display.quit()
     pygame.quit()
     sys.exit()
     
 
-def get_text_surface(text: str, color: tuple[int,int,int], font: pygame.font.Font):      
+def get_text_surface(text: str, color: tuple[int,int,int], font: pygame.font.Font):
+    """Renders the text, reusing the surface rendered before with the same text, color and font.
+
+    Args:
+        text (str): The text to render.
+        color (tuple[int,int,int]): The color of the text, optionally with alpha.
+        font (pygame.font.Font): The font. Fonts from `resources.get_font` are shared, so labels rendered from different places hit the same entry.
+
+    Returns:
+        pygame.Surface: The shared text surface. It must not be modified.
+    """
+    global text_cache_hits, text_cache_misses
     r, g, b, *a = color
-    color = (r,g,b)
-            
-    text_surface = font.render(text, False, color)
+    key = (text, r, g, b, a[0] if len(a) > 0 else None, font)
+    text_surface = _text_cache.get(key)
+    if text_surface != None:
+        text_cache_hits += 1
+        _text_cache.move_to_end(key)
+        return text_surface
+
+    text_cache_misses += 1
+    text_surface = font.render(text, False, (r,g,b))
     if len(a) > 0:
         text_surface.set_alpha(a[0])
+    _text_cache[key] = text_surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last = False)
     return text_surface
 
+def clear_text_cache():
+    """Drops all the rendered texts and resets the hit stats."""
+    global text_cache_hits, text_cache_misses
+    _text_cache.clear()
+    text_cache_hits = 0
+    text_cache_misses = 0
+
 def is_current_page(page):
     global pages_history
     return pages_history[-1].name == page.name
@@ -114,11 +149,11 @@ def remove_btns(btns):
             
     sort_btn_index(buttons)
 
-def fade_out_color(color: tuple[int,int,int], start_alpha: int, start_time: datetime.datetime, end_time: datetime.datetime):
+def fade_out_color(color: tuple[int,int,int], start_alpha: int, start_time: float, end_time: float):
         
-        now = datetime.datetime.now().timestamp()
-        start = start_time.timestamp()
-        end = end_time.timestamp()
+        now = game_clock.now_ms()
+        start = start_time
+        end = end_time
         
         if start > now:
             return colors.alpha_or_default(color, start_alpha)
@@ -129,11 +164,11 @@ def fade_out_color(color: tuple[int,int,int], start_alpha: int, start_time: date
         alpha = math.clamp(alpha, 0, start_alpha)
         return colors.set_alpha(color, int(alpha))
 
-def fade_in_color(color: tuple[int,int,int], target_alpha: int, start_time: datetime.datetime, end_time: datetime.datetime):
+def fade_in_color(color: tuple[int,int,int], target_alpha: int, start_time: float, end_time: float):
         
-        now = datetime.datetime.now().timestamp()
-        start = start_time.timestamp()
-        end = end_time.timestamp()
+        now = game_clock.now_ms()
+        start = start_time
+        end = end_time
         
         if start > now:
             return colors.alpha_or_default(color, 0)
@@ -144,9 +179,14 @@ def fade_in_color(color: tuple[int,int,int], target_alpha: int, start_time: date
         alpha = math.clamp(alpha, 0, target_alpha)
         return colors.set_alpha(color, int(alpha))
 
+_music_file = None
+"""The file the music is streamed from, kept referenced while it plays."""
+
 def play_music(music_name, volume: float, repeat_count: int = -1 ):
+    global _music_file
     pygame.mixer.music.stop()
-    pygame.mixer.music.load(music_name)
+    _music_file = asset_archive.open_file(music_name)
+    pygame.mixer.music.load(_music_file, music_name.split(".")[-1])
     pygame.mixer.music.set_volume(volume)
     pygame.mixer.music.play(repeat_count)
         
@@ -159,6 +199,7 @@ def app_loop():
     while 1:
         dt = (time.time() - last_frame_time) * 60
         last_frame_time = time.time()
+        profiler.begin_frame()
         
         current_page = pages_history[-1]
 
@@ -166,6 +207,13 @@ def app_loop():
         for event in _events:
             if event.type == pygame.QUIT:
                 quit_app()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and profiler.enabled:
+                if profiler.is_recording():
+                    profiler.stop_csv()
+                else:
+                    profiler.start_csv(f'{resources.ROOT_PATH}profile.csv')
             if event.type == pygame.KEYDOWN and current_page.name == "Game":
                 if event.key == pygame.K_UP:
                     current_page.player.money += 100
@@ -177,18 +225,27 @@ def app_loop():
             
         # update
         current_page.update(events = _events)
+        profiler.lap("update")
         popup_group.update()
+        profiler.lap("popups")
         
         # draw
         current_page.draw()
+        profiler.lap("draw")
         
         for p in popup_group.sprites():
             p.draw(current_page.screen)
+        profiler.lap("popups")
             
-        _txt_fps = get_text_surface(f'fps: {clock.get_fps():.0f}', colors.LIGHT_GRAY, pygame.font.SysFont('calibri', 20))
+        _txt_fps = get_text_surface(f'fps: {clock.get_fps():.0f}', colors.LIGHT_GRAY, resources.sys_font('calibri', 20))
         _txt_fps_rect = _txt_fps.get_rect()
         _txt_fps_rect.topright = (current_page.screen.get_width() - 20, 20)
         current_page.screen.blit(_txt_fps, _txt_fps_rect)
+        profiler.draw(current_page.screen, resources.sys_font('consolas', 16))
+        profiler.lap("hud")
             
         pygame.display.update()
-        clock.tick(60)
\ No newline at end of file
+        profiler.lap("display")
+        clock.tick(60)
+        profiler.lap("idle")
+        profiler.end_frame()
\ No newline at end of file
@@ -0,0 +1,146 @@
+import os, mmap, struct, hashlib, threading
+import pygame
+
+from domain.utils import enums
+from domain.services import resources, asset_archive
+
+enabled = True
+"""If the loaded images are read from and written to the cache directory."""
+
+_HEADER = struct.Struct("<4sIII")
+"""The magic bytes, the width, the height and the index of the pixel format in `_FORMATS`."""
+_MAGIC = b"NZPX"
+_FORMATS = ["RGB", "RGBA"]
+
+hits = 0
+misses = 0
+
+def _get_prefix(path: str, scale: float, convert_type: enums.ConvertType):
+    _key = f'{path}|{scale}|{convert_type.value}'
+    return f'{hashlib.sha1(_key.encode("utf-8")).hexdigest()}_'
+
+def get_cache_path(path: str, scale: float, convert_type: enums.ConvertType):
+    """Gets the cache file of an image. The key includes the modification time of the source, so edited images are processed again.
+
+    The name starts with a hash of the path, scale and conversion, followed by a hash of the source signature,
+    so `save` can find and delete the files of the previous versions of the same image.
+
+    Args:
+        path (str): The path to the source image.
+        scale (float): The scale applied to the image.
+        convert_type (enums.ConvertType): The pixel format conversion applied to the image.
+
+    Returns:
+        str: The path to the cache file, or None if the source doesn't exist.
+    """
+    _signature = asset_archive.get_signature(path)
+    if _signature == None:
+        return None
+    _signature_key = hashlib.sha1(f'{_signature[0]}|{_signature[1]}'.encode("utf-8")).hexdigest()[:16]
+    return f'{resources.CACHE_PATH}{_get_prefix(path, scale, convert_type)}{_signature_key}.px'
+
+def load(path: str, scale: float = 1, convert_type: enums.ConvertType = enums.ConvertType.NO_CONVERT):
+    """Reads the processed pixels of an image from the cache, skipping the PNG decoding and the scaling.
+
+    Args:
+        path (str): The path to the source image.
+        scale (float, optional): The scale applied to the image. Defaults to 1.
+        convert_type (enums.ConvertType, optional): The pixel format conversion applied to the image. Defaults to enums.ConvertType.NO_CONVERT.
+
+    Returns:
+        pygame.Surface: The image, or None if it's not cached yet.
+    """
+    global hits, misses
+    if not enabled:
+        return None
+    _cache_path = get_cache_path(path, scale, convert_type)
+    if _cache_path == None or not os.path.exists(_cache_path) or os.path.getsize(_cache_path) < _HEADER.size:
+        misses += 1
+        return None
+
+    with open(_cache_path, "rb") as f:
+        # a private copy-on-write mapping, so the pages are read lazily and the surface can't write back to the file
+        _buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    _magic, _width, _height, _format = _HEADER.unpack_from(_buffer)
+    if _magic != _MAGIC or _format >= len(_FORMATS) or len(_buffer) != _HEADER.size + _width * _height * len(_FORMATS[_format]):
+        misses += 1
+        return None
+
+    # the surface keeps a reference to the mapping, which is closed when the surface is collected
+    image = pygame.image.frombuffer(memoryview(_buffer)[_HEADER.size:], (_width, _height), _FORMATS[_format])
+    hits += 1
+    match convert_type:
+        case enums.ConvertType.CONVERT:
+            return image.convert()
+        case enums.ConvertType.CONVERT_ALPHA:
+            return image.convert_alpha()
+        case _:
+            return image
+
+def save(path: str, scale: float, convert_type: enums.ConvertType, image: pygame.Surface):
+    """Writes the processed pixels of an image to the cache, to be read by `load` on the next runs.
+
+    Images with a color key are not cached, since the raw pixels don't keep it.
+
+    Args:
+        path (str): The path to the source image.
+        scale (float): The scale applied to the image.
+        convert_type (enums.ConvertType): The pixel format conversion applied to the image.
+        image (pygame.Surface): The loaded, scaled and converted image.
+    """
+    if not enabled or image.get_colorkey() != None:
+        return
+    _cache_path = get_cache_path(path, scale, convert_type)
+    if _cache_path == None:
+        return
+
+    _format = 1 if image.get_flags() & pygame.SRCALPHA else 0
+    _temp_path = f'{_cache_path}.{os.getpid()}_{threading.get_ident()}.tmp'
+    try:
+        os.makedirs(resources.CACHE_PATH, exist_ok=True)
+        with open(_temp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, image.get_width(), image.get_height(), _format))
+            f.write(pygame.image.tobytes(image, _FORMATS[_format]))
+        # replaced at once, so a game loading the same image never reads a half written file
+        os.replace(_temp_path, _cache_path)
+    except OSError:
+        # the cache is only an optimization, the image was already loaded
+        return
+    _prune(path, scale, convert_type, _cache_path)
+
+def _prune(path: str, scale: float, convert_type: enums.ConvertType, cache_path: str):
+    """Deletes the files cached for older versions of an image, which are never read again once the source changes.
+
+    Args:
+        path (str): The path to the source image.
+        scale (float): The scale applied to the image.
+        convert_type (enums.ConvertType): The pixel format conversion applied to the image.
+        cache_path (str): The current cache file of the image, which is kept.
+    """
+    _prefix = _get_prefix(path, scale, convert_type)
+    _current = cache_path[len(resources.CACHE_PATH):]
+    for name in os.listdir(resources.CACHE_PATH):
+        if not name.startswith(_prefix) or not name.endswith(".px") or name == _current:
+            continue
+        try:
+            os.remove(resources.CACHE_PATH + name)
+        except OSError:
+            # still mapped by a loaded surface on Windows, it's deleted the next time the image is cached
+            continue
+
+def clear():
+    """Deletes all the cached images.
+
+    The older versions of an edited image are already deleted when it's cached again, but the files of deleted or
+    renamed images are only removed by this.
+    """
+    if not os.path.isdir(resources.CACHE_PATH):
+        return
+    for name in os.listdir(resources.CACHE_PATH):
+        if not name.endswith(".px"):
+            continue
+        try:
+            os.remove(resources.CACHE_PATH + name)
+        except OSError:
+            # still mapped by a loaded surface on Windows, it's replaced when the image is cached again
+            continue
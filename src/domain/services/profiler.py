@@ -0,0 +1,169 @@
+import pygame, time, csv
+from collections import deque
+
+from domain.utils import colors
+
+WINDOW_SIZE = 240
+"""How many frames are kept to compute the rolling average and percentiles."""
+OVERLAY_REFRESH_FRAMES = 15
+"""How often the overlay text is re-rendered, so the numbers are readable and the text isn't rasterised every frame."""
+
+enabled = False
+"""If the frame phases are being timed. Timing is skipped entirely while disabled."""
+
+_phases: dict[str, deque] = {}
+"""The duration in milliseconds of each phase in the last frames, in the order the phases first ran."""
+_counters: dict[str, int] = {}
+"""Values counted during the current frame, such as drawn or culled objects."""
+_current: dict[str, float] = {}
+_last_lap: float = None
+_frame_start: float = None
+"""When the current frame started, or None until `begin_frame` runs after the timing is enabled."""
+_frames_since_refresh = 0
+_overlay: pygame.Surface = None
+_csv_path: str = None
+_csv_rows: list[dict[str, str]] = []
+"""The recorded frames, written when the recording stops, so phases that first run later still get their columns."""
+_csv_columns: dict[str, None] = {}
+"""The columns of the CSV file, in the order they first appeared."""
+
+def toggle():
+    """Shows or hides the overlay, starting or stopping the timing with it."""
+    global enabled, _overlay, _last_lap, _frame_start
+    enabled = not enabled
+    _overlay = None
+    # toggled in the middle of a frame, so nothing is timed until the next `begin_frame`
+    _current.clear()
+    _counters.clear()
+    _last_lap = _frame_start = None
+    if not enabled:
+        _phases.clear()
+        stop_csv()
+
+def begin_frame():
+    """Marks the start of a frame. Must be called before any `lap` of the frame."""
+    global _last_lap, _frame_start
+    if not enabled:
+        return
+    _current.clear()
+    _counters.clear()
+    _frame_start = _last_lap = time.perf_counter()
+
+def lap(name: str):
+    """Attributes the time since the previous lap to the specified phase. Phases that run more than once in a frame are summed.
+
+    Args:
+        name (str): The name of the phase that just ended.
+    """
+    global _last_lap
+    if not enabled or _frame_start == None:
+        return
+    _now = time.perf_counter()
+    _current[name] = _current.get(name, 0) + (_now - _last_lap) * 1000
+    _last_lap = _now
+
+def count(name: str, value: int = 1):
+    """Adds to a counter of the current frame, shown in the overlay.
+
+    Args:
+        name (str): The name of the counter.
+        value (int, optional): The amount to add. Defaults to 1.
+    """
+    if not enabled:
+        return
+    _counters[name] = _counters.get(name, 0) + value
+
+def end_frame():
+    """Stores the phases of the frame in the rolling window and writes them to the CSV file, if recording."""
+    global _frames_since_refresh
+    if not enabled or _frame_start == None:
+        return
+    _current["frame"] = (time.perf_counter() - _frame_start) * 1000
+    for name, value in _current.items():
+        _samples = _phases.get(name)
+        if _samples == None:
+            _samples = _phases[name] = deque(maxlen=WINDOW_SIZE)
+        _samples.append(value)
+
+    if is_recording():
+        _record_csv_row()
+    _frames_since_refresh += 1
+
+def stats(name: str):
+    """Gets the rolling statistics of a phase.
+
+    Args:
+        name (str): The name of the phase.
+
+    Returns:
+        tuple[float, float, float]: The average, 95th and 99th percentile durations in milliseconds, or zeros if it never ran.
+    """
+    _samples = _phases.get(name)
+    if _samples == None or len(_samples) == 0:
+        return 0, 0, 0
+    _sorted = sorted(_samples)
+    _last = len(_sorted) - 1
+    return sum(_sorted) / len(_sorted), _sorted[round(_last * 0.95)], _sorted[round(_last * 0.99)]
+
+def draw(screen: pygame.Surface, font: pygame.font.Font):
+    """Draws the overlay with the rolling statistics of each phase and the counters of the last frame.
+
+    Args:
+        screen (pygame.Surface): The surface to draw on.
+        font (pygame.font.Font): The font of the overlay text.
+    """
+    global _overlay, _frames_since_refresh
+    if not enabled:
+        return
+    if _overlay == None or _frames_since_refresh >= OVERLAY_REFRESH_FRAMES:
+        _frames_since_refresh = 0
+        _lines = [f'{"phase":<14}{"avg":>7}{"p95":>7}{"p99":>7}']
+        for name in _phases.keys():
+            _avg, _p95, _p99 = stats(name)
+            _lines.append(f'{name:<14}{_avg:>7.2f}{_p95:>7.2f}{_p99:>7.2f}')
+        for name, value in _counters.items():
+            _lines.append(f'{name:<14}{value:>7}')
+        if is_recording():
+            _lines.append("recording csv")
+
+        _rendered = [font.render(l, False, colors.WHITE) for l in _lines]
+        _line_height = font.get_linesize()
+        _overlay = pygame.Surface((max(r.get_width() for r in _rendered) + 10, _line_height * len(_rendered) + 10), pygame.SRCALPHA)
+        _overlay.fill(colors.set_alpha(colors.BLACK, 160))
+        for i, r in enumerate(_rendered):
+            _overlay.blit(r, (5, 5 + i * _line_height))
+
+    screen.blit(_overlay, (10, 10))
+
+def start_csv(path: str):
+    """Starts recording a row with the duration of each phase for every frame.
+
+    Args:
+        path (str): The path of the CSV file, overwritten when the recording stops.
+    """
+    global _csv_path, _csv_rows, _csv_columns
+    stop_csv()
+    _csv_path = path
+    _csv_rows, _csv_columns = [], {}
+
+def stop_csv():
+    """Stops recording and writes the CSV file, with a column for every phase and counter that ran during the recording."""
+    global _csv_path, _csv_rows, _csv_columns
+    if _csv_path == None:
+        return
+    with open(_csv_path, "w", newline="") as f:
+        # phases that didn't run in a frame are left empty
+        _writer = csv.DictWriter(f, fieldnames = list(_csv_columns), restval = "")
+        _writer.writeheader()
+        _writer.writerows(_csv_rows)
+    _csv_path = None
+    _csv_rows, _csv_columns = [], {}
+
+def is_recording():
+    return _csv_path != None
+
+def _record_csv_row():
+    _row = {name: f'{value:.3f}' for name, value in _current.items()}
+    _row.update(_counters)
+    _csv_columns.update(dict.fromkeys(_row))
+    _csv_rows.append(_row)
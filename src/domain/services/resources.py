@@ -3,6 +3,7 @@ from enum import Enum
 from pygame.math import Vector2 as vec
 
 from domain.utils import colors, enums
+from domain.services import asset_archive
 
 
 ENVIRONMENT = enums.Environment.DEV
@@ -11,6 +12,13 @@ __SRC_DOMAIN = "src\\domain\\" if ENVIRONMENT == enums.Environment.DEV else ""
 #region Paths
 ROOT_PATH = f'{os.getcwd()}\\'
 SAVE_PATH = f'{ROOT_PATH}src\\saves\\' if ENVIRONMENT == enums.Environment.DEV else f'{ROOT_PATH}saves\\'
+CACHE_PATH = f'{ROOT_PATH}src\\cache\\' if ENVIRONMENT == enums.Environment.DEV else f'{ROOT_PATH}cache\\'
+"""The processed images written by `pixel_cache`. Safe to delete, it's rebuilt on the next loads."""
+
+RESOURCES_PATH = f"{__SRC_DOMAIN}resources\\"
+"""The folder of the game assets, relative to `ROOT_PATH`."""
+ARCHIVE_PATH = f"{ROOT_PATH}{__SRC_DOMAIN}resources.pak"
+"""The single file with all the assets bundled by `asset_archive.pack`. Read instead of the resources folder when it exists."""
 
 #images
 IMAGES_PATH = f"{__SRC_DOMAIN}resources\\images\\"
@@ -30,8 +38,37 @@ class Songs(Enum):
 #endregion
 
 #region fonts
+_fonts: dict[tuple[str, int, bool], pygame.font.Font] = {}
+font_cache_hits = 0
+font_cache_misses = 0
+
+def get_font(face: str, size: int, system: bool = False):
+    """Gets the font with the specified face and size, creating it only once.
+
+    Args:
+        face (str): The path of the font file, or the name of the system font.
+        size (int): The size of the font.
+        system (bool, optional): If the face is the name of a system font. Defaults to False.
+
+    Returns:
+        pygame.font.Font: The shared font. Its style must not be changed.
+    """
+    global font_cache_hits, font_cache_misses
+    key = (face, size, system)
+    font = _fonts.get(key)
+    if font == None:
+        font_cache_misses += 1
+        font = pygame.font.SysFont(face, size) if system else pygame.font.Font(face, size)
+        _fonts[key] = font
+    else:
+        font_cache_hits += 1
+    return font
+
 def px_font(size: int):
-    return pygame.font.Font(f'{FONTS_PATH}runescape_uf.ttf', size)
+    return get_font(f'{FONTS_PATH}runescape_uf.ttf', size)
+
+def sys_font(name: str, size: int):
+    return get_font(name, size, True)
 # endregion
 
 #region Anim Path
@@ -55,10 +92,10 @@ def get_weapon_path(weapon_name: enums.Weapons, action: enums.AnimActions):
 
 def get_bullet_path(bullet_type: enums.BulletType):
     path = f'{IMAGES_PATH}weapons\\bullets\\{str(bullet_type.value)}\\'
-    if not os.path.exists(path):
+    if not asset_archive.exists(path):
         return None
     
-    if len(os.listdir(path)) > 1:
+    if asset_archive.count(path) > 1:
         return path
     else:
         return f'{path}01.png'
@@ -70,20 +107,20 @@ def get_song(song_name: Songs):
 
 def get_player_sfx(character: enums.Characters, action: enums.AnimActions):
     path = f'{SOUNDS_PATH}sound_effects\\players\\{str(character.value)}\\{str(action.value)}\\'
-    if not os.path.exists(path):
+    if not asset_archive.exists(path):
         return None
     
-    if len(os.listdir(path)) > 1:
+    if asset_archive.count(path) > 1:
         return path
     else:
         return f'{path}01.mp3'
     
 def get_enemy_sfx(enemy: enums.Enemies, action: enums.AnimActions):
     path = f'{SOUNDS_PATH}sound_effects\\enemies\\{str(enemy.value)}\\{str(action.value)}\\'
-    if not os.path.exists(path):
+    if not asset_archive.exists(path):
         return None
     
-    if len(os.listdir(path)) > 1:
+    if asset_archive.count(path) > 1:
         return path
     else:
         return f'{path}01.mp3'
@@ -98,11 +135,11 @@ def get_weapon_sfx(weapon: enums.Weapons, action: enums.AnimActions):
         case enums.AnimActions.RELOAD_END:
             return f'{path.replace("_end","")}end.mp3'
         
-    if not os.path.exists(path):
+    if not asset_archive.exists(path):
         return None
     
     
-    if len(os.listdir(path)) > 1:
+    if asset_archive.count(path) > 1:
         return path
     else:
         return f'{path}{filename}.mp3'
@@ -1,5 +1,84 @@
-
 #Put in start, below groups declaration
 create_box = """_box = Rectangle(vec(50,120), (200,100), gravity_enabled = True, collision_enabled = True)
 self.collision_group.add(_box)
-self.test_objects.append(_box)"""
\ No newline at end of file
+self.test_objects.append(_box)"""
+
+
+class ObjectPool:
+    """Keeps the released instances of a class to be reset and reused, instead of building a new object every time one is needed.
+
+    The pooled class must have a `reset` method taking the same arguments as its constructor, and must call `release`
+    when it's done, usually from `kill()`. Objects acquired from the pool get its reference in `pool`.
+    """
+    def __init__(self, factory, max_size: int = 256):
+        self.factory = factory
+        """The class of the pooled objects, called to create new ones when the pool is empty."""
+        self.max_size = max_size
+        """The maximum number of free objects kept. Objects released above it are left to the garbage collector."""
+        self.free: list = []
+        """The released objects, waiting to be reused."""
+
+        self.active_count = 0
+        """The number of acquired objects not released yet."""
+        self.high_water_mark = 0
+        """The highest `active_count` reached since the stats were reset."""
+        self.created_count = 0
+        """The number of objects built because the pool was empty."""
+        self.reused_count = 0
+        """The number of objects reset and reused from the pool."""
+
+    def acquire(self, *args, **kwargs):
+        """Gets a free object reset with the specified arguments, or creates a new one if there are none.
+
+        Returns:
+            object: The object, ready to be used.
+        """
+        if len(self.free) > 0:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused_count += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.created_count += 1
+
+        obj.pool = self
+        obj.in_pool = False
+        self.active_count += 1
+        if self.active_count > self.high_water_mark:
+            self.high_water_mark = self.active_count
+        return obj
+
+    def release(self, obj):
+        """Returns an object to the pool. Objects already released or from another pool are ignored,
+        so it's safe to call from a `kill()` that may run more than once.
+
+        Args:
+            obj (object): The object to be released.
+        """
+        if obj.pool is not self or obj.in_pool:
+            return
+        obj.in_pool = True
+        self.active_count -= 1
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+
+    def stats(self):
+        """Gets the counters of the pool.
+
+        Returns:
+            dict: The active, free, high water mark, created and reused counts.
+        """
+        return {
+            "active": self.active_count,
+            "free": len(self.free),
+            "high_water_mark": self.high_water_mark,
+            "created": self.created_count,
+            "reused": self.reused_count
+        }
+
+    def clear(self):
+        """Drops the free objects and resets the stats. Objects still active are released normally later."""
+        self.free.clear()
+        self.high_water_mark = self.active_count
+        self.created_count = 0
+        self.reused_count = 0
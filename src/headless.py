@@ -0,0 +1,25 @@
+import argparse, time
+
+from domain.engine.headless import HeadlessRunner
+
+parser = argparse.ArgumentParser(description = "Runs the game waves without a window, at a fixed timestep.")
+parser.add_argument("--waves", type = int, default = 1, help = "How many waves to run.")
+parser.add_argument("--seed", type = int, default = 0, help = "The seed of the random generator.")
+parser.add_argument("--dt", type = float, default = 1, help = "The fixed frame step. 1 is a 60 fps frame.")
+args = parser.parse_args()
+
+runner = HeadlessRunner(seed = args.seed, dt = args.dt)
+runner.setup()
+
+_start = time.perf_counter()
+for _ in range(args.waves):
+    _wave_number = runner.game.current_wave.wave_number
+    _frame = runner.frame
+    _finished = runner.run_wave()
+    print(f"wave {_wave_number}: {'finished' if _finished else 'failed'} in {runner.frame - _frame} frames")
+    if not _finished:
+        break
+
+_elapsed = time.perf_counter() - _start
+print(f"{runner.frame} frames, {runner.time_ms/1000:.1f}s simulated, {_elapsed:.1f}s real, {runner.update_time_s*1000/max(runner.frame, 1):.3f}ms per update")
+runner.close()
@@ -0,0 +1,7 @@
+import time
+
+from domain.services import resources, asset_archive
+
+_start = time.perf_counter()
+_count = asset_archive.pack()
+print(f"packed {_count} files into {resources.ARCHIVE_PATH} in {time.perf_counter() - _start:.1f}s")
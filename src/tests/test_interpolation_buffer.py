@@ -0,0 +1,66 @@
+import unittest
+from pygame.math import Vector2 as vec
+
+from domain.models.interpolation_buffer import InterpolationBuffer
+
+FRAME_MS = 1000 / 60
+LATENCY_MS = 20
+
+def simulate(buffer: InterpolationBuffer, frames: int, speed: float = 5, send_every: int = 2, lost: range = range(0)):
+    """Moves an entity at a constant speed, sending its state every `send_every` frames, and samples the buffer every frame.
+
+    Args:
+        buffer (InterpolationBuffer): The buffer receiving the states.
+        frames (int): How many frames to simulate.
+        speed (float, optional): The speed of the entity, in pixels per frame. Defaults to 5.
+        send_every (int, optional): How many frames between two packets. Defaults to 2, 30 packets per second.
+        lost (range, optional): The frames whose packets are lost. Defaults to none.
+
+    Returns:
+        list[float]: The sampled x position of each frame.
+    """
+    _output = []
+    for frame in range(frames):
+        _time = frame * FRAME_MS
+        if frame % send_every == 0 and frame not in lost:
+            buffer.push(_time, vec(speed * frame, 0), vec(speed, 0), _time + LATENCY_MS)
+        _output.append(buffer.sample(_time + LATENCY_MS).x)
+    return _output
+
+class InterpolationBufferTests(unittest.TestCase):
+    def test_empty(self):
+        self.assertIsNone(InterpolationBuffer().sample(0))
+
+    def test_constant_velocity_is_uniform(self):
+        _output = simulate(InterpolationBuffer(), 120)
+        # skips the frames before the delay is filled
+        for i in range(30, len(_output) - 1):
+            self.assertAlmostEqual(_output[i + 1] - _output[i], 5, places = 3, msg = f'frame {i}')
+
+    def test_constant_velocity_lags_by_the_delay(self):
+        _buffer = InterpolationBuffer(delay_ms = 100)
+        _output = simulate(_buffer, 120)
+        self.assertAlmostEqual(5 * 119 - _output[-1], 5 * 100 / FRAME_MS, places = 3)
+
+    def test_lost_packets_are_predicted_smoothly(self):
+        _output = simulate(InterpolationBuffer(), 180, lost = range(60, 70))
+        for i in range(30, len(_output) - 1):
+            self.assertLess(abs(_output[i + 1] - _output[i] - 5), 1, msg = f'frame {i}')
+
+    def test_stop_is_corrected(self):
+        _buffer = InterpolationBuffer(max_extrapolation_ms = 200)
+        simulate(_buffer, 60)
+        _time = 60 * FRAME_MS
+        _buffer.push(_time, vec(300, 0), vec(0, 0), _time + LATENCY_MS)
+        for frame in range(60, 200):
+            _last = _buffer.sample(frame * FRAME_MS + LATENCY_MS)
+        self.assertAlmostEqual(_last.x, 300, places = 1)
+
+    def test_old_states_are_ignored(self):
+        _buffer = InterpolationBuffer()
+        _buffer.push(100, vec(0, 0), vec(0, 0), 100)
+        _buffer.push(50, vec(10, 0), vec(0, 0), 150)
+        self.assertEqual(len(_buffer), 1)
+
+if __name__ == "__main__":
+    unittest.main()
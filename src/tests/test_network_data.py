@@ -0,0 +1,218 @@
+import struct, unittest
+
+from domain.models import network_data
+from domain.models.network_data import Data, NetSession, PROTOCOL_VERSION
+from domain.utils import enums
+
+def make_enemy(id: int, **kwargs):
+    values = {
+        "id": id,
+        "name": f'zombie_{id}',
+        "enemy_name": enums.Enemies.Z_ROGER.name,
+        "image_scale": 1.5,
+        "rect": (id * 10, 400, 60, 90),
+        "is_alive": True,
+        "health": 100.0,
+        "pos": (id * 10.5, 400.25),
+        "jump_force": 12.0,
+        "damage": 15.5,
+        "movement_speed": 0.75,
+        "speed": (2.5, -1.0),
+        "acceleration": (0.0, 0.5),
+        "dir": (1.0, 0.0),
+        "running": True,
+        "attacking": False,
+        "grounded": True,
+        "dying": False,
+    }
+    values.update(kwargs)
+    return values
+
+def make_bullet(id: int, **kwargs):
+    values = {
+        "id": id,
+        "owner": 1,
+        "angle": 45.5,
+        "rect": (id, 200, 8, 4),
+        "speed": 30.0,
+        "damage": 20.0,
+        "bullet_type": enums.BulletType.PISTOL.name,
+    }
+    values.update(kwargs)
+    return values
+
+def make_wave_result(**kwargs):
+    values = {
+        "player_character": enums.Characters.CARLOS.name,
+        "wave_number": 3,
+        "score": 1250.5,
+        "money": 300.25,
+        "kills_count": 42,
+        "headshot_kills_count": 7,
+        "wave_interval_s": 15.0,
+    }
+    values.update(kwargs)
+    return values
+
+def make_data(**kwargs):
+    data = Data(
+        time_ms = 123456.789,
+        net_id = 2,
+        command_id = 5,
+        player_rect = (100, 200, 40, 80),
+        player_last_rect = (98, 201, 40, 80),
+        player_speed = (1.5, -2.0),
+        player_acceleration = (0.25, 0.5),
+        player_health = 87.5,
+        player2_score = 640.0,
+        player_wave_ready = True,
+        player_turning_dir = -1,
+        player_jumping = True,
+        player_running = False,
+        player_falling_ground = True,
+        player_firing = True,
+        player_mouse_pos = (512, -30),
+        player_aim_angle = 135.25,
+        wave_results = kwargs.pop("wave_results", [make_wave_result()]),
+    )
+    data.enemies = kwargs.pop("enemies", [make_enemy(i) for i in range(1, 6)])
+    data.bullets = kwargs.pop("bullets", [make_bullet(i) for i in range(1, 4)])
+    return data
+
+def round_trip(data: Data, sender: NetSession = None, receiver: NetSession = None):
+    _received = Data()
+    _loaded = _received._load_buffer(data._get_buffer(sender or NetSession()), receiver or NetSession())
+    return _loaded, _received
+
+def by_id(items: list[dict]):
+    return {item["id"]: item for item in items}
+
+class CodecTests(unittest.TestCase):
+    def test_records_round_trip(self):
+        for codec, values in ((network_data._enemy_codec, make_enemy(7)), (network_data._bullet_codec, make_bullet(7)), (network_data._wave_result_codec, make_wave_result())):
+            with self.subTest(schema = codec.keys):
+                _buffer = codec.pack(values)
+                self.assertEqual(len(_buffer), codec.size)
+                self.assertEqual(codec.unpack_from(_buffer), values)
+
+    def test_every_enum_id(self):
+        for codec, key, enum_type, make in (
+            (network_data._enemy_codec, "enemy_name", enums.Enemies, make_enemy),
+            (network_data._bullet_codec, "bullet_type", enums.BulletType, make_bullet),
+            (network_data._wave_result_codec, "player_character", enums.Characters, lambda id: make_wave_result()),
+        ):
+            for member in enum_type:
+                with self.subTest(member = member):
+                    # the game sends the names, but the members themselves are accepted too
+                    self.assertEqual(codec.unpack_from(codec.pack(make(1) | {key: member.name}))[key], member.name)
+                    self.assertEqual(codec.unpack_from(codec.pack(make(1) | {key: member}))[key], member.name)
+
+    def test_name_at_the_limit(self):
+        _codec = network_data._enemy_codec
+        _name = "z" * 15
+        self.assertEqual(_codec.unpack_from(_codec.pack(make_enemy(1, name = _name)))["name"], _name)
+        # multi-byte characters count by their encoded size
+        _name = "zombie_éabcdef"
+        self.assertEqual(len(_name.encode("utf-8")), 15)
+        self.assertEqual(_codec.unpack_from(_codec.pack(make_enemy(1, name = _name)))["name"], _name)
+
+    def test_name_over_the_limit(self):
+        _codec = network_data._enemy_codec
+        with self.assertRaises(ValueError):
+            _codec.pack(make_enemy(1, name = "z" * 16))
+        with self.assertRaises(ValueError):
+            _codec.pack_fields(make_enemy(1, name = "zombie_ééééé"), _codec.full_mask)
+
+    def test_changed_fields(self):
+        _codec = network_data._enemy_codec
+        _baseline = make_enemy(1)
+        _values = make_enemy(1, health = 50.0, dying = True)
+        _mask = _codec.changed_mask(_values, _baseline)
+        self.assertEqual(_mask, (1 << _codec.keys.index("health")) | (1 << _codec.keys.index("dying")))
+
+        _into = dict(_baseline)
+        _buffer = _codec.pack_fields(_values, _mask)
+        self.assertEqual(_codec.unpack_fields(_buffer, 0, _mask, _into), len(_buffer))
+        self.assertEqual(_into, _values)
+
+class PacketTests(unittest.TestCase):
+    def test_player_round_trip(self):
+        _data = make_data()
+        _loaded, _received = round_trip(_data)
+        self.assertTrue(_loaded)
+        for key in network_data._player_codec.keys:
+            _expected = getattr(_data, key)
+            with self.subTest(key = key):
+                if type(_expected) == tuple:
+                    self.assertEqual(getattr(_received, key), _expected)
+                elif type(_expected) == float:
+                    self.assertAlmostEqual(getattr(_received, key), _expected, places = 3)
+                else:
+                    self.assertEqual(getattr(_received, key), _expected)
+
+    def test_entities_round_trip(self):
+        _data = make_data()
+        _loaded, _received = round_trip(_data)
+        self.assertTrue(_loaded)
+        self.assertEqual(by_id(_received.enemies), by_id(_data.enemies))
+        self.assertEqual(by_id(_received.bullets), by_id(_data.bullets))
+        self.assertEqual(_received.wave_results, _data.wave_results)
+
+    def test_empty_lists(self):
+        _loaded, _received = round_trip(make_data(enemies = [], bullets = [], wave_results = []))
+        self.assertTrue(_loaded)
+        self.assertEqual((_received.enemies, _received.bullets, _received.wave_results), ([], [], []))
+
+    def test_deltas_against_acked_snapshot(self):
+        _host, _guest = NetSession(), NetSession()
+        _data = make_data()
+        self.assertTrue(Data()._load_buffer(_data._get_buffer(_host), _guest))
+        # the guest acknowledges the first packet
+        Data()._load_buffer(Data()._get_buffer(_guest), _host)
+
+        _data.enemies = [make_enemy(1, health = 10.0)] + [make_enemy(i) for i in range(3, 7)]
+        _data.bullets = []
+        _buffer = _data._get_buffer(_host)
+        self.assertLess(len(_buffer), len(make_data()._get_buffer(NetSession())))
+
+        _received = Data()
+        self.assertTrue(_received._load_buffer(_buffer, _guest))
+        self.assertEqual(by_id(_received.enemies), by_id(_data.enemies))
+        self.assertEqual(_received.bullets, [])
+
+    def test_out_of_order_is_dropped(self):
+        _host, _guest = NetSession(), NetSession()
+        _first = make_data()._get_buffer(_host)
+        _second = make_data()._get_buffer(_host)
+        self.assertTrue(Data()._load_buffer(_second, _guest))
+        self.assertFalse(Data()._load_buffer(_first, _guest))
+
+    def test_truncated_packets_are_dropped(self):
+        _buffer = make_data()._get_buffer(NetSession())
+        _guest = NetSession()
+        for length in range(len(_buffer)):
+            with self.subTest(length = length):
+                self.assertFalse(Data()._load_buffer(_buffer[:length], _guest))
+                self.assertEqual(_guest.remote_sequence, 0)
+        self.assertTrue(Data()._load_buffer(_buffer, _guest))
+        self.assertEqual(_guest.remote_sequence, 1)
+
+    def test_bad_magic_or_version_is_dropped(self):
+        _buffer = make_data()._get_buffer(NetSession())
+        _bad_magic = b'XX' + _buffer[2:]
+        _bad_version = _buffer[:2] + struct.pack('<B', (PROTOCOL_VERSION + 1) % 256) + _buffer[3:]
+        _guest = NetSession()
+        self.assertFalse(Data()._load_buffer(_bad_magic, _guest))
+        self.assertFalse(Data()._load_buffer(_bad_version, _guest))
+        self.assertFalse(Data()._load_buffer(b'', _guest))
+        self.assertEqual(_guest.remote_sequence, 0)
+
+    def test_unknown_enum_id_is_dropped(self):
+        _buffer = bytearray(make_data()._get_buffer(NetSession()))
+        _codec = network_data._wave_result_codec
+        # the enum id of the wave result is the first byte of the last record
+        _buffer[len(_buffer) - _codec.size] = 255
+        self.assertFalse(Data()._load_buffer(bytes(_buffer), NetSession()))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import csv, os, tempfile, unittest
+
+from domain.services import profiler
+
+class ProfilerTests(unittest.TestCase):
+    def setUp(self):
+        if profiler.enabled:
+            profiler.toggle()
+
+    def tearDown(self):
+        if profiler.enabled:
+            profiler.toggle()
+
+    def run_frame(self, *phases: str):
+        profiler.begin_frame()
+        for name in phases:
+            profiler.lap(name)
+        profiler.end_frame()
+
+    def test_frame_toggled_on_is_skipped(self):
+        # F3 is handled after `begin_frame` already returned for the frame
+        profiler.begin_frame()
+        profiler.toggle()
+        profiler.lap("update")
+        profiler.end_frame()
+        self.assertEqual(profiler.stats("frame"), (0, 0, 0))
+        self.assertEqual(profiler.stats("update"), (0, 0, 0))
+
+        self.run_frame("update")
+        self.assertLess(profiler.stats("frame")[0], 1000)
+
+    def test_csv_has_phases_that_start_later(self):
+        _path = os.path.join(tempfile.mkdtemp(), "profile.csv")
+        profiler.toggle()
+        profiler.start_csv(_path)
+        self.run_frame("update")
+        self.run_frame("update", "game")
+        profiler.stop_csv()
+
+        with open(_path, newline = "") as f:
+            _rows = list(csv.DictReader(f))
+        self.assertEqual(len(_rows), 2)
+        self.assertEqual(_rows[0]["game"], "")
+        self.assertNotEqual(_rows[1]["game"], "")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import random, unittest
+import pygame
+
+from domain.models.spatial_hash import SpatialHashGroup
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, rect: pygame.Rect, radius: float = None):
+        super().__init__()
+        self.rect = rect
+        if radius != None:
+            self.radius = radius
+
+def random_box(rand: random.Random, map_width: int = 3000):
+    _rect = pygame.Rect(rand.randint(-200, map_width), rand.randint(0, 600), rand.randint(1, 400), rand.randint(1, 200))
+    # some sprites reach far beyond their rect, like the explosions, and some have no radius at all
+    _radius = rand.choice([None, rand.uniform(1, 50), rand.uniform(100, 600)])
+    return Box(_rect, _radius)
+
+class SpatialHashGroupTests(unittest.TestCase):
+    COLLIDED = [None, pygame.sprite.collide_rect, pygame.sprite.collide_circle, pygame.sprite.collide_circle_ratio(0.5)]
+
+    def assert_same_as_brute_force(self, group: SpatialHashGroup, queries: list[Box]):
+        for collided in self.COLLIDED:
+            for query in queries:
+                _expected = set(pygame.sprite.spritecollide(query, group, False, collided))
+                self.assertEqual(set(group.spritecollide(query, collided)), _expected, msg = f'{collided} {query.rect}')
+
+    def test_random_sprites(self):
+        for seed in range(20):
+            _rand = random.Random(seed)
+            _group = SpatialHashGroup(*[random_box(_rand) for _ in range(150)], cell_size = _rand.choice([32, 128, 512]))
+            self.assert_same_as_brute_force(_group, [random_box(_rand) for _ in range(100)])
+
+    def test_moved_sprites_after_rebuild(self):
+        _rand = random.Random(1)
+        _sprites = [random_box(_rand) for _ in range(150)]
+        _group = SpatialHashGroup(*_sprites)
+        for _ in range(5):
+            for s in _sprites:
+                s.rect.x += _rand.randint(-300, 300)
+            _group.rebuild()
+            self.assert_same_as_brute_force(_group, [random_box(_rand) for _ in range(50)])
+
+    def test_added_and_removed_sprites(self):
+        _rand = random.Random(2)
+        _sprites = [random_box(_rand) for _ in range(150)]
+        _group = SpatialHashGroup(*_sprites[:100])
+        _group.remove(*_sprites[:50])
+        _group.add(*_sprites[100:])
+        self.assertEqual(len(_group), 100)
+        self.assert_same_as_brute_force(_group, [random_box(_rand) for _ in range(50)])
+
+    def test_killed_sprite_is_not_returned(self):
+        _box = Box(pygame.Rect(0, 0, 10, 10))
+        _group = SpatialHashGroup(_box)
+        _box.kill()
+        self.assertEqual(_group.spritecollide(Box(pygame.Rect(0, 0, 10, 10))), [])
+
+if __name__ == "__main__":
+    unittest.main()